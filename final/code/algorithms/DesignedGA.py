@@ -1,4 +1,7 @@
 from .algorithm_interface import Algorithm
+from . import bitset
+from .mutation import mutate_packed
+from .islands import run_islands
 import ioh 
 import numpy as np
 
@@ -11,128 +14,121 @@ class DesignedGA(Algorithm):
     The GA follows the generic framework involving uniform crossover, mutation, and a parent population 
     of at least 10 individuals. 
     '''
-    def __init__(self, budget: int, population_size: int = 20, mutation_rate: float = 0.01):
+    def __init__(self, budget: int, population_size: int = 20, mutation_rate: float = 0.01,
+                 islands: int = 1, topology: str = "ring", migration_interval: int = 5, migrants: int = 2):
+        if population_size % 2 != 0:
+            raise ValueError(f"Invalid population size {population_size}: it must be even (crossover works on pairs)")
         super().__init__(budget, name="Designed Genetic Algorithm", algorithm_info="A simple genetic algorithm with uniform crossover, mutation and a population of at least 10 individuals.")
         self.population_size = max(population_size, 10)  # Ensure at least 10 individuals
         self.budget = budget 
         self.mutation_rate = mutation_rate
+        # island model (see islands.py): with islands > 1, every island evolves its own population of
+        # population_size in a separate process and sends its best `migrants` individuals to its
+        # neighbours in the topology ("ring", "torus" or "complete") every migration_interval generations
+        self.islands = islands
+        self.topology = topology
+        self.migration_interval = migration_interval
+        self.migrants = migrants
+        self._island_evaluations = 0
+
+    @property
+    def run_attributes(self) -> tuple[str, ...]:
+        # an island run logs only its improvements, so its length is logged with the run (see islands.py)
+        return ("island_evaluations",) if self.islands > 1 else ()
+
+    @property
+    def island_evaluations(self) -> int:
+        """ The evaluations of all islands in the last island run (the logged problem sees only the improvements). """
+        return self._island_evaluations
 
     def tournament_select(self, func, pop: np.ndarray, sub_size = 8) -> np.ndarray:
         '''
-        Helper function to perform tournament selection, given a population of
+        Helper function to perform tournament selection, given a (packed) population of
         individuals, then return p_size parents. 
         '''
 
-        parent_pop = np.zeros(len(pop), dtype=np.ndarray)
+        # Randomly pick a subset of individuals for every tournament (without replacement within a tournament)
+        subsets = np.argsort(self.rng.random((len(pop), len(pop))), axis=1)[:, :sub_size]
 
-        for i in range(len(pop)):
-            # Randomly pick subset of individuals
-            subset = np.random.choice(pop, size=sub_size, replace=False) 
-            
-            # Evaluate fitness of the subset
-            sub_fitnesses = [func(ind.tolist()) for ind in subset]
-            best_idx = np.argmax(sub_fitnesses)
-            parent_pop[i] = subset[best_idx]
+        # Evaluate fitness of all subsets in one batch and keep the winner of each tournament
+        sub_fitnesses = self.evaluate_packed(func, pop[subsets.ravel()]).reshape(subsets.shape)
+        best_idx = subsets[np.arange(len(pop)), np.argmax(sub_fitnesses, axis=1)]
 
-        return parent_pop
+        return pop[best_idx]
 
     def uniform_crossover(self, func, pop: np.ndarray, n) -> np.ndarray: 
         '''
         Helper function to perform uniform crossover on each consecutive pair of a
-        given population, returning a population where 
+        given (packed) population, returning a population where 
         parents are replaced by offspring. 
         '''
 
-        # Initialise population of offspring and loop counter
-        crsd_pop = np.zeros(len(pop), dtype = np.ndarray)
-        i = 0
+        # Initialise population of offspring
+        crsd_pop = np.zeros_like(pop)
 
-        # Loop through each pair in the given parent population 
-        while i < len(pop) - 1: 
+        # Randomly pick each gene of the first offspring from each parent pair (masked select)
+        crsd_pop[0:len(pop) - 1:2] = bitset.uniform_crossover(pop[0:len(pop) - 1:2], pop[1::2], n, self.rng)
 
-            # Initialise pair of offsprings 
-            child1 = np.zeros(n, dtype = int)
-            child2 = np.zeros(n, dtype = int)
-
-            # Loop through each element of the parents
-            for j in range(n):
-                # Randomly pick each gene of the first offspring from parent pair 
-                child1[j] = np.random.choice([pop[i][j], pop[i + 1][j]])
-
-                # Construct second offspring as the inverse of the first 
-                if child1[j] == 0: 
-                    child2[j] = 1
-                else: 
-                    child2[j] = 0
-
-            # Add children to population of offspring 
-            crsd_pop[i] = child1 
-            crsd_pop[i + 1] = child2 
-
-            # Increment counter
-            i += 2
+        # Construct second offspring as the inverse of the first 
+        crsd_pop[1::2] = bitset.complement(crsd_pop[0:len(pop) - 1:2], n)
 
         return crsd_pop 
 
     def mutate(self, mutation_rate, pop: np.ndarray, n) -> np.ndarray:
         '''
-        Helper function to perform bit mutation on each individual in a population, where 
-        the mutation parameter determines chance of mutating each entire individual. 
+        Helper function to perform bit mutation on each individual in a (packed) population,
+        where each bit is flipped with probability mutation_rate. Only the flipped positions
+        are drawn (geometric skipping) and XORed into the packed words. 
         The mutated population is returned. 
         '''
 
-        mutated = pop.copy()
-        for i in range(len(pop)):
-            for j in range(n):
-                if np.random.rand() < mutation_rate:
-                    mutated[i][j] = 1 - mutated[i][j]
-        return mutated
+        return mutate_packed(pop, n, mutation_rate, self.rng)
 
     def __call__(self, func: ioh.problem.PBO):
 
         n = func.meta_data.n_variables
 
-        # Assure population size is even 
-        if (self.population_size % 2 != 0 or self.population_size < 1): 
-            print("Invalid population size. Must be even and non-zero")
-            return 
-
-        # Get optimum of the given problem 
-        if func.meta_data.problem_id == 18 and n == 32: # for a known problem instance
-            optimum = 8
-        else:
-            optimum = func.optimum.y 
+        # Stop early once the known optimum of the given problem is found (see termination.py)
+        self.start_run(func)
 
-        # print ("Optimum: ", optimum)
+        # Island model: the populations evolve in worker processes, reported here as one run
+        if self.islands > 1:
+            run_islands(self, func)
+            return
 
         # An independent run for each algorithm on each problem #
         
-        # Randomly initialise population of self.population_size individuals
-        pop = np.zeros(self.population_size, dtype = np.ndarray)
-        for i in range(self.population_size):
-            pop[i] = np.random.randint(2, size = n)
+        # Randomly initialise population of self.population_size individuals, stored as packed bitstrings
+        with self.phase("construct"):
+            pop = bitset.random_bits(self.population_size, n, self.rng)
 
         # Loop of function evaluations: 
-        while func.state.evaluations < self.budget:
+        while not self.should_stop(func):
+            pop = self.generation(func, pop, n)
 
-            # Evaluate population for its optimum (i.e., the highest fitness/value of an individual in the population)
-            fitnesses = [func(ind.tolist()) for ind in pop]
-            best_idx = np.argmax(fitnesses)
-            best_idx2 = np.argmax(fitnesses.pop(best_idx))
+    def generation(self, func: ioh.problem.PBO, pop: np.ndarray, n: int) -> np.ndarray:
+        '''
+        One generation of the GA on a (packed) population: evaluation, tournament selection with
+        elitism, uniform crossover and mutation. The next population is returned.
+        '''
 
-            # Define new population of parents by roulette wheel selection 
-            parent_pop = self.tournament_select(func, pop)
+        # Evaluate population for its optimum (i.e., the highest fitness/value of an individual in the population)
+        fitnesses = self.evaluate_packed(func, pop)
+        best_idx, best_idx2 = np.argsort(-fitnesses, kind="stable")[:2] # the two best individuals (first on ties)
+        elites = pop[[best_idx, best_idx2]]
 
-            # Assure elitism after selection for the next generation
-            pop[0] = pop[best_idx]
-            pop[1] = pop[best_idx2]
+        # Define new population of parents by roulette wheel selection 
+        with self.phase("select"):
+            parent_pop = self.tournament_select(func, pop)
 
-            # Perform uniform crossover on each consecutive pair in the new parent population
+        # Perform uniform crossover on each consecutive pair in the new parent population
+        with self.phase("crossover"):
             offspring_pop = self.uniform_crossover(func, parent_pop, n)
 
-            # Mutate the resulting offspring by some probability 1.5/self.population_size
+        # Mutate the resulting offspring by some probability 1.5/self.population_size
+        with self.phase("mutate"):
             m_offspring_pop = self.mutate(self.mutation_rate, offspring_pop, n)
-            pop = m_offspring_pop # Redefine population
 
-
-        
+        # Assure elitism: the two best individuals of this generation survive unchanged into the next one
+        m_offspring_pop[:2] = elites
+        return m_offspring_pop # Redefine population
@@ -1,6 +1,8 @@
 import ioh
 import numpy as np
 from .algorithm_interface import Algorithm
+from .local_search import LocalSearch
+from .colony import init_pheromone, construct_solutions, update_pheromone
 
 class MaxMinAS(Algorithm):
     """
@@ -12,117 +14,58 @@ class MaxMinAS(Algorithm):
                  algorithm_info: str = "Max-Min Ant System Algorithm",
                  number_of_ants: int = 10, # at least 10 ants
                  C: float = 1.0, # pheromone deposit ,
-                 evaporate_rate: float = 1 # pheromone evaporation rate (rho)
+                 evaporate_rate: float = 1, # pheromone evaporation rate (rho)
+                 local_search: LocalSearch | None = None # local search engine (default: best improvement in the order 0..n-1)
                  ):
         super().__init__(budget, name, algorithm_info)
         self.number_of_ants = number_of_ants
         self.C = C
         self.evaporation_rate = evaporate_rate
+        self.local_search = local_search or LocalSearch()
 
         
-    def _local_search(self, solution, problem: ioh.problem.PBO) -> tuple[np.ndarray, float]:
-        """
-        Perform a greedy local search on the given solution.
-        
-        Args:
-            solution (np.ndarray): The current solution to be improved.
-        
-        Returns:
-            tuple: A tuple containing the improved solution and its fitness.
-        """
-        n = len(solution)
-        pivot_solution = solution.copy()
-        pivot_fitness = problem(pivot_solution.tolist())
-
-        while problem.state.evaluations < self.budget:
-            max_neighbor_fitness = pivot_fitness
-            best_neighbor = pivot_solution.copy()
-            improve = False
-
-            # check all n neighbors 
-            for i in range(n):
-                if problem.state.evaluations >= self.budget: # this check is to ensure we do not exceed the budget
-                    break
-                neighbor = pivot_solution.copy()
-                neighbor[i] = 1 - neighbor[i]  # flip the i-th bit
-
-                neighbor_fitness = problem(neighbor.tolist())
-                if neighbor_fitness > max_neighbor_fitness:
-                    max_neighbor_fitness = neighbor_fitness
-                    best_neighbor = neighbor
-                    improve = True
-
-            # if a striclty better neighbor is found, move to that neighbor
-            if improve and max_neighbor_fitness > pivot_fitness:
-                pivot_solution = best_neighbor
-                pivot_fitness = max_neighbor_fitness
-            else:
-                break # local optima found
-        return pivot_solution, pivot_fitness
-
     def __call__(self, problem: ioh.problem.PBO) -> None:
         # Implement the ACO algorithm logic here
         n = problem.meta_data.n_variables
+        self.start_run(problem)
 
         ### initialise setup
-        # use a common MMAS heeuristic for phermone limits 
-        tau_max = 1 / self.evaporation_rate 
-        tau_min = tau_max / (2 * n)
-
-        # pheromone matrix (n x 2), initialise to tau_max to encourage exploration
-        tau = np.full((n,2), tau_max, dtype=float)
+        # pheromone matrix (n x 2) and MMAS pheromone limits
+        tau, tau_min, tau_max = init_pheromone(n, self.evaporation_rate)
 
         # global best solution initialisation
-        global_best_solution = np.random.randint(0, 2, size=n)
-        global_best_fitness = problem(global_best_solution.tolist())
-
-
-        delta_tau = -np.inf
+        global_best_solution = self.rng.integers(0, 2, size=n)
+        global_best_fitness = self.evaluate_batch(problem, global_best_solution)[0]
         
         
         ### main loop
-        while problem.state.evaluations < self.budget:
-            for _ in range(self.number_of_ants):
-                # solution construction
-                solution = np.zeros(n, dtype=int)
+        while not self.should_stop(problem):
+            # probabilistic construction of all ants at once
+            with self.phase("construct"):
+                ant_solutions = construct_solutions(tau, self.number_of_ants, self.rng)
+            evaporations = 0
 
-                # probabiltic construction
-                for i in range(n):
-                    if problem.state.evaluations >= self.budget:
-                        break
-                    # calculate probabilities for bit 0 and 1
-                    sum_tau = tau[i,0] + tau[i,1]
-                    p = tau[i,1] / sum_tau  # calcualte probability of bit being 1
-
-                    # probabilitic selection
-                    if np.random.rand() < p:
-                        solution[i] = 1
-                    
+            for solution in ant_solutions:
                 # evaluate and apply local search
-                solution_vec, solution_fitness = self._local_search(solution, problem)
+                with self.phase("local_search"):
+                    solution_vec, solution_fitness = self.local_search(self, problem, solution)
 
                 # update global best if needed
                 if solution_fitness > global_best_fitness:
                     global_best_solution = solution_vec.copy()
                     global_best_fitness = solution_fitness
 
-                # check budget, if exceeded break before pheromone update
-                if problem.state.evaluations >= self.budget:
+                # stop (budget used up or termination criterion met) before pheromone update
+                if self.should_stop(problem):
                     break
                 
-                ### pheromone update (only for the current ant)
-                # evaporation
-                tau = (1 - self.evaporation_rate) * tau
-
-                # deposit / reinforment (only on the bits used in the solution)
-                delta_tau = self.C # this sets the amount of new pheromone to add
+                # pheromone evaporation (once for every completed ant)
+                evaporations += 1
 
-            # pheromone deposit for the global best solution found so far
-            for i in range(n):
-                if problem.state.evaluations >= self.budget:
-                    break
-                bit = global_best_solution[i] # 0 or 1
-                tau[i, bit] += delta_tau
+            if self.should_stop(problem):
+                break
 
-            # apply pheromone limits
-            np.clip(tau, tau_min, tau_max, out=tau)
\ No newline at end of file
+            ### pheromone update: evaporation, deposit for the global best solution found so far, limits
+            with self.phase("update"):
+                update_pheromone(tau, global_best_solution, self.C, self.evaporation_rate,
+                                 tau_min, tau_max, evaporations=evaporations)
@@ -1,6 +1,8 @@
 import ioh
 import numpy as np
 from .algorithm_interface import Algorithm
+from .local_search import LocalSearch
+from .colony import init_pheromone, construct_solutions, update_pheromone
 
 class MaxMinASStar(Algorithm):
     """
@@ -12,88 +14,44 @@ class MaxMinASStar(Algorithm):
                  algorithm_info: str = "Max-Min Ant System Star Algorithm",
                  number_of_ants: int = 10,
                  C: float = 1.0,
-                 evaporate_rate: float = 0.01):
+                 evaporate_rate: float = 0.01,
+                 local_search: LocalSearch | None = None): # local search engine (default: best improvement in the order 0..n-1)
         super().__init__(budget, name, algorithm_info)
         self.number_of_ants = number_of_ants
         self.C = C
         self.evaporation_rate = evaporate_rate
-
-    def _local_search(self, solution: np.ndarray, problem: ioh.problem.PBO) -> tuple[np.ndarray, float]:
-        """
-        Perform a greedy local search on the given solution.
-        """
-        n = len(solution)
-        pivot_solution = solution.copy()
-        pivot_fitness = problem(pivot_solution.tolist())
-
-        while problem.state.evaluations < self.budget:
-            max_neighbor_fitness = pivot_fitness
-            best_neighbor = pivot_solution.copy()
-            improve = False
-
-            for i in range(n):
-                if problem.state.evaluations >= self.budget:
-                    break
-                neighbor = pivot_solution.copy()
-                neighbor[i] = 1 - neighbor[i]
-                neighbor_fitness = problem(neighbor.tolist())
-
-                if neighbor_fitness > max_neighbor_fitness:
-                    max_neighbor_fitness = neighbor_fitness
-                    best_neighbor = neighbor
-                    improve = True
-
-            if improve and max_neighbor_fitness > pivot_fitness:
-                pivot_solution = best_neighbor
-                pivot_fitness = max_neighbor_fitness
-            else:
-                break
-
-        return pivot_solution, pivot_fitness
+        self.local_search = local_search or LocalSearch()
 
     def __call__(self, problem: ioh.problem.PBO) -> tuple[np.ndarray, float]:
         n = problem.meta_data.n_variables
+        self.start_run(problem)
 
-        # MMAS* pheromone limits
-        tau_max = 1 / self.evaporation_rate
-        tau_min = tau_max / (2 * n)
-
-        # initialize pheromones
-        tau = np.full((n, 2), tau_max, dtype=float)
+        # MMAS* pheromone limits and initial pheromones
+        tau, tau_min, tau_max = init_pheromone(n, self.evaporation_rate)
 
         # Step 2: construct initial global best
-        global_best_solution = np.random.randint(0, 2, size=n)
-        global_best_fitness = problem(global_best_solution.tolist())
+        global_best_solution = self.rng.integers(0, 2, size=n)
+        global_best_fitness = self.evaluate_batch(problem, global_best_solution)[0]
 
         delta_tau = self.C
 
-        while problem.state.evaluations < self.budget:
+        while not self.should_stop(problem):
             # construct solutions for all ants
-            for _ in range(self.number_of_ants):
-                solution = np.zeros(n, dtype=int)
-                for i in range(n):
-                    if problem.state.evaluations >= self.budget:
-                        break
-                    p = tau[i, 1] / (tau[i, 0] + tau[i, 1])
-                    if np.random.rand() < p:
-                        solution[i] = 1
-
+            with self.phase("construct"):
+                ant_solutions = construct_solutions(tau, self.number_of_ants, self.rng)
+            for solution in ant_solutions:
                 # apply local search
-                solution_vec, solution_fitness = self._local_search(solution, problem)
+                with self.phase("local_search"):
+                    solution_vec, solution_fitness = self.local_search(self, problem, solution)
 
                 # update global best only if strictly better
                 if solution_fitness > global_best_fitness:
                     global_best_solution = solution_vec.copy()
                     global_best_fitness = solution_fitness
 
-                if problem.state.evaluations >= self.budget:
+                if self.should_stop(problem):
                     break
 
-            # update pheromones based on global best
-            tau = (1 - self.evaporation_rate) * tau  # evaporation
-            for i in range(n):
-                bit = global_best_solution[i]
-                tau[i, bit] += delta_tau
-
-            # apply pheromone limits
-            np.clip(tau, tau_min, tau_max, out=tau)
+            # update pheromones based on global best (evaporation, deposit, limits)
+            with self.phase("update"):
+                update_pheromone(tau, global_best_solution, delta_tau, self.evaporation_rate, tau_min, tau_max)
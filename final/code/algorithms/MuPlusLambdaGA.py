@@ -0,0 +1,65 @@
+from .algorithm_interface import Algorithm
+from . import bitset
+from .mutation import mutate_packed
+import ioh
+import numpy as np
+
+
+class MuPlusLambdaGA(Algorithm):
+    """
+    A (μ+λ) GA with truncation selection on a packed population (see `bitset`). Every generation
+    creates λ offspring at once: each is a uniform crossover of two random parents (with probability
+    crossover_rate, else a copy of the first parent) followed by standard bit mutation. Only the
+    offspring are evaluated, in one batch, and the μ best of parents and offspring survive (offspring
+    first on ties, so the population can drift on plateaus).
+
+    Args:
+        population_size: The number of parents μ.
+        offspring_size: The number of offspring λ per generation.
+        crossover_rate: Probability that an offspring is created by crossover.
+        mutation_rate: The bit flip probability of the mutation (None: 1/n).
+        skip_clones: If True, offspring equal to one of their parents are not evaluated (and not charged), they get its fitness.
+    """
+    def __init__(self, budget: int, population_size: int = 10, offspring_size: int = 20,
+                 crossover_rate: float = 0.5, mutation_rate: float | None = None, skip_clones: bool = True):
+        super().__init__(budget, name="(mu+lambda)_GA",
+                         algorithm_info="(mu+lambda) Genetic Algorithm with uniform crossover and truncation selection.")
+        self.population_size = population_size
+        self.offspring_size = offspring_size
+        self.crossover_rate = crossover_rate
+        self.mutation_rate = mutation_rate
+        self.skip_clones = skip_clones
+
+    def __call__(self, problem: ioh.problem.PBO) -> None:
+        n = problem.meta_data.n_variables
+        self.start_run(problem)
+        mu, lam = self.population_size, self.offspring_size
+        p = self.mutation_rate or 1 / n
+        pop = bitset.random_bits(mu, n, self.rng)
+        fitnesses = self.evaluate_packed(problem, pop)
+
+        while not self.should_stop(problem):
+            with self.phase("select"):
+                parents = self.rng.integers(0, mu, size=(lam, 2))
+            with self.phase("crossover"):
+                offspring = pop[parents[:, 0]]
+                crossed = self.rng.random(lam) < self.crossover_rate
+                offspring[crossed] = bitset.uniform_crossover(pop[parents[crossed, 0]], pop[parents[crossed, 1]], n, self.rng)
+            with self.phase("mutate"):
+                offspring = mutate_packed(offspring, n, p, self.rng)
+
+            offspring_fitnesses = np.full(lam, -np.inf)
+            evaluated = np.ones(lam, dtype=bool)
+            if self.skip_clones:
+                for side in (0, 1):
+                    clones = evaluated & (offspring == pop[parents[:, side]]).all(axis=1)
+                    offspring_fitnesses[clones] = fitnesses[parents[clones, side]]
+                    evaluated &= ~clones
+            offspring_fitnesses[evaluated] = self.evaluate_packed(problem, offspring[evaluated])
+
+            # truncation selection of the mu best, offspring before parents on ties
+            with self.phase("update"):
+                merged = np.concatenate((offspring, pop))
+                merged_fitnesses = np.concatenate((offspring_fitnesses, fitnesses))
+                best = np.argsort(-merged_fitnesses, kind="stable")[:mu]
+                pop, fitnesses = merged[best], merged_fitnesses[best]
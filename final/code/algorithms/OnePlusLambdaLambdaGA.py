@@ -0,0 +1,80 @@
+from .algorithm_interface import Algorithm
+import ioh
+import numpy as np
+
+
+class OnePlusLambdaLambdaGA(Algorithm):
+    """
+    The (1+(λ,λ)) GA (Doerr, Doerr and Ebel, 2015). Every iteration creates λ mutants of the
+    parent x that all flip the same number ℓ ~ Bin(n, λ/n) of random bits, and then λ biased
+    uniform crossovers of x with the best mutant x', taking every bit from x' with probability 1/λ.
+    The best of x' and the crossover offspring replaces x if it is at least as good.
+
+    With the self-adjusting λ (one-fifth success rule) λ is divided by F after a strict improvement
+    and multiplied by F^(1/4) otherwise, which gives a linear expected runtime on OneMax.
+    As usual in practice, ℓ is drawn conditioned on ℓ > 0, and crossover offspring equal to x or
+    to x' are not evaluated (their fitness is known).
+
+    Args:
+        lambda_: The (initial) population size λ of both phases.
+        self_adjusting: If True, λ is adapted by the one-fifth success rule; otherwise it stays at lambda_.
+        update_strength: The factor F of the one-fifth success rule.
+        max_lambda: Upper bound of λ (None: n).
+    """
+    def __init__(self, budget: int, lambda_: float = 1.0, self_adjusting: bool = True,
+                 update_strength: float = 1.5, max_lambda: float | None = None):
+        super().__init__(budget, name="(1+(lambda,lambda))_GA",
+                         algorithm_info="(1+(lambda,lambda)) Genetic Algorithm with self-adjusting lambda.")
+        self.lambda_ = lambda_
+        self.self_adjusting = self_adjusting
+        self.update_strength = update_strength
+        self.max_lambda = max_lambda
+
+    def __call__(self, problem: ioh.problem.PBO) -> None:
+        n = problem.meta_data.n_variables
+        self.start_run(problem)
+        max_lambda = self.max_lambda or n
+        lam = self.lambda_
+        x = self.rng.integers(0, 2, size=n).astype(np.uint8)
+        fx = self.evaluate_batch(problem, x)[0]
+
+        while not self.should_stop(problem):
+            k = max(1, int(round(lam)))
+
+            # mutation phase: k mutants flipping the same number ell of distinct random bits each
+            with self.phase("mutate"):
+                ell = 0
+                while ell == 0:
+                    ell = self.rng.binomial(n, min(lam / n, 1.0))
+                flipped = np.argpartition(self.rng.random((k, n)), ell - 1, axis=1)[:, :ell]
+                mutants = np.repeat(x[None, :], k, axis=0)
+                mutants[np.arange(k)[:, None], flipped] ^= 1
+            mutant_fitnesses = self.evaluate_batch(problem, mutants)
+            if self.should_stop(problem):
+                break
+            best = int(np.argmax(mutant_fitnesses))
+            y, fy = mutants[best], mutant_fitnesses[best]
+
+            # crossover phase: every offspring takes each of the ell differing bits from x' with probability 1/lam
+            with self.phase("crossover"):
+                taken = self.rng.random((k, ell)) < 1.0 / lam
+                counts = taken.sum(axis=1)
+                taken = taken[(counts > 0) & (counts < ell)]
+                offspring = np.repeat(x[None, :], len(taken), axis=0)
+                rows, columns = np.nonzero(taken)
+                offspring[rows, flipped[best][columns]] ^= 1
+            if len(offspring):
+                offspring_fitnesses = self.evaluate_batch(problem, offspring)
+                j = int(np.argmax(offspring_fitnesses))
+                if offspring_fitnesses[j] > fy:
+                    y, fy = offspring[j], offspring_fitnesses[j]
+
+            with self.phase("update"):
+                if fy > fx:
+                    if self.self_adjusting:
+                        lam = max(lam / self.update_strength, 1.0)
+                else:
+                    if self.self_adjusting:
+                        lam = min(lam * self.update_strength ** 0.25, max_lambda)
+                if fy >= fx:
+                    x, fx = y.copy(), fy
@@ -1,31 +1,50 @@
 from .algorithm_interface import Algorithm
+from .mutation import power_law_strength, standard_bit_mutation
 import ioh
 import numpy as np
 
 
 class OnePlusOneEA(Algorithm):
-    def __init__(self, budget: int):
-        super().__init__(budget, name="(1+1)_EA", algorithm_info="(1+1) Evolutionary Algorithm.")
+    def __init__(self, budget: int, skip_clones: bool = False, mutation_method: str = "binomial",
+                 mutation: str = "standard", beta: float = 1.5, reuse_strength: bool = False):
+        if mutation not in ("standard", "fast"):
+            raise ValueError(f"Unknown mutation: {mutation}")
+        name, info = "(1+1)_EA", "(1+1) Evolutionary Algorithm."
+        if mutation == "fast":
+            name, info = "(1+1)_fEA", f"(1+1) Evolutionary Algorithm with fast (power-law, beta={beta}) mutation."
+        super().__init__(budget, name=name, algorithm_info=info)
+        self.skip_clones = skip_clones # if True, offspring in which no bit flipped are not evaluated (and not charged)
+        self.mutation_method = mutation_method # "binomial" or "geometric" sampling of the flipped positions
+        # "standard": standard bit mutation with rate 1/n; "fast": rate alpha/n with a strength alpha in
+        # {1, ..., n/2} drawn with P(alpha) ~ alpha^(-beta) every iteration (see mutation.power_law_strength)
+        self.mutation = mutation
+        self.beta = beta
+        self.reuse_strength = reuse_strength # if True ("fast" only), the strength of a strict improvement is used again until it fails
 
     def __call__(self, problem: ioh.problem.PBO):
         # (1+1) EA implementation (not including the external loop for multiple runs)
         n = problem.meta_data.n_variables
+        self.start_run(problem)
         # Initialize a random solution
-        current = np.random.randint(0, 2, size=n)
-        current_fitness = problem(current.tolist())
-        
-        
-        num_evaluations = 0
-        while num_evaluations < self.budget:
-            offspring = current.copy()
-            # flip n bits 
-            for i in range(n):
-                if np.random.rand() < 1/n:
-                    offspring[i] = 1 - offspring[i]
+        current = self.rng.integers(0, 2, size=n)
+        current_fitness = self.evaluate_batch(problem, current)[0]
+        strength = None # the strength kept from the last strict improvement (reuse_strength)
 
-            offspring_fitness = problem(offspring.tolist())
-            num_evaluations += 1
 
+        while not self.should_stop(problem):
+            # standard bit mutation with rate strength/n, only the flipped positions are drawn
+            with self.phase("mutate"):
+                alpha = 1
+                if self.mutation == "fast":
+                    alpha = strength or power_law_strength(n, self.beta, self.rng)
+                offspring, flips = standard_bit_mutation(current, alpha/n, self.rng, self.mutation_method)
+            if flips == 0 and self.skip_clones:
+                continue
+
+            offspring_fitness = self.evaluate_batch(problem, offspring)[0]
+
+            if self.reuse_strength:
+                strength = alpha if offspring_fitness > current_fitness else None
             if offspring_fitness >= current_fitness:
                 current = offspring
-                current_fitness = offspring_fitness
\ No newline at end of file
+                current_fitness = offspring_fitness
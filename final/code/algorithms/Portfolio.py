@@ -0,0 +1,211 @@
+import math
+import threading
+import time
+import ioh
+import numpy as np
+from .algorithm_interface import Algorithm
+from .batch_problems import BatchState
+from .registry import make_algorithm
+from .termination import Termination
+
+
+class _Stopped(Exception):
+    """ Raised in a member's run when the portfolio stops, to end the run at its next evaluation. """
+
+
+class MemberProblem:
+    """
+    The problem as one member of a Portfolio sees it. Evaluations are passed on to the shared problem
+    (and so to its IOH logger) only within the slices of the budget that the portfolio grants to the
+    member, so the member's run is paused in between. The state (evaluations and best so far) is the
+    member's own since its last restart; everything else (meta_data, optimum, ...) is forwarded.
+    """
+    def __init__(self, portfolio: "Portfolio", arm: int, problem: ioh.problem.PBO):
+        self.problem = problem
+        self.portfolio = portfolio
+        self.arm = arm
+        self.state = BatchState(problem.optimum.y)
+
+    def __getattr__(self, name):
+        return getattr(self.problem, name)
+
+    def __call__(self, x):
+        X = np.asarray(x, dtype=np.uint8)
+        fitnesses = self.evaluate(np.atleast_2d(X))
+        return fitnesses.tolist() if X.ndim == 2 else float(fitnesses[0])
+
+    def evaluate(self, X: np.ndarray) -> np.ndarray:
+        """
+        Evaluate the rows of X on the shared problem, in row order, waiting for the next slice
+        of the member whenever the current one is used up.
+        """
+        fitnesses = np.full(len(X), -np.inf)
+        done = 0
+        while done < len(X):
+            m = self.portfolio._acquire(self.arm, len(X) - done)
+            fitnesses[done:done + m] = self.portfolio.evaluate_batch(self.problem, X[done:done + m])
+            self.portfolio._release(self.arm, m, self.problem)
+            done += m
+        self.state.update(X, fitnesses)
+        return fitnesses
+
+
+class Portfolio(Algorithm):
+    """
+    Runs a portfolio of algorithms on the same problem and shares the budget between them in slices,
+    e.g. {"class": "Portfolio", "algorithms": ["RandomizedLocalSearch", "OnePlusOneEA", "MaxMinASStar",
+    {"class": "DesignedGA", "population_size": 44}]} in config.ALGORITHMS.
+
+    Every member runs in its own thread on a MemberProblem, but only one of them evaluates at a time:
+    the member chosen for the next slice (UCB1 on an exponential moving average of its rewards) continues
+    its run for slice_size evaluations and is then paused at its next evaluation. The reward of a slice is
+    the improvement of the shared best fitness per evaluation, relative to the largest recent rate of any
+    slice, so the member that currently improves fastest gets most of the budget. All evaluations go to
+    the given problem one after another, so the IOH logger sees one run. A member whose run stops (after
+    restart_stagnation evaluations of its own without improvement) is restarted from scratch with a new seed.
+    The members stop at the target and the time limit of the portfolio's termination as well (the time
+    limit counted from the start of the portfolio's run); the portfolio's own stagnation criterion applies
+    to the shared best.
+    The evaluations and the number of restarts of every member in the last run are kept in
+    `member_evaluations` and `restarts`.
+
+    Args:
+        algorithms: The members: specifications as in config.ALGORITHMS (or just class names), or Algorithm instances.
+        slice_size: The number of evaluations per slice (None: max(100, 10 n)).
+        exploration: The weight c of the UCB1 bonus c * sqrt(ln(slices) / slices of the member).
+        smoothing: The weight of the newest reward in the moving average of a member (and the decay of the reward scale).
+        restart_stagnation: Restart a member after this many of its evaluations without improving
+            its own best (None: members are never restarted).
+    """
+    def __init__(self, budget: int, algorithms: list, slice_size: int | None = None, exploration: float = 0.2,
+                 smoothing: float = 0.3, restart_stagnation: int | None = 10_000):
+        if not algorithms:
+            raise ValueError("A portfolio needs at least one algorithm")
+        members = [spec if isinstance(spec, Algorithm) else
+                   make_algorithm({"class": spec} if isinstance(spec, str) else spec, budget) for spec in algorithms]
+        super().__init__(budget, name="Portfolio",
+                         algorithm_info=f"Portfolio of {', '.join(member.name for member in members)} "
+                                        f"with bandit budget slices and restarts.")
+        self.algorithms = algorithms
+        self.slice_size = slice_size
+        self.exploration = exploration
+        self.smoothing = smoothing
+        self.restart_stagnation = restart_stagnation
+        self.member_evaluations = [0] * len(members)
+        self.restarts = [0] * len(members)
+        self._members = members
+
+    def __call__(self, problem: ioh.problem.PBO) -> None:
+        n = problem.meta_data.n_variables
+        self.start_run(problem)
+        self._start_time = time.perf_counter()
+        k = len(self._members)
+        slice_size = self.slice_size or max(100, 10 * n)
+        self.member_evaluations, self.restarts = [0] * k, [0] * k
+        values, slices = np.zeros(k), np.zeros(k, dtype=int) # bandit statistics per member
+        scale = 0.0 # the largest recent improvement rate, the rewards are relative to it
+
+        self._lock = threading.Condition()
+        self._turn = None   # the member that may evaluate now
+        self._grant = 0     # evaluations left in its slice
+        self._stopping = False
+        self._error = None
+        self._retired = [False] * k
+        seeds = self.rng.integers(0, 2**31, size=k) # the seeds of the (re)starts of every member
+        threads = [threading.Thread(target=self._run_member, args=(arm, problem, int(seeds[arm])), daemon=True)
+                   for arm in range(k)]
+        for thread in threads:
+            thread.start()
+
+        try:
+            while not self.should_stop(problem):
+                with self.phase("schedule"):
+                    active = [arm for arm in range(k) if not self._retired[arm]]
+                    if not active:
+                        break
+                    untried = [arm for arm in active if slices[arm] == 0]
+                    if untried:
+                        arm = untried[0]
+                    else:
+                        bonus = self.exploration * np.sqrt(math.log(slices.sum()) / slices[active])
+                        arm = active[int(np.argmax(values[active] + bonus))]
+                best, evaluations = problem.state.y_unconstrained_best, problem.state.evaluations
+
+                with self._lock:
+                    if self._retired[arm]:
+                        continue
+                    self._turn, self._grant = arm, min(slice_size, self.budget - evaluations)
+                    self._lock.notify_all()
+                    self._lock.wait_for(lambda: self._turn is None)
+                if self._error is not None:
+                    break
+
+                with self.phase("schedule"):
+                    used = problem.state.evaluations - evaluations
+                    slices[arm] += 1
+                    if used == 0 or best == -math.inf: # nothing to compare the first slice with
+                        continue
+                    rate = (problem.state.y_unconstrained_best - best) / used
+                    scale = max(rate, scale * (1 - self.smoothing))
+                    reward = rate / scale if scale > 0 else 0.0
+                    values[arm] += self.smoothing * (reward - values[arm])
+        finally:
+            with self._lock:
+                self._stopping = True
+                self._lock.notify_all()
+            for thread in threads:
+                thread.join()
+            self._lock = None # (a lock cannot be pickled, e.g. to send the algorithm to a worker process)
+        if self._error is not None:
+            raise self._error
+
+    def _run_member(self, arm: int, problem: ioh.problem.PBO, seed: int) -> None:
+        # the thread of one member: runs it again and again (restarts) until the portfolio stops
+        member = self._members[arm]
+        member.budget = self.budget
+        seeds = np.random.default_rng(seed)
+        try:
+            while True:
+                member.termination = self._member_termination()
+                member.set_seed(int(seeds.integers(0, 2**31)))
+                member_problem = MemberProblem(self, arm, problem)
+                member(member_problem)
+                if member.termination.reason != "stagnation": # e.g. the optimum is found: nothing to restart
+                    break
+                self.restarts[arm] += 1
+        except _Stopped:
+            pass
+        except BaseException as error:
+            self._error = error
+        finally:
+            with self._lock:
+                self._retired[arm] = True
+                if self._error is not None:
+                    self._stopping = True
+                if self._turn == arm:
+                    self._turn = None
+                self._lock.notify_all()
+
+    def _member_termination(self) -> Termination:
+        # the target and the (remaining) time limit of the portfolio, combined with the restart criterion
+        time_limit = self.termination.time_limit
+        if time_limit is not None:
+            time_limit = max(0.0, time_limit - (time.perf_counter() - self._start_time))
+        return Termination(target=self.termination.target, stagnation=self.restart_stagnation, time_limit=time_limit)
+
+    def _acquire(self, arm: int, wanted: int) -> int:
+        # waits until the member has a slice, returns how many of the wanted evaluations it may do now
+        with self._lock:
+            self._lock.wait_for(lambda: self._stopping or (self._turn == arm and self._grant > 0))
+            if self._stopping:
+                raise _Stopped
+            return min(wanted, self._grant)
+
+    def _release(self, arm: int, used: int, problem: ioh.problem.PBO) -> None:
+        # ends the slice once it is used up, or as soon as the portfolio has to stop
+        with self._lock:
+            self._grant -= used
+            self.member_evaluations[arm] += used
+            if self._grant <= 0 or self.should_stop(problem):
+                self._turn = None
+                self._lock.notify_all()
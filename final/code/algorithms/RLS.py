@@ -1,4 +1,5 @@
 from .algorithm_interface import Algorithm
+from .mutation import one_bit_flip
 import ioh
 import numpy as np
 
@@ -8,16 +9,16 @@ class RandomizedLocalSearch(Algorithm):
 
     def __call__(self, problem: ioh.problem.PBO) -> None:
         # Randomised Local Search implementation (not including the external loop for multiple runs)
-        current_sol = np.random.randint(0,2 , size=problem.meta_data.n_variables)
-        current_fitness = problem(current_sol.tolist())
+        self.start_run(problem)
+        current_sol = self.rng.integers(0, 2, size=problem.meta_data.n_variables)
+        current_fitness = self.evaluate_batch(problem, current_sol)[0]
 
 
-        for _ in range(self.budget):
+        while not self.should_stop(problem):
             # create a neighbor by flipping one random bit
-            neighbor = current_sol.copy()
-            flip_index = np.random.randint(0, problem.meta_data.n_variables)
-            neighbor[flip_index] = 1 - neighbor[flip_index]  # Flip a random bit
-            neighbor_fitness = problem(neighbor.tolist())
+            with self.phase("mutate"):
+                neighbor = one_bit_flip(current_sol, self.rng)
+            neighbor_fitness = self.evaluate_batch(problem, neighbor)[0]
             
 
 
@@ -3,14 +3,18 @@ import ioh
 import numpy as np
 
 class RandomSearch(Algorithm):
-    def __init__(self, budget: int):
+    def __init__(self, budget: int, batch_size: int = 1000):
         super().__init__(budget, name="Random Search", algorithm_info="Naïve random search algorithm.")
+        self.batch_size = batch_size # number of random solutions sampled and evaluated per batch
 
 
     def __call__(self, problem: ioh.problem.PBO): # this overrides the __call__ method in the Algorithm class
-        for _ in range(self.budget):
-            X: np.ndarray = np.random.randint(2, size=problem.meta_data.n_variables)
-            problem(X.tolist())
+        # sample and evaluate the random solutions in batches of `self.batch_size` rows
+        self.start_run(problem)
+        while not self.should_stop(problem):
+            with self.phase("construct"):
+                X: np.ndarray = self.rng.integers(2, size=(self.batch_size, problem.meta_data.n_variables), dtype=np.uint8)
+            self.evaluate_batch(problem, X)
 
 
 
@@ -1,11 +1,32 @@
-from .algorithm_interface import Algorithm
-from .OnePlusOneEA import OnePlusOneEA
-from .RLS import RandomizedLocalSearch
-from .RandomSearch import RandomSearch
-from .DesignedGA import DesignedGA
-from .MaxMinAS import MaxMinAS
-from .MaxMinASStar import MaxMinASStar
-from .ACO import ACO
+import importlib
+from .registry import REGISTRY, get_algorithm, make_algorithm
+
+
+# the other public names of the package -> module that defines them
+_EXPORTS = {
+    "Algorithm": "algorithm_interface",
+    "Termination": "termination",
+    "LocalSearch": "local_search",
+    "BatchProblem": "batch_problems",
+}
+
+__all__ = ["REGISTRY", "get_algorithm", "make_algorithm", *REGISTRY, *_EXPORTS]
+
+
+def __getattr__(name: str):
+    # the algorithm modules (and ioh and numpy with them) are only imported on first use
+    if name in REGISTRY:
+        return get_algorithm(name) # (binds the class, not its module, to the package)
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
 
 
 
@@ -16,6 +37,4 @@ from .ACO import ACO
 # It's useful because no matter which file we are in, we can always do:
 # from algorithms import OnePlusOneEA, RandomizedLocalSearch, RandomSearch, DesignedGA
 # instead of worrying about the relative paths ...
-
-
-# Starting point for everyone completing the next exercises: 
\ No newline at end of file
+# The classes are imported lazily (see registry.py): a new algorithm is added to REGISTRY.
@@ -1,15 +1,125 @@
-import ioh 
+import ioh
+import numpy as np
+from . import bitset
+from .profiling import NULL_PHASE, PhaseProfiler
+from .random_source import RandomSource
+from .termination import Termination
 
 
 class Algorithm:
     """
     Base class (interface/abstract class) for all other algorithms classes in the next exercises.
     """
+    run_attributes = () # names of attributes logged with every run (see runner.run_cell), e.g. counts the problem does not hold
+
     def __init__(self, budget: int, name: str = "algorithm_name", algorithm_info: str = "algorithm_info"):
         self.name = name
         self.budget = budget
         self.algorithm_info = algorithm_info
+        self._rng = None
+        self.profiler = None # a PhaseProfiler while profiling is enabled
+        self.termination = Termination() # stopping criteria on top of the budget (by default: the known optimum is found)
+        self._evaluation_hooks = []
+
+    @property
+    def rng(self) -> RandomSource:
+        """
+        The random source of the algorithm. Unless `set_seed` was called it is seeded
+        from fresh entropy when it is first used.
+        """
+        if self._rng is None:
+            self._rng = RandomSource()
+        return self._rng
+
+    def set_seed(self, seed: int | None) -> None:
+        """
+        Give the algorithm a new random stream, e.g. one seeded per (experiment seed, fid, iid, rep) run.
+        """
+        self._rng = RandomSource(seed)
+
+    def start_run(self, problem: ioh.problem.PBO) -> None:
+        """
+        Prepare the stopping criteria for a new run on the given problem; called at the start of `__call__`.
+        """
+        self.termination.start(problem)
+
+    def should_stop(self, problem: ioh.problem.PBO) -> bool:
+        """
+        Whether the main loop should stop: the budget is used up, or one of the criteria of
+        `self.termination` holds (known optimum found, stagnation, wall-clock limit).
+        """
+        state = problem.state
+        return state.evaluations >= self.budget or self.termination.should_stop(state)
+
+    def enable_profiling(self, enabled: bool = True) -> None:
+        """
+        Start (or stop) accounting wall time and call counts per phase of the algorithm in a
+        fresh `PhaseProfiler`. While profiling is disabled the `phase` blocks cost next to nothing.
+        """
+        self.profiler = PhaseProfiler() if enabled else None
+
+    def phase(self, name: str):
+        """
+        Context manager that charges the time spent in its block to the phase `name`
+        (evaluate, construct, local_search, select, crossover, mutate, update).
+        """
+        if self.profiler is None:
+            return NULL_PHASE
+        return self.profiler.phase(name)
+
+    def add_evaluation_hook(self, hook) -> None:
+        """
+        Call `hook(X, fitnesses)` after every batch evaluated through `evaluate_batch` (or `evaluate_packed`),
+        e.g. to record the evaluations of a run. Rows beyond the budget have a fitness of -inf.
+        """
+        self._evaluation_hooks.append(hook)
 
     def __call__(self, problem: ioh.problem.PBO) -> None:
         # This method should be overridden by subclasses to implement specific algorithm logic.
-        raise NotImplementedError(f"This method should be overridden by subclasses's __call__() method with the given problem: {problem}.")
\ No newline at end of file
+        raise NotImplementedError(f"This method should be overridden by subclasses's __call__() method with the given problem: {problem}.")
+
+    def evaluate_batch(self, problem: ioh.problem.PBO, X: np.ndarray) -> np.ndarray:
+        """
+        Evaluate a population of solutions with a single call to the problem.
+
+        Only as many rows as the remaining budget allows are evaluated, in row order, so
+        the IOH logger records exactly what one `problem(x.tolist())` call per row would.
+        Rows beyond the budget are not evaluated and get a fitness of -inf.
+
+        Args:
+            X (np.ndarray): A 2-D (uint8) array with one solution per row.
+
+        Returns:
+            np.ndarray: The fitness of every row of X.
+        """
+        if self.profiler is not None:
+            with self.profiler.phase("evaluate"):
+                fitnesses = self._evaluate_rows(problem, X)
+        else:
+            fitnesses = self._evaluate_rows(problem, X)
+        for hook in self._evaluation_hooks:
+            hook(np.atleast_2d(X), fitnesses)
+        return fitnesses
+
+    def _evaluate_rows(self, problem: ioh.problem.PBO, X: np.ndarray) -> np.ndarray:
+        X = np.atleast_2d(X)
+        fitnesses = np.full(len(X), -np.inf)
+        m = max(0, min(len(X), self.budget - problem.state.evaluations))
+        if m == 0:
+            return fitnesses
+        if hasattr(problem, "evaluate"): # a NumPy backend (BatchProblem, CachedProblem) takes the rows as they are
+            fitnesses[:m] = problem.evaluate(X[:m])
+        elif self.profiler is None:
+            fitnesses[:m] = problem(X[:m].tolist())
+        else:
+            with self.profiler.phase("convert"): # list conversion, reported inside "evaluate"
+                rows = X[:m].tolist()
+            fitnesses[:m] = problem(rows)
+        return fitnesses
+
+    def evaluate_packed(self, problem: ioh.problem.PBO, P: np.ndarray) -> np.ndarray:
+        """
+        Evaluate a population stored as packed bitstrings (see `bitset`), unpacking
+        it to the problem's input format only here. Same budget rules as `evaluate_batch`.
+        """
+        return self.evaluate_batch(problem, bitset.unpack(P, problem.meta_data.n_variables))
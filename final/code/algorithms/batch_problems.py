@@ -0,0 +1,306 @@
+from functools import lru_cache
+import math
+import ioh
+import numpy as np
+
+
+# Constants of the random generator of the original IOHprofiler (Park-Miller "minimal standard"
+# LCG, Schrage's factorization, with a 32-entry shuffle table), which IOH uses for the PBO suite.
+_RAND_M = 2147483647
+_RAND_A = 16807
+_RAND_Q = 127773
+_RAND_R = 2836
+
+
+def _lcg(value: int) -> int:
+    high = value // _RAND_Q
+    value = _RAND_A * (value - high * _RAND_Q) - _RAND_R * high
+    return value + _RAND_M if value < 0 else value
+
+
+@lru_cache(maxsize=256)
+def ioh_uniform(n: int, seed: int) -> np.ndarray:
+    """
+    The n uniform random numbers IOH draws from its PBO random generator for `seed`, i.e. the
+    numbers behind the instance transformations and the NK landscapes.
+
+    Returns:
+        np.ndarray: n numbers in (0, 1) (read only, the result is cached).
+    """
+    table = [0] * 32
+    value = max(abs(seed), 1)
+    for i in range(39, -1, -1):
+        value = _lcg(value)
+        if i < 32:
+            table[i] = value
+    value = table[0]
+    numbers = np.empty(n)
+    for i in range(n):
+        # the next table entry is the LCG successor of the number just drawn
+        key = value // 67108865
+        successor = _lcg(value)
+        value = table[key]
+        table[key] = successor
+        numbers[i] = value / 2.147483647e9 or 1e-99
+    numbers.flags.writeable = False
+    return numbers
+
+
+def onemax(X: np.ndarray) -> np.ndarray:
+    """ F1 OneMax: number of ones. """
+    return X.sum(axis=1, dtype=np.int64).astype(float)
+
+
+def leading_ones(X: np.ndarray) -> np.ndarray:
+    """ F2 LeadingOnes: length of the prefix of ones. """
+    return np.where(X.all(axis=1), X.shape[1], X.argmin(axis=1)).astype(float)
+
+
+def linear(X: np.ndarray) -> np.ndarray:
+    """ F3 Linear: sum of (i + 1) * x_i. """
+    return (X.astype(np.int64) @ np.arange(1, X.shape[1] + 1)).astype(float)
+
+
+def labs(X: np.ndarray) -> np.ndarray:
+    """
+    F18 LABS: n^2 / (2 E) with E the sum of squared aperiodic autocorrelations of the spin
+    sequence s = 2x - 1. All autocorrelations of a row are computed at once with an FFT (they are
+    integers, so rounding the FFT result gives them exactly).
+    """
+    n = X.shape[1]
+    size = 1 << (2 * n - 1).bit_length()
+    spectrum = np.fft.rfft(2.0 * X - 1.0, size, axis=1)
+    C = np.rint(np.fft.irfft(spectrum * spectrum.conj(), size, axis=1)[:, 1:n]).astype(np.int64)
+    return n * n / (2 * np.einsum("ij,ij->i", C, C))
+
+
+@lru_cache(maxsize=8)
+def _queens_lines(N: int) -> np.ndarray:
+    # (N^2, 6N - 2) incidence of the cells with the rows, columns, diagonals and anti-diagonals
+    r, c = np.divmod(np.arange(N * N), N)
+    lines = np.zeros((N * N, 6 * N - 2), dtype=np.int64)
+    for offset, line in zip((0, N, 2 * N, 4 * N - 1), (r, c, r - c + N - 1, r + c)):
+        lines[np.arange(N * N), offset + line] = 1
+    return lines
+
+
+def n_queens(X: np.ndarray) -> np.ndarray:
+    """
+    F23 N-Queens on an N x N board (n = N^2): number of queens minus N times the conflicts on every
+    row, column and diagonal (max(0, queens - 1) per line).
+    """
+    N = math.isqrt(X.shape[1])
+    X = X.astype(np.int64)
+    penalty = np.maximum(0, X @ _queens_lines(N) - 1).sum(axis=1)
+    return (X.sum(axis=1) - N * penalty).astype(float)
+
+
+def concatenated_trap(X: np.ndarray, k: int = 5) -> np.ndarray:
+    """ F24 Concatenated Trap with blocks of k = 5 bits: a block with u ones scores 1 if u == k and (k - 1 - u) / k otherwise. """
+    u = X.reshape(len(X), -1, k).sum(axis=2)
+    values = np.where(u == k, 1.0, (k - 1 - u) / k)
+    return np.cumsum(values, axis=1)[:, -1] # summed block by block, in the order IOH does
+
+
+@lru_cache(maxsize=8)
+def nk_tables(n: int, k: int = 1) -> tuple[np.ndarray, np.ndarray]:
+    """
+    The NK landscape IOH generates for n bits: the k neighbours of every bit and the tables
+    with the 2^(k + 1) contributions of every bit.
+
+    Returns:
+        tuple: The (n, k) neighbours and the (n, 2^(k + 1)) contribution tables.
+    """
+    neighbours = np.empty((n, k), dtype=np.int64)
+    for i in range(n):
+        population = list(range(n))
+        for j, r in enumerate(ioh_uniform(k, k * (i + 1))):
+            neighbours[i, j] = population.pop(int(r * (n - j)))
+    tables = np.array([ioh_uniform(2 ** (k + 1), 2 * k * (i + 1)) for i in range(n)])
+    return neighbours, tables
+
+
+def nk_landscape(X: np.ndarray) -> np.ndarray:
+    """ F25 NK landscape with k = 1: minus the mean contribution of the bits, where bit i contributes table[i][x_i + 2 x_(neighbour of i)]. """
+    n = X.shape[1]
+    neighbours, tables = nk_tables(n)
+    index = X.astype(np.int64)
+    for j in range(neighbours.shape[1]):
+        index += X[:, neighbours[:, j]].astype(np.int64) << (j + 1)
+    contributions = tables[np.arange(n), index]
+    return -np.cumsum(contributions, axis=1)[:, -1] / n # summed bit by bit, in the order IOH does
+
+
+# fid -> raw fitness of a 2-D population (one solution per row) of the untransformed instance
+RAW_FITNESS = {
+    1: onemax,
+    2: leading_ones,
+    3: linear,
+    18: labs,
+    23: n_queens,
+    24: concatenated_trap,
+    25: nk_landscape,
+}
+
+
+def supported(fid: int, n: int) -> bool:
+    """ Whether a NumPy batch evaluator exists for the PBO problem fid of dimension n. """
+    if fid == 18:
+        return n >= 2
+    if fid == 23:
+        return math.isqrt(n) ** 2 == n
+    if fid == 24:
+        return n % 5 == 0 # IOH scores a last incomplete block inconsistently
+    return fid in RAW_FITNESS
+
+
+@lru_cache(maxsize=64)
+def instance_transformation(iid: int, n: int) -> tuple[np.ndarray | None, np.ndarray | None, float, float]:
+    """
+    The transformation IOH applies to instance iid of every PBO problem of dimension n: instances
+    2-50 flip the bits of a random mask, instances 51-100 reorder the bits randomly, and every
+    instance above 1 scales and shifts the fitness, y = scale * f(x') + offset.
+
+    Returns:
+        tuple: The flip mask (or None), the order (x'_i = x_order[i], or None), the scale and the offset.
+    """
+    if iid <= 1:
+        return None, None, 1.0, 0.0
+    mask = order = None
+    if iid <= 50:
+        mask = (ioh_uniform(n, iid) >= 0.5).astype(np.uint8)
+    elif iid <= 100:
+        # n swaps of the first position with a random one
+        order = np.arange(n)
+        for t in (ioh_uniform(n, iid) * n).astype(np.int64):
+            order[0], order[t] = order[t], order[0]
+    r = ioh_uniform(1, iid)[0]
+    return mask, order, r * 4.8 + 0.2, r * 2000 - 1000
+
+
+def batch_fitness(fid: int, iid: int, X: np.ndarray) -> np.ndarray:
+    """
+    The IOH fitness of every row of X on instance iid of the PBO problem fid, without going
+    through IOH (no evaluations are counted and no logger sees them).
+
+    Args:
+        X (np.ndarray): A 2-D array of 0/1 values with one solution per row.
+
+    Returns:
+        np.ndarray: The fitness of every row, equal to what IOH returns for it.
+    """
+    X = np.atleast_2d(np.asarray(X, dtype=np.uint8))
+    mask, order, scale, offset = instance_transformation(iid, X.shape[1])
+    if mask is not None:
+        X = X ^ mask
+    if order is not None:
+        X = X[:, order]
+    y = RAW_FITNESS[fid](X)
+    return y if iid <= 1 else y * scale + offset
+
+
+class BatchState:
+    """
+    The part of an IOH problem state that the algorithms and `Termination` read: the number of
+    evaluations and the best solution so far.
+    """
+    def __init__(self, optimum: float):
+        self._optimum = optimum
+        self.evaluations = 0
+        self.y_unconstrained_best = -math.inf # the best fitness so far (the name IOH uses)
+        self.optimum_found = False
+        self._best_x = None
+
+    @property
+    def current_best(self) -> ioh.iohcpp.IntegerSolution:
+        x = [] if self._best_x is None else self._best_x.tolist()
+        return ioh.iohcpp.IntegerSolution(x, self.y_unconstrained_best)
+
+    def update(self, X: np.ndarray, fitnesses: np.ndarray) -> None:
+        self.evaluations += len(X)
+        if len(X) == 0:
+            return
+        best = int(np.argmax(fitnesses)) # the first of the best rows, as IOH keeps it
+        if fitnesses[best] > self.y_unconstrained_best:
+            self.y_unconstrained_best = float(fitnesses[best])
+            self._best_x = np.array(X[best], dtype=np.uint8)
+            self.optimum_found = self.y_unconstrained_best >= self._optimum
+
+
+class BatchProblem:
+    """
+    A PBO problem evaluated with NumPy instead of IOH, for runs that only need the fitness
+    (screening, tuning, exhaustive studies): a population is scored in one vectorized call and
+    without the conversion to Python lists (single solutions are not faster than with IOH).
+    It can be passed to any algorithm in place of the `ioh.get_problem` problem; the fitness
+    values, `meta_data`, `optimum` and the state the algorithms use are those of the IOH
+    problem, but no IOH logger can be attached.
+    """
+    def __init__(self, fid: int, iid: int, n: int):
+        if not supported(fid, n):
+            raise ValueError(f"No batch evaluator for the PBO problem {fid} with n = {n}")
+        problem = ioh.get_problem(fid, iid, n, ioh.ProblemClass.PBO)
+        self.meta_data = problem.meta_data
+        self.optimum = problem.optimum
+        self.state = BatchState(self.optimum.y)
+
+    def __call__(self, x):
+        X = np.asarray(x, dtype=np.uint8)
+        fitnesses = self.evaluate(np.atleast_2d(X))
+        return fitnesses.tolist() if X.ndim == 2 else float(fitnesses[0])
+
+    def evaluate(self, X: np.ndarray) -> np.ndarray:
+        """ Evaluate (and count) the rows of X, in row order. """
+        fitnesses = batch_fitness(self.meta_data.problem_id, self.meta_data.instance, X)
+        self.state.update(X, fitnesses)
+        return fitnesses
+
+    def reset(self) -> None:
+        self.state = BatchState(self.optimum.y)
+
+
+def get_problem(fid: int, iid: int, n: int) -> BatchProblem | ioh.problem.PBO:
+    """
+    The PBO problem (fid, iid, n) with the NumPy batch backend if it is supported, else the IOH problem.
+    """
+    if supported(fid, n):
+        return BatchProblem(fid, iid, n)
+    return ioh.get_problem(fid, iid, n, ioh.ProblemClass.PBO)
+
+
+def cross_check(fids: list[int], iids: list[int], dims: list[int], samples: int = 200, seed: int = 0) -> list[tuple]:
+    """
+    Compares the batch fitness of random solutions (and of the all-zero and all-one solutions)
+    with the fitness IOH returns for them, bit for bit.
+
+    Returns:
+        list: The (fid, iid, n, mismatching rows) of every combination that does not match.
+    """
+    rng = np.random.default_rng(seed)
+    failures = []
+    for fid in fids:
+        for iid in iids:
+            for n in dims:
+                if not supported(fid, n):
+                    continue
+                X = rng.integers(0, 2, size=(samples, n), dtype=np.uint8)
+                X = np.vstack((np.zeros(n, dtype=np.uint8), np.ones(n, dtype=np.uint8), X))
+                expected = np.array(ioh.get_problem(fid, iid, n, ioh.ProblemClass.PBO)(X.tolist()))
+                wrong = np.flatnonzero(batch_fitness(fid, iid, X).view(np.int64) != expected.view(np.int64))
+                if len(wrong):
+                    failures.append((fid, iid, n, len(wrong)))
+    return failures
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Cross-check the NumPy batch evaluators against IOH.")
+    parser.add_argument("--fids", type=int, nargs="+", default=list(RAW_FITNESS))
+    parser.add_argument("--iids", type=int, nargs="+", default=[1, 2, 3, 50, 51, 52, 100, 101])
+    parser.add_argument("--dims", type=int, nargs="+", default=[2, 5, 16, 25, 49, 50, 64, 100, 256, 625])
+    parser.add_argument("--samples", type=int, default=200)
+    args = parser.parse_args()
+    failures = cross_check(args.fids, args.iids, args.dims, args.samples)
+    for fid, iid, n, wrong in failures:
+        print(f"f{fid} iid {iid} n={n}: {wrong} rows differ from IOH")
+    print("All batch evaluators match IOH." if not failures else f"{len(failures)} combinations differ.")
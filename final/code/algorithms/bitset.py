@@ -0,0 +1,91 @@
+"""Packed-bit genome representation.
+
+A population of `rows` bitstrings of length n is stored as a (rows x words) uint64 array,
+with words = ceil(n / 64), i.e. 64 bits per word instead of one np.int64 per bit. Bit j of a
+row lives in byte j // 8 of the row (most significant bit first, as np.packbits does), and the
+padding bits after the n-th bit are always zero.
+
+Variation operators work word-parallel on the packed rows (mutation as XOR with a random mask,
+uniform crossover as a masked select, Hamming distance as the popcount of an XOR). Rows are only
+unpacked to 0/1 bits when they are evaluated.
+"""
+
+import numpy as np
+
+
+# number of set bits of every byte value
+_POPCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+
+def n_words(n: int) -> int:
+    """ Number of uint64 words needed to store n bits. """
+    return (n + 63) // 64
+
+
+def pack(X: np.ndarray) -> np.ndarray:
+    """
+    Pack 0/1 bitstrings into uint64 words.
+
+    Args:
+        X (np.ndarray): A 1-D bitstring or a 2-D array with one bitstring per row.
+
+    Returns:
+        np.ndarray: A (rows x words) uint64 array.
+    """
+    X = np.atleast_2d(np.asarray(X, dtype=np.uint8))
+    rows, n = X.shape
+    packed = np.zeros((rows, n_words(n) * 8), dtype=np.uint8)
+    packed[:, :(n + 7) // 8] = np.packbits(X, axis=1)
+    return packed.view(np.uint64)
+
+
+def unpack(P: np.ndarray, n: int) -> np.ndarray:
+    """
+    Unpack uint64 words into a (rows x n) uint8 array of 0/1 bits, ready for evaluation.
+    """
+    P = np.atleast_2d(P)
+    return np.unpackbits(np.ascontiguousarray(P).view(np.uint8), axis=1, count=n)
+
+
+def tail_mask(n: int) -> np.ndarray:
+    """ The words of a bitstring with all n bits set (and the padding bits cleared). """
+    return pack(np.ones(n, dtype=np.uint8))[0]
+
+
+def random_bits(rows: int, n: int, rng) -> np.ndarray:
+    """ Uniformly random packed bitstrings of length n, drawn from `rng` (a Generator or RandomSource). """
+    words = np.frombuffer(rng.bytes(rows * n_words(n) * 8), dtype=np.uint64)
+    return words.reshape(rows, n_words(n)) & tail_mask(n)
+
+
+def random_mask(rows: int, n: int, p: float, rng) -> np.ndarray:
+    """ Packed masks in which each of the n bits is set independently with probability p. """
+    if p == 0.5:
+        return random_bits(rows, n, rng)
+    return pack(rng.random((rows, n)) < p)
+
+
+def mutate(P: np.ndarray, n: int, p: float, rng) -> np.ndarray:
+    """ Standard bit mutation: flip every bit independently with probability p (XOR with a random mask). """
+    return P ^ random_mask(len(P), n, p, rng)
+
+
+def uniform_crossover(A: np.ndarray, B: np.ndarray, n: int, rng) -> np.ndarray:
+    """ Uniform crossover: every bit is taken from A or B with probability 1/2 (masked select). """
+    M = random_bits(len(A), n, rng)
+    return (A & ~M) | (B & M)
+
+
+def complement(P: np.ndarray, n: int) -> np.ndarray:
+    """ Flip all n bits of every row. """
+    return ~P & tail_mask(n)
+
+
+def popcount(P: np.ndarray) -> np.ndarray:
+    """ Number of ones of every packed row. """
+    return _POPCOUNT[np.ascontiguousarray(P).view(np.uint8)].sum(axis=-1, dtype=np.int64)
+
+
+def hamming(A: np.ndarray, B: np.ndarray) -> np.ndarray:
+    """ Hamming distance between the packed rows of A and B (row by row, with broadcasting). """
+    return popcount(A ^ B)
@@ -0,0 +1,77 @@
+import numpy as np
+
+
+def init_pheromone(n: int, evaporation_rate: float) -> tuple[np.ndarray, float, float]:
+    """
+    Create the (n x 2) pheromone matrix together with the MMAS pheromone limits.
+
+    Args:
+        n (int): Number of bits of the problem.
+        evaporation_rate (float): Pheromone evaporation rate (rho).
+
+    Returns:
+        tuple: The pheromone matrix initialised to tau_max, tau_min and tau_max.
+    """
+    # use a common MMAS heuristic for pheromone limits
+    tau_max = 1 / evaporation_rate
+    tau_min = tau_max / (2 * n)
+
+    # initialise to tau_max to encourage exploration
+    tau = np.full((n, 2), tau_max, dtype=float)
+    return tau, tau_min, tau_max
+
+
+def construct_solutions(tau: np.ndarray, number_of_ants: int, rng) -> np.ndarray:
+    """
+    Sample the solutions of all ants of one iteration at once.
+
+    The probability of every bit being 1 is computed once from the pheromone
+    matrix, after which all ants are built by a single (ants x n) comparison.
+
+    Args:
+        tau (np.ndarray): The (n x 2) pheromone matrix.
+        number_of_ants (int): Number of solutions to construct.
+        rng: The random source (`np.random.Generator` or `RandomSource`) to sample from.
+
+    Returns:
+        np.ndarray: A (number_of_ants x n) uint8 array with one ant per row.
+    """
+    p = tau[:, 1] / (tau[:, 0] + tau[:, 1])  # probability of each bit being 1
+    return (rng.random((number_of_ants, len(p))) < p).astype(np.uint8)
+
+
+def update_pheromone(tau: np.ndarray,
+                     solutions: np.ndarray,
+                     deposit: float,
+                     evaporation_rate: float,
+                     tau_min: float,
+                     tau_max: float,
+                     evaporations: int = 1) -> np.ndarray:
+    """
+    Evaporate, deposit and clip the pheromone matrix in place.
+
+    Args:
+        tau (np.ndarray): The (n x 2) pheromone matrix.
+        solutions (np.ndarray): A single solution or a (k x n) array of solutions
+            that each receive `deposit` on the bits they use.
+        deposit (float): Amount of pheromone added per solution.
+        evaporation_rate (float): Pheromone evaporation rate (rho).
+        tau_min (float): Lower pheromone limit.
+        tau_max (float): Upper pheromone limit.
+        evaporations (int): Number of evaporation steps to apply before the deposit.
+
+    Returns:
+        np.ndarray: The updated pheromone matrix (same object as `tau`).
+    """
+    # evaporation
+    tau *= (1 - evaporation_rate) ** evaporations
+
+    # deposit / reinforcement on the bits used by the solutions
+    solutions = np.atleast_2d(solutions)
+    ones = solutions.sum(axis=0)
+    tau[:, 1] += deposit * ones
+    tau[:, 0] += deposit * (len(solutions) - ones)
+
+    # apply pheromone limits
+    np.clip(tau, tau_min, tau_max, out=tau)
+    return tau
@@ -0,0 +1,260 @@
+from functools import lru_cache
+import ioh
+import numpy as np
+
+
+class DeltaEvaluator:
+    """
+    Incremental (delta) evaluation of the one-bit-flip neighbourhood of a pivot solution.
+
+    A subclass keeps some per-solution state (e.g. the number of ones, the block sums,
+    the LABS autocorrelations) so that the fitness of every single-bit flip of the pivot
+    can be returned in O(1)-O(n) per neighbour instead of a full evaluation, and so that
+    moving the pivot to one of its neighbours only updates that state.
+    """
+    def __init__(self, n: int):
+        self.n = n
+        self.x = np.zeros(n, dtype=np.uint8)
+        self.fitness = -np.inf
+
+    def reset(self, x: np.ndarray) -> float:
+        """
+        Set the pivot solution and rebuild the state from scratch.
+
+        Args:
+            x (np.ndarray): The new pivot solution.
+
+        Returns:
+            float: The fitness of the pivot.
+        """
+        self.x = np.asarray(x, dtype=np.uint8).copy()
+        self._build()
+        self.fitness = float(self._fitness())
+        return self.fitness
+
+    def flip_fitnesses(self) -> np.ndarray:
+        """
+        Returns:
+            np.ndarray: The fitness of the n neighbours, where entry i is the pivot with bit i flipped.
+        """
+        raise NotImplementedError("This method should be overridden by subclasses.")
+
+    def flip(self, i: int) -> float:
+        """
+        Move the pivot to its neighbour with bit i flipped, updating the state.
+
+        Returns:
+            float: The fitness of the new pivot.
+        """
+        self.fitness = float(self.flip_fitnesses()[i])
+        self.x[i] ^= 1
+        self._build()
+        return self.fitness
+
+    def interactions(self, i: int) -> np.ndarray:
+        """
+        Returns:
+            np.ndarray: The positions whose flip fitness can gain or lose relative to the pivot's fitness
+                when bit i is flipped (e.g. for the don't-look bits of a local search). By default all of them.
+        """
+        return np.arange(self.n)
+
+    def _build(self) -> None:
+        pass
+
+    def _fitness(self) -> float:
+        raise NotImplementedError("This method should be overridden by subclasses.")
+
+
+class OneMaxDelta(DeltaEvaluator):
+    """ F1 OneMax: number of ones. """
+    def _fitness(self) -> float:
+        return self.x.sum()
+
+    def flip_fitnesses(self) -> np.ndarray:
+        return self.fitness + 1.0 - 2.0 * self.x
+
+    def flip(self, i: int) -> float:
+        self.fitness += 1.0 - 2.0 * self.x[i]
+        self.x[i] ^= 1
+        return self.fitness
+
+    def interactions(self, i: int) -> np.ndarray:
+        return np.array([i]) # separable
+
+
+class LinearDelta(DeltaEvaluator):
+    """ F3 Linear: sum of (i + 1) * x_i. """
+    def __init__(self, n: int):
+        super().__init__(n)
+        self.weights = np.arange(1, n + 1, dtype=float)
+
+    def _fitness(self) -> float:
+        return self.weights @ self.x
+
+    def flip_fitnesses(self) -> np.ndarray:
+        return self.fitness + self.weights * (1.0 - 2.0 * self.x)
+
+    def flip(self, i: int) -> float:
+        self.fitness += self.weights[i] * (1.0 - 2.0 * self.x[i])
+        self.x[i] ^= 1
+        return self.fitness
+
+    def interactions(self, i: int) -> np.ndarray:
+        return np.array([i]) # separable
+
+
+class LeadingOnesDelta(DeltaEvaluator):
+    """ F2 LeadingOnes: length of the prefix of ones. """
+    def _build(self) -> None:
+        # run[i] = number of consecutive ones starting at position i (distance to the next zero)
+        positions = np.arange(self.n + 1)
+        zeros = np.where(np.append(self.x, 0) == 0, positions, self.n)
+        self.run = np.minimum.accumulate(zeros[::-1])[::-1] - positions
+
+    def _fitness(self) -> float:
+        return self.run[0]
+
+    def flip_fitnesses(self) -> np.ndarray:
+        lo = int(self.fitness)
+        fitnesses = np.full(self.n, self.fitness)
+        fitnesses[:lo] = np.arange(lo)              # breaking the prefix at i leaves i leading ones
+        if lo < self.n:
+            fitnesses[lo] = lo + 1 + self.run[lo + 1]  # filling the first zero joins the next run of ones
+        return fitnesses
+
+
+class LABSDelta(DeltaEvaluator):
+    """
+    F18 LABS: n^2 / (2 E) with E the sum of squared aperiodic autocorrelations
+    C_k = sum_i s_i s_{i+k} of the spin sequence s = 2x - 1.
+
+    Flipping bit i changes every C_k by -2 s_i (s_{i+k} + s_{i-k}), so all n
+    neighbours are scored in O(n^2) in total instead of O(n^2) each.
+    """
+    def __init__(self, n: int):
+        super().__init__(n)
+        rows = np.arange(n)[:, None]
+        lags = np.arange(1, n)[None, :]
+        # indices into the zero-padded spin sequence for s_{i+k} and s_{i-k}
+        self._right = n + rows + lags
+        self._left = n + rows - lags
+
+    def _build(self) -> None:
+        self.s = 2.0 * self.x - 1.0
+        self.C = np.array([self.s[:self.n - k] @ self.s[k:] for k in range(1, self.n)])
+
+    def _energy_to_fitness(self, E):
+        E = np.asarray(E, dtype=float)
+        with np.errstate(divide="ignore"):
+            return np.where(E > 0, self.n * self.n / (2.0 * E), np.inf)
+
+    def _fitness(self) -> float:
+        return self._energy_to_fitness(self.C @ self.C)
+
+    def _deltas(self) -> np.ndarray:
+        padded = np.concatenate((np.zeros(self.n), self.s, np.zeros(self.n)))
+        return -2.0 * self.s[:, None] * (padded[self._right] + padded[self._left])
+
+    def flip_fitnesses(self) -> np.ndarray:
+        new_C = self.C[None, :] + self._deltas()
+        return self._energy_to_fitness(np.einsum("ij,ij->i", new_C, new_C))
+
+    def flip(self, i: int) -> float:
+        padded = np.concatenate((np.zeros(self.n), self.s, np.zeros(self.n)))
+        self.C += -2.0 * self.s[i] * (padded[self._right[i]] + padded[self._left[i]])
+        self.s[i] = -self.s[i]
+        self.x[i] ^= 1
+        self.fitness = float(self._fitness())
+        return self.fitness
+
+
+class NQueensDelta(DeltaEvaluator):
+    """
+    F23 N-Queens on an N x N board (n = N^2): number of queens minus N times the
+    conflicts on every row, column and diagonal (max(0, queens - 1) per line).
+    """
+    def __init__(self, n: int):
+        super().__init__(n)
+        self.N = int(round(np.sqrt(n)))
+        r, c = np.divmod(np.arange(n), self.N)
+        # line index of every cell for rows, columns, diagonals and anti-diagonals
+        self._lines = (r, c, r - c + self.N - 1, r + c)
+
+    def _build(self) -> None:
+        self.sums = [np.bincount(line, weights=self.x, minlength=2 * self.N - 1) for line in self._lines]
+
+    def _fitness(self) -> float:
+        penalty = sum(np.maximum(0, s - 1).sum() for s in self.sums)
+        return self.x.sum() - self.N * penalty
+
+    def flip_fitnesses(self) -> np.ndarray:
+        d = 1.0 - 2.0 * self.x  # +1 when a queen is placed, -1 when removed
+        delta_penalty = np.zeros(self.n)
+        for s, line in zip(self.sums, self._lines):
+            before = s[line]
+            delta_penalty += np.maximum(0, before + d - 1) - np.maximum(0, before - 1)
+        return self.fitness + d - self.N * delta_penalty
+
+    def interactions(self, i: int) -> np.ndarray:
+        # the cells on one of the lines of cell i
+        return np.flatnonzero(np.any([line == line[i] for line in self._lines], axis=0))
+
+
+class ConcatenatedTrapDelta(DeltaEvaluator):
+    """
+    F24 Concatenated Trap with blocks of k = 5 bits: a block with u ones scores
+    1 if u == k and (k - 1 - u) / k otherwise.
+    """
+    k = 5
+
+    def _build(self) -> None:
+        self.u = self.x.reshape(-1, self.k).sum(axis=1)
+
+    def _values(self, u):
+        return np.where(u == self.k, 1.0, (self.k - 1 - u) / self.k)
+
+    def _fitness(self) -> float:
+        return self._values(self.u).sum()
+
+    def flip_fitnesses(self) -> np.ndarray:
+        u = np.repeat(self.u, self.k)
+        new_u = u + 1 - 2 * self.x.astype(np.int64)
+        return self.fitness + self._values(new_u) - self._values(u)
+
+    def interactions(self, i: int) -> np.ndarray:
+        start = i - i % self.k # the block of bit i
+        return np.arange(start, start + self.k)
+
+
+def get_delta_evaluator(problem: ioh.problem.PBO) -> DeltaEvaluator | None:
+    """
+    Return a delta evaluator matching the given IOH problem, or None when the problem
+    is not supported (unknown fid such as the NK landscapes, or an instance with
+    variable/objective transformations, i.e. iid > 1).
+
+    Evaluators are reused between calls on the same (fid, iid, n); call `reset`
+    before using the returned evaluator.
+    """
+    meta = problem.meta_data
+    return _delta_evaluator(meta.problem_id, meta.instance, meta.n_variables)
+
+
+@lru_cache(maxsize=8)
+def _delta_evaluator(fid: int, iid: int, n: int) -> DeltaEvaluator | None:
+    if iid != 1:
+        return None
+    if fid == 1:
+        return OneMaxDelta(n)
+    if fid == 2:
+        return LeadingOnesDelta(n)
+    if fid == 3:
+        return LinearDelta(n)
+    if fid == 18:
+        return LABSDelta(n)
+    if fid == 23 and int(round(np.sqrt(n))) ** 2 == n:
+        return NQueensDelta(n)
+    if fid == 24 and n % ConcatenatedTrapDelta.k == 0:
+        return ConcatenatedTrapDelta(n)
+    return None
+
@@ -0,0 +1,124 @@
+from collections import OrderedDict
+import ioh
+import numpy as np
+from .algorithm_interface import Algorithm
+from .termination import Termination
+
+
+class CachedProblem:
+    """
+    Fitness memoization layer around an IOH problem.
+
+    Fitness values are cached in an LRU table keyed by the packed bitstring, so solutions
+    that were already evaluated (re-evaluated tournament members, elites, local search
+    pivots, ...) are answered from the table. Everything else (meta_data, state, optimum,
+    reset, ...) is forwarded to the wrapped problem.
+
+    With count_hits=False a cache hit is free: it is neither counted in problem.state.evaluations
+    nor seen by the IOH logger. With count_hits=True every hit is still passed to the problem,
+    so the budget and the logged data are exactly those of a run without the cache, which
+    allows a like-for-like comparison of the hit/miss counters.
+    """
+    def __init__(self, problem: ioh.problem.PBO, max_size: int = 100_000, count_hits: bool = False,
+                 max_consecutive_hits: int = 10_000):
+        self.problem = problem
+        self.max_size = max_size # maximum number of cached fitness values (least recently used are evicted)
+        self.count_hits = count_hits
+        self.max_consecutive_hits = max_consecutive_hits # after this many free hits in a row, hits are charged again
+        self.cache = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self._consecutive_hits = 0
+
+    def __getattr__(self, name):
+        return getattr(self.problem, name)
+
+    def __call__(self, x):
+        X = np.asarray(x, dtype=np.uint8)
+        fitnesses = self.evaluate(np.atleast_2d(X))
+        return fitnesses.tolist() if X.ndim == 2 else float(fitnesses[0])
+
+    def evaluate(self, X: np.ndarray) -> np.ndarray:
+        """
+        Evaluate the rows of X, answering the ones already seen from the cache. The rows that are
+        passed to the problem are sent in one batch, in row order.
+        """
+        keys = [row.tobytes() for row in np.packbits(X, axis=1)]
+        fitnesses = np.empty(len(X))
+        send = []       # rows passed to the problem, in row order
+        first = {}      # key -> row of this batch that evaluates a new bitstring
+        duplicates = [] # rows answered by an earlier row of this batch
+
+        for i, key in enumerate(keys):
+            if key not in self.cache and key not in first:
+                self.misses += 1
+                self._consecutive_hits = 0
+                first[key] = i
+                send.append(i)
+                continue
+
+            self.hits += 1
+            self._consecutive_hits += 1
+            if self.count_hits or self._consecutive_hits > self.max_consecutive_hits:
+                send.append(i) # a charged hit is still passed to the problem (with the same value)
+            elif key in self.cache:
+                self.cache.move_to_end(key)
+                fitnesses[i] = self.cache[key]
+            else:
+                duplicates.append((i, first[key]))
+
+        if send:
+            fitnesses[send] = self.problem(X[send].tolist())
+        for i, j in duplicates:
+            fitnesses[i] = fitnesses[j]
+        for key, i in first.items():
+            self._store(key, fitnesses[i])
+        return fitnesses
+
+    def _store(self, key: bytes, fitness: float) -> None:
+        self.cache[key] = fitness
+        self.cache.move_to_end(key)
+        while len(self.cache) > self.max_size:
+            self.cache.popitem(last=False) # evict the least recently used entry
+
+
+class CachedAlgorithm(Algorithm):
+    """
+    Runs another algorithm on a CachedProblem around every problem it is given, e.g.
+    {"class": "CachedAlgorithm", "algorithm": {"class": "DesignedGA"}, "count_hits": False} in config.ALGORITHMS.
+    The hit/miss counters of the last run are kept in `hits` and `misses`. The seed, the profiling
+    and the stopping criteria (`termination`) are those of the wrapped algorithm.
+    """
+    def __init__(self, algorithm: Algorithm, max_size: int = 100_000, count_hits: bool = False):
+        cache_info = f"fitness cache: max_size={max_size}, count_hits={count_hits}"
+        super().__init__(algorithm.budget, name=algorithm.name,
+                         algorithm_info=f"{algorithm.algorithm_info} ({cache_info})")
+        self.algorithm = algorithm
+        self.max_size = max_size
+        self.count_hits = count_hits
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def termination(self) -> Termination:
+        """ The stopping criteria of the wrapped algorithm, which runs the main loop. """
+        return self.algorithm.termination
+
+    @termination.setter
+    def termination(self, termination: Termination) -> None:
+        if "algorithm" in vars(self): # (not the default of Algorithm.__init__, the wrapped one keeps its own)
+            self.algorithm.termination = termination
+
+    def set_seed(self, seed: int | None) -> None:
+        self.algorithm.set_seed(seed)
+
+    def enable_profiling(self, enabled: bool = True) -> None:
+        self.algorithm.enable_profiling(enabled)
+        self.profiler = self.algorithm.profiler
+
+    def __call__(self, problem: ioh.problem.PBO) -> None:
+        cached_problem = CachedProblem(problem, self.max_size, self.count_hits)
+        try:
+            self.algorithm(cached_problem)
+        finally:
+            self.hits, self.misses = cached_problem.hits, cached_problem.misses
@@ -0,0 +1,270 @@
+import math
+import multiprocessing
+import queue
+from multiprocessing import shared_memory
+from typing import NamedTuple
+
+import ioh
+import numpy as np
+from . import batch_problems, bitset
+from .termination import Termination
+
+
+def neighbours(topology: str, k: int) -> list[list[int]]:
+    """
+    The islands every island receives migrants from: "ring" (the previous island), "torus"
+    (the 4 neighbours on the most square r x c grid with r * c = k) or "complete" (all others).
+    """
+    if topology == "ring":
+        return [[(i - 1) % k] for i in range(k)]
+    if topology == "complete":
+        return [[j for j in range(k) if j != i] for i in range(k)]
+    if topology == "torus":
+        rows = max(r for r in range(1, math.isqrt(k) + 1) if k % r == 0)
+        cols = k // rows
+        result = []
+        for i in range(k):
+            r, c = divmod(i, cols)
+            around = {((r - 1) % rows) * cols + c, ((r + 1) % rows) * cols + c,
+                      r * cols + (c - 1) % cols, r * cols + (c + 1) % cols}
+            result.append(sorted(around - {i}))
+        return result
+    raise ValueError(f"Unknown island topology: {topology}")
+
+
+def split_budget(budget: int, k: int) -> list[int]:
+    """ Splits a budget exactly over k islands (the first budget % k islands get one evaluation more). """
+    return [budget // k + (i < budget % k) for i in range(k)]
+
+
+class _Exchange:
+    """
+    Shared memory through which the islands exchange migrants: per island its best `migrants`
+    packed individuals with their fitness, and its done/stop flags.
+    """
+    def __init__(self, k: int, migrants: int, words: int, name: str | None = None):
+        shapes = [(k, migrants, words), (k, migrants), (k, 2)]
+        dtypes = [np.uint64, np.float64, np.uint8]
+        sizes = [int(np.prod(shape)) * np.dtype(dtype).itemsize for shape, dtype in zip(shapes, dtypes)]
+        self.memory = shared_memory.SharedMemory(name=name, create=name is None, size=sum(sizes))
+        offsets = np.cumsum([0] + sizes)
+        self.individuals, self.fitnesses, self.flags = [
+            np.ndarray(shape, dtype=dtype, buffer=self.memory.buf, offset=offset)
+            for shape, dtype, offset in zip(shapes, dtypes, offsets)]
+        self.args = (k, migrants, words, self.memory.name)
+
+    def close(self) -> None:
+        del self.individuals, self.fitnesses, self.flags # views of the buffer must go first
+        self.memory.close()
+
+
+def _island(index: int, parameters: dict, problem_id: tuple[int, int, int], budget: int, seed: int,
+            exchange_args: tuple, barrier, stop, records) -> None:
+    """
+    Worker process of one island: runs the GA on its own (unlogged) copy of the problem for
+    `migration_interval` generations at a time, sends the number of evaluations of every epoch and
+    the evaluations that improved the island's best so far to the main process, and exchanges
+    migrants with its neighbours through the shared memory.
+    """
+    from .DesignedGA import DesignedGA # imported here, DesignedGA imports this module
+
+    fid, iid, n = problem_id
+    problem = batch_problems.get_problem(fid, iid, n) # NumPy evaluation where supported, the fitness is the same
+    ga = DesignedGA(budget, parameters["population_size"], parameters["mutation_rate"])
+    ga.termination = Termination(target=None) # the target is checked by the main process
+    ga.set_seed(seed)
+    exchange = _Exchange(*exchange_args)
+    sources = neighbours(parameters["topology"], exchange.flags.shape[0])[index]
+    words = bitset.n_words(n)
+
+    # per epoch: the number of evaluations, the improvements of the island's best (position in the
+    # epoch, packed individual, fitness) and, for the migration, the best individuals evaluated so far
+    epoch_state = {"count": 0, "best": -np.inf, "positions": [], "rows": [], "fitnesses": []}
+    best = np.empty((0, words), dtype=np.uint64)
+    best_fitnesses = np.empty(0)
+    def record(X, fitnesses):
+        nonlocal best, best_fitnesses
+        m = int(np.count_nonzero(~np.isneginf(fitnesses)))
+        before = np.maximum.accumulate(np.concatenate(([epoch_state["best"]], fitnesses[:m])))[:-1]
+        improved = np.flatnonzero(fitnesses[:m] > before)
+        if len(improved):
+            epoch_state["positions"].append(epoch_state["count"] + improved)
+            epoch_state["rows"].append(bitset.pack(X[improved]))
+            epoch_state["fitnesses"].append(fitnesses[improved])
+            epoch_state["best"] = float(fitnesses[improved[-1]])
+        epoch_state["count"] += m
+        # the best `migrants` individuals evaluated so far (the earlier one first on ties)
+        top = np.argsort(-fitnesses[:m], kind="stable")[:parameters["migrants"]]
+        pool = np.concatenate((best, bitset.pack(X[top])))
+        pool_fitnesses = np.concatenate((best_fitnesses, fitnesses[top]))
+        keep = np.argsort(-pool_fitnesses, kind="stable")[:parameters["migrants"]]
+        best, best_fitnesses = pool[keep], pool_fitnesses[keep]
+    ga.add_evaluation_hook(record)
+
+    try:
+        ga.start_run(problem)
+        pop = bitset.random_bits(ga.population_size, n, ga.rng)
+        epoch = 0
+        while True:
+            for _ in range(parameters["migration_interval"]):
+                if ga.should_stop(problem):
+                    break
+                pop = ga.generation(problem, pop, n)
+            done = ga.should_stop(problem)
+
+            improvements = [np.concatenate(epoch_state[key]) if epoch_state[key] else empty
+                            for key, empty in (("positions", np.empty(0, dtype=np.int64)),
+                                               ("rows", np.empty((0, words), dtype=np.uint64)),
+                                               ("fitnesses", np.empty(0)))]
+            records.put((index, epoch, epoch_state["count"], *improvements))
+            epoch_state.update(count=0, positions=[], rows=[], fitnesses=[])
+            epoch += 1
+
+            # publish the best individuals evaluated so far (elites of the island)
+            exchange.individuals[index, :len(best)] = best
+            exchange.fitnesses[index] = -np.inf
+            exchange.fitnesses[index, :len(best)] = best_fitnesses
+            exchange.flags[index] = (done, stop.is_set())
+            barrier.wait()
+            # the flags are only written before the first barrier, so every island takes the same decision
+            if exchange.flags[:, 0].all() or exchange.flags[:, 1].any():
+                break
+
+            # immigrants: the best individuals of the neighbours replace random individuals
+            # (the elites at positions 0 and 1 are kept)
+            incoming = [(f, j, m) for j in sources for m, f in enumerate(exchange.fitnesses[j]) if np.isfinite(f)]
+            incoming = sorted(incoming, reverse=True)[:parameters["migrants"]]
+            if incoming:
+                targets = 2 + ga.rng.permutation(len(pop) - 2)[:len(incoming)]
+                pop[targets] = [exchange.individuals[j, m] for _, j, m in incoming]
+            barrier.wait() # nobody publishes new migrants before everyone has read them
+    finally:
+        exchange.close()
+
+
+def merge_epoch(counts: list[int], positions: list[np.ndarray], fitnesses: list[np.ndarray],
+                best: float) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Interleaves one epoch of the islands round-robin (evaluation t of island i comes before evaluation t
+    of island i + 1, and after evaluation t - 1 of every island) and finds the evaluations that improve
+    the best fitness so far of the merged run. Only these can: an improvement of the merged run is
+    always an improvement of its island.
+
+    Args:
+        counts: The number of evaluations of every island in the epoch.
+        positions: The positions (in the island's epoch) of the improvements of every island.
+        fitnesses: Their fitness.
+        best: The best fitness of the merged run before the epoch.
+
+    Returns:
+        tuple: The positions of the improvements of the merged run in the merged epoch, and the
+            island and the index (into positions[island]) of each.
+    """
+    counts = np.asarray(counts)
+    merged, islands, indices, values = [], [], [], []
+    for i, (t, f) in enumerate(zip(positions, fitnesses)):
+        # the evaluations before (i, t): min(count, t) of every island, and one more of the islands before i with count > t
+        before = np.minimum(counts[None, :], t[:, None]).sum(axis=1) + (counts[None, :i] > t[:, None]).sum(axis=1)
+        merged.append(before)
+        islands.append(np.full(len(t), i))
+        indices.append(np.arange(len(t)))
+        values.append(f)
+    merged, islands, indices, values = (np.concatenate(a) if a else np.empty(0, dtype=int)
+                                        for a in (merged, islands, indices, values))
+    order = np.argsort(merged, kind="stable")
+    merged, islands, indices, values = merged[order], islands[order], indices[order], values[order]
+    improving = values > np.maximum.accumulate(np.concatenate(([best], values)))[:-1]
+    return merged[improving], islands[improving], indices[improving]
+
+
+class _IslandState(NamedTuple):
+    # the state of the merged run for the stopping criteria: the best of the logged problem,
+    # with the evaluations of all islands
+    y_unconstrained_best: float
+    optimum_found: bool
+    evaluations: int
+
+
+def _should_stop(ga, problem: ioh.problem.PBO, evaluations: int) -> bool:
+    state = problem.state
+    return evaluations >= ga.budget or ga.termination.should_stop(
+        _IslandState(state.y_unconstrained_best, state.optimum_found, evaluations))
+
+
+def run_islands(ga, problem: ioh.problem.PBO) -> None:
+    """
+    Runs the island model of a DesignedGA (`ga.islands` islands with `ga.population_size`
+    individuals each) on the given problem.
+
+    The budget is split exactly over the islands, which evaluate on their own copies of the problem
+    in worker processes. Their evaluations are interleaved round-robin per epoch into one run, and
+    only the evaluations that improve the best so far of this run are evaluated again on the given
+    problem, with the same individual (so with the same fitness), for its IOH logger. The stopping
+    criteria (`ga.budget` and `ga.termination`) count the evaluations of all islands, and so does
+    `ga.island_evaluations`, which is logged with the run (see `DesignedGA.run_attributes`).
+
+    Limitation: IOH's evaluation counter cannot be set, so on the given problem (and in its log)
+    the evaluation numbers count the improvements only, not the evaluations of the islands, and
+    the log holds no records of the other evaluations (whatever the logger's triggers are). The
+    fitness values and solutions in the log are exactly those the islands evaluated; use
+    `island_evaluations` of the run for its true length.
+    """
+    meta = problem.meta_data
+    n, k = meta.n_variables, ga.islands
+    parameters = {name: getattr(ga, name) for name in
+                  ("population_size", "mutation_rate", "topology", "migration_interval", "migrants")}
+    neighbours(ga.topology, k) # fails early on an unknown topology
+    budgets = split_budget(ga.budget, k)
+    seeds = ga.rng.integers(0, 2**31, size=k)
+
+    context = multiprocessing.get_context()
+    exchange = _Exchange(k, ga.migrants, bitset.n_words(n))
+    barrier, stop, records = context.Barrier(k), context.Event(), context.Queue()
+    workers = [context.Process(target=_island, daemon=True,
+                               args=(i, parameters, (meta.problem_id, meta.instance, n), budgets[i],
+                                     int(seeds[i]), exchange.args, barrier, stop, records))
+               for i in range(k)]
+    try:
+        for worker in workers:
+            worker.start()
+
+        epochs = {} # epoch -> {island: (count, positions, packed rows, fitnesses) of its improvements}
+        epoch = 0
+        ga._island_evaluations = 0 # the evaluations of all islands before the current epoch
+        while not stop.is_set():
+            # checked before waiting: the records of an island are sent before it exits
+            finished = all(worker.exitcode == 0 for worker in workers)
+            try:
+                index, e, *record = records.get(timeout=1)
+            except queue.Empty:
+                if any(worker.exitcode not in (None, 0) for worker in workers):
+                    raise RuntimeError("An island process failed.")
+                if finished:
+                    break
+                continue
+            epochs.setdefault(e, {})[index] = record
+            while len(epochs.get(epoch, {})) == k and not stop.is_set():
+                island_records = [epochs[epoch][i] for i in range(k)]
+                del epochs[epoch]
+                epoch += 1
+                counts = [count for count, _, _, _ in island_records]
+                merged, islands, indices = merge_epoch(counts, [r[1] for r in island_records],
+                                                       [r[3] for r in island_records],
+                                                       problem.state.y_unconstrained_best)
+                start = ga._island_evaluations
+                ga._island_evaluations += sum(counts)
+                for position, island, j in zip(merged, islands, indices):
+                    ga.evaluate_packed(problem, island_records[island][2][j:j + 1])
+                    if _should_stop(ga, problem, start + position + 1):
+                        ga._island_evaluations = start + position + 1 # the run ends here
+                        break
+                if _should_stop(ga, problem, ga._island_evaluations):
+                    stop.set()
+    finally:
+        # the islands still running are no longer needed (their records would not be reported)
+        for worker in workers:
+            if worker.is_alive():
+                worker.terminate()
+            worker.join()
+        exchange.close()
+        exchange.memory.unlink()
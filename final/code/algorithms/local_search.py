@@ -0,0 +1,149 @@
+import ioh
+import numpy as np
+from .delta_evaluation import get_delta_evaluator
+
+
+# delta scores can differ from the problem's own fitness in the last bits (e.g. ~4e-16 on Concatenated
+# Trap), so a scored neighbour only counts as improving if it beats the pivot by more than this
+TOLERANCE = 1e-9
+
+
+class LocalSearch:
+    """
+    One-bit-flip local search shared by the ant algorithms (ACO, MaxMinAS, MaxMinASStar).
+
+    Every scored neighbour is charged to the problem through `algorithm.evaluate_batch`, so
+    the search stops exactly at the remaining budget (and at `algorithm.should_stop`). When a
+    delta evaluator exists for the problem (see `delta_evaluation`), its scores decide which
+    neighbour is accepted, and with the first improvement only the neighbours up to that one
+    are charged. As the IOH budget counts every solution looked at, they are still evaluated
+    on the problem; with charge_lookups=False only the accepted moves are, which is where
+    the delta evaluation saves time (at the price of a budget that no longer counts the lookups).
+
+    Args:
+        strategy: "best" (default, the search of the baseline ant algorithms) scores all n neighbours
+            and moves to the best one (steepest ascent); "first" moves to the first improving
+            neighbour in the scan order. Without a delta evaluator, "first" evaluates one
+            neighbour at a time, so no neighbour after the first improving one is charged.
+        randomize: If True, the positions are scanned in a random order (drawn per call) instead of 0..n-1.
+        dont_look: If True ("first" only), every position has a don't-look bit, which is set when its
+            flip fails to improve and cleared again for the positions that interact with an accepted
+            flip (see `DeltaEvaluator.interactions`; all positions if that is not known). Positions
+            whose bit is set are skipped, and the search ends when all bits are set, i.e. at a one-bit-flip
+            local optimum. False (default) scans until n flips in a row fail.
+        max_evaluations: Maximum evaluations per call, including the one of the start solution (None: no cap).
+        charge_lookups: If False, the neighbours scored by a delta evaluator are not evaluated on the
+            problem (nor charged or logged), only the accepted moves are. Without an evaluator for
+            the problem every neighbour is evaluated anyway.
+    """
+    def __init__(self, strategy: str = "best", randomize: bool = False, dont_look: bool = False,
+                 max_evaluations: int | None = None, charge_lookups: bool = True):
+        if strategy not in ("first", "best"):
+            raise ValueError(f"Unknown local search strategy: {strategy}")
+        self.strategy = strategy
+        self.randomize = randomize
+        self.dont_look = dont_look
+        self.max_evaluations = max_evaluations
+        self.charge_lookups = charge_lookups
+
+    def __repr__(self) -> str:
+        return (f"LocalSearch(strategy={self.strategy!r}, randomize={self.randomize}, "
+                f"dont_look={self.dont_look}, max_evaluations={self.max_evaluations}, "
+                f"charge_lookups={self.charge_lookups})")
+
+    def __call__(self, algorithm, problem: ioh.problem.PBO, solution: np.ndarray) -> tuple[np.ndarray, float]:
+        """
+        Improve the given solution.
+
+        Args:
+            algorithm (Algorithm): The algorithm running the search (budget, random source, stopping criteria).
+            solution (np.ndarray): The start solution, evaluated (and charged) first.
+
+        Returns:
+            tuple: A tuple containing the improved solution and its fitness.
+        """
+        n = len(solution)
+        pivot = np.array(solution, dtype=np.uint8)
+        fitness = algorithm.evaluate_batch(problem, pivot)[0]
+        used = 1
+        cap = np.inf if self.max_evaluations is None else self.max_evaluations
+
+        # incremental scoring of the one-bit-flip neighbourhood (None if the problem is unsupported)
+        evaluator = get_delta_evaluator(problem)
+        if evaluator is not None:
+            evaluator.reset(pivot)
+
+        order = algorithm.rng.permutation(n) if self.randomize else np.arange(n)
+        scanned = 0   # positions of `order` scanned so far
+        failures = 0  # flips in a row that failed to improve
+        use_dont_look = self.dont_look and self.strategy == "first"
+        dont_look = np.zeros(n, dtype=bool) # don't-look bits, by position
+
+        while used < cap and not algorithm.should_stop(problem):
+            # positions still to look at, in scan order
+            if self.strategy == "best":
+                window = order
+            elif use_dont_look:
+                # the order from where the scan stopped, without the positions whose don't-look bit is set
+                rotation = (scanned + np.arange(n)) % n
+                rotation = rotation[~dont_look[order[rotation]]]
+                window = order[rotation]
+            else:
+                window = order[(scanned + np.arange(n - failures)) % n]
+            if len(window) == 0:
+                break # every position failed: local optimum
+
+            if evaluator is not None:
+                scores = evaluator.flip_fitnesses()[window]
+                improving = np.flatnonzero(scores > fitness + TOLERANCE)
+                # only the neighbours up to the first improving one are looked at (and charged)
+                m = len(window) if self.strategy == "best" or len(improving) == 0 else improving[0] + 1
+            else:
+                m = len(window) if self.strategy == "best" else 1
+            m = int(min(m, cap - used))
+            window = window[:m]
+            used += m
+
+            if evaluator is None or self.charge_lookups:
+                neighbours = np.repeat(pivot[None, :], m, axis=0)
+                neighbours[np.arange(m), window] ^= 1
+                charged = algorithm.evaluate_batch(problem, neighbours) # -inf beyond the budget
+                values = charged if evaluator is None else np.where(np.isneginf(charged), -np.inf, scores[:m])
+            else:
+                charged = None # only looked up, the accepted neighbour is evaluated below
+                values = scores[:m]
+
+            improving = np.flatnonzero(values > fitness + (TOLERANCE if evaluator is not None else 0.0))
+            if len(improving) == 0:
+                if charged is not None and np.isneginf(charged).any():
+                    break # budget used up
+                if use_dont_look:
+                    dont_look[window] = True
+                    scanned = rotation[m - 1] + 1
+                    continue
+                scanned, failures = scanned + m, failures + m
+                if self.strategy == "best":
+                    break # local optimum found
+                continue
+
+            j = int(np.argmax(values)) if self.strategy == "best" else int(improving[0])
+            i = int(window[j])
+            pivot = pivot.copy()
+            pivot[i] ^= 1
+            if charged is None:
+                value = algorithm.evaluate_batch(problem, pivot)[0]
+                if np.isneginf(value):
+                    pivot[i] ^= 1
+                    break # budget used up
+            else:
+                value = charged[j]
+            fitness = value # the problem's own value, also when a delta evaluator chose the move
+            if evaluator is not None:
+                evaluator.flip(i)
+            if use_dont_look:
+                dont_look[window[:j]] = True
+                dont_look[evaluator.interactions(i) if evaluator is not None else slice(None)] = False
+                scanned = rotation[j] + 1
+                continue
+            scanned, failures = scanned + j + 1, 0
+        return pivot, fitness
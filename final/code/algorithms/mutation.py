@@ -0,0 +1,99 @@
+from functools import lru_cache
+import numpy as np
+
+
+def geometric_positions(size: int, p: float, rng) -> np.ndarray:
+    """
+    Positions in [0, size) that are hit when each position is hit independently with
+    probability p, sampled by geometric skipping: the gap to the next hit is Geometric(p),
+    so only the hit positions are drawn instead of `size` uniforms.
+    """
+    if p <= 0 or size == 0:
+        return np.empty(0, dtype=np.int64)
+    if p >= 1:
+        return np.arange(size)
+
+    positions = []
+    last = -1
+    while True:
+        # draw a few more gaps than expected so one round is almost always enough
+        expected = int((size - last) * p + 4 * np.sqrt((size - last) * p) + 8)
+        hits = last + np.cumsum(rng.geometric(p, size=expected))
+        positions.append(hits[hits < size])
+        if hits[-1] >= size:
+            return np.concatenate(positions)
+        last = hits[-1]
+
+
+def flip_positions(n: int, p: float, rng, method: str = "binomial") -> np.ndarray:
+    """
+    Bit positions flipped by standard bit mutation with rate p on a bitstring of length n.
+
+    Args:
+        method: "binomial" samples the number of flips k ~ Binomial(n, p) and then k distinct
+            positions; "geometric" uses geometric skipping. Both give the same distribution.
+    """
+    if method == "geometric":
+        return geometric_positions(n, p, rng)
+    if method != "binomial":
+        raise ValueError(f"Unknown mutation method: {method}")
+    k = rng.binomial(n, p)
+    if k <= 1:
+        # the common case at p = 1/n, served from the buffered integers
+        return np.array([rng.integers(0, n)] * k, dtype=np.int64)
+    return rng.choice(n, size=k, replace=False)
+
+
+def standard_bit_mutation(x: np.ndarray, p: float, rng, method: str = "binomial") -> tuple[np.ndarray, int]:
+    """
+    Flip every bit of x independently with probability p, drawing only the flipped positions.
+
+    Returns:
+        tuple: The offspring (a copy of x) and the number of flipped bits; 0 means the
+            offspring is a clone of x.
+    """
+    positions = flip_positions(len(x), p, rng, method)
+    offspring = x.copy()
+    offspring[positions] = 1 - offspring[positions]
+    return offspring, len(positions)
+
+
+@lru_cache(maxsize=32)
+def _power_law_cdf(max_strength: int, beta: float) -> np.ndarray:
+    weights = np.arange(1, max_strength + 1, dtype=float) ** -beta
+    return np.cumsum(weights) / weights.sum()
+
+
+def power_law_strength(n: int, beta: float, rng) -> int:
+    """
+    A mutation strength alpha in {1, ..., n/2} with P(alpha) proportional to alpha^(-beta), the
+    heavy-tailed distribution of the fast mutation of Doerr et al. (2017): standard bit mutation
+    with rate alpha/n usually flips few bits, but flips k bits with probability about k^(-beta)
+    instead of about 1/(k! n^k).
+    """
+    cdf = _power_law_cdf(max(n // 2, 1), beta)
+    return min(int(np.searchsorted(cdf, rng.random(), side="right")), len(cdf) - 1) + 1
+
+
+def one_bit_flip(x: np.ndarray, rng) -> np.ndarray:
+    """ Flip exactly one uniformly chosen bit of (a copy of) x. """
+    offspring = x.copy()
+    i = rng.integers(0, len(x))
+    offspring[i] = 1 - offspring[i]
+    return offspring
+
+
+def mutate_packed(P: np.ndarray, n: int, p: float, rng) -> np.ndarray:
+    """
+    Standard bit mutation with rate p on every row of a packed population (see `bitset`).
+    The flipped positions of the whole population are drawn at once by geometric skipping
+    and XORed into the packed words.
+    """
+    mutated = np.ascontiguousarray(P).copy()
+    rows, row_bytes = len(P), P.shape[1] * 8
+    hits = geometric_positions(rows * n, p, rng)
+    row, bit = np.divmod(hits, n)
+    as_bytes = mutated.view(np.uint8).reshape(rows, row_bytes)
+    # bit j of a row lives in byte j // 8, most significant bit first
+    np.bitwise_xor.at(as_bytes, (row, bit // 8), (128 >> (bit % 8)).astype(np.uint8))
+    return mutated
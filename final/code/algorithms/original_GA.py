@@ -1,8 +1,14 @@
 from ioh import get_problem, ProblemClass
 from ioh import logger
 import sys
+from pathlib import Path
 import numpy as np
 
+# Add the parent directory (code/) to the Python path, so the script also runs on its own from algorithms/
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from algorithms.termination import target_fitness
+
 '''
 Applying a genetic algorithm to find the optimum solution of some predefined problem 'func'. 
 The GA uses uniform crossover, mutation, and a parent population of at least 10 individuals. 
@@ -95,11 +101,10 @@ def genetic_algorithm(func, budget = None, p_size = 4):
     if budget is None:
         budget = int(pow(10, 5))
 
-    # Print default optimum of the given problem 
-    if func.meta_data.problem_id == 18 and func.meta_data.n_variables == 32: # for a known problem instance
-        optimum = 8
-    else:
-        optimum = func.optimum.y 
+    # Print the known optimum of the given problem (never reached if it is not known)
+    optimum = target_fitness(func)
+    if optimum is None:
+        optimum = float("inf")
     print(optimum)
     
 
@@ -0,0 +1,64 @@
+from collections import defaultdict
+from time import perf_counter
+
+
+class _NullPhase:
+    """ Phase used when profiling is disabled: entering and leaving it does nothing. """
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+NULL_PHASE = _NullPhase()
+
+
+class _Phase:
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler: "PhaseProfiler", name: str):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.profiler._children.append(0.0)
+        self.start = perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        elapsed = perf_counter() - self.start
+        profiler = self.profiler
+        children = profiler._children.pop()
+        profiler.total[self.name] += elapsed
+        profiler.self_time[self.name] += elapsed - children
+        profiler.calls[self.name] += 1
+        if profiler._children:
+            profiler._children[-1] += elapsed # charge the enclosing phase with this phase's time
+        return False
+
+
+class PhaseProfiler:
+    """
+    Accumulates wall time and call counts per named phase (evaluate, construct, local_search,
+    select, crossover, mutate, update, ...). Phases may be nested: `total` is the inclusive time
+    of a phase and `self_time` excludes the time spent in the phases nested inside it.
+    """
+    def __init__(self):
+        self.total = defaultdict(float)
+        self.self_time = defaultdict(float)
+        self.calls = defaultdict(int)
+        self._children = [] # time spent in nested phases, one entry per open phase
+
+    def phase(self, name: str) -> _Phase:
+        return _Phase(self, name)
+
+    def summary(self) -> dict:
+        """
+        Returns:
+            dict: For every phase, its inclusive and exclusive time in seconds and its number of calls.
+        """
+        return {name: {"seconds": self.total[name], "self_seconds": self.self_time[name], "calls": self.calls[name]}
+                for name in self.total}
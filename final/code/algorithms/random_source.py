@@ -0,0 +1,57 @@
+import numpy as np
+
+
+class RandomSource:
+    """
+    Buffered source of randomness around a seeded `np.random.Generator`.
+
+    Scalar draws of uniforms and bounded integers, and small arrays of uniforms, are
+    served from large pre-drawn blocks, so inner loops that need one random number at a
+    time do not pay for a Generator call each time. For a given seed the sequence of
+    values is fully reproducible. Any other Generator method (binomial, geometric,
+    choice, bytes, ...) is forwarded to the underlying generator.
+    """
+    def __init__(self, seed: int | None = None, block_size: int = 1 << 16):
+        self.generator = np.random.default_rng(seed)
+        self.block_size = block_size
+        self._scalars = []          # pre-drawn uniforms handed out one at a time
+        self._scalars_pos = 0
+        self._uniforms = np.empty(0) # pre-drawn uniforms handed out in chunks
+        self._uniforms_pos = 0
+        self._integers = {}         # (low, high) -> [pre-drawn integers, position]
+
+    def __getattr__(self, name):
+        return getattr(self.generator, name)
+
+    def random(self, size=None):
+        """ Uniform floats in [0, 1), like `Generator.random`. """
+        if size is None:
+            if self._scalars_pos >= len(self._scalars):
+                self._scalars = self.generator.random(self.block_size).tolist()
+                self._scalars_pos = 0
+            self._scalars_pos += 1
+            return self._scalars[self._scalars_pos - 1]
+
+        count = int(np.prod(size))
+        if count > self.block_size:
+            return self.generator.random(size)
+        if self._uniforms_pos + count > len(self._uniforms):
+            # keep the unused tail so no drawn value is skipped
+            self._uniforms = np.concatenate((self._uniforms[self._uniforms_pos:], self.generator.random(self.block_size)))
+            self._uniforms_pos = 0
+        values = self._uniforms[self._uniforms_pos:self._uniforms_pos + count]
+        self._uniforms_pos += count
+        return values.reshape(size)
+
+    def integers(self, low, high=None, size=None, dtype=np.int64):
+        """ Integers in [low, high) (or [0, low) if high is None), like `Generator.integers`. """
+        if size is not None:
+            return self.generator.integers(low, high, size=size, dtype=dtype)
+        if high is None:
+            low, high = 0, low
+
+        buffer = self._integers.get((low, high))
+        if buffer is None or buffer[1] >= len(buffer[0]):
+            buffer = self._integers[(low, high)] = [self.generator.integers(low, high, size=self.block_size).tolist(), 0]
+        buffer[1] += 1
+        return buffer[0][buffer[1] - 1]
@@ -0,0 +1,55 @@
+import importlib
+import sys
+
+
+# algorithm class name -> module of the algorithms package that defines it. The modules are only
+# imported when an algorithm is used, so a process imports just the algorithms it runs.
+REGISTRY = {
+    "RandomSearch": "RandomSearch",
+    "RandomizedLocalSearch": "RLS",
+    "OnePlusOneEA": "OnePlusOneEA",
+    "OnePlusLambdaLambdaGA": "OnePlusLambdaLambdaGA",
+    "MuPlusLambdaGA": "MuPlusLambdaGA",
+    "DesignedGA": "DesignedGA",
+    "ACO": "ACO",
+    "MaxMinAS": "MaxMinAS",
+    "MaxMinASStar": "MaxMinASStar",
+    "CachedAlgorithm": "fitness_cache",
+    "Portfolio": "Portfolio",
+}
+
+
+def get_algorithm(name: str) -> type:
+    """
+    The algorithm class registered under `name`, importing its module on first use.
+
+    Most modules have the name of their class, and importing a submodule sets the package attribute
+    of that name to the module. So after every import the registered classes of all loaded modules are
+    bound to the package again, and `from algorithms import OnePlusOneEA` always gives the class.
+    """
+    if name not in REGISTRY:
+        raise KeyError(f"Unknown algorithm: {name} (known: {', '.join(sorted(REGISTRY))})")
+    cls = getattr(importlib.import_module(f".{REGISTRY[name]}", __package__), name)
+    package = sys.modules[__package__]
+    for other, module_name in REGISTRY.items():
+        module = sys.modules.get(f"{__package__}.{module_name}")
+        if module is not None and hasattr(module, other):
+            setattr(package, other, getattr(module, other))
+    return cls
+
+
+def make_algorithm(spec: dict, budget: int):
+    """
+    Builds an algorithm instance from a specification: the registered class name under "class"
+    and its constructor arguments, e.g. {"class": "DesignedGA", "population_size": 44}. The budget
+    is passed to every class that takes one; an argument that is itself a specification (e.g. the
+    "algorithm" of a CachedAlgorithm) is built as well.
+    """
+    import inspect # only needed here, and slow to import
+    spec = dict(spec)
+    cls = get_algorithm(spec.pop("class"))
+    arguments = {key: make_algorithm(value, budget) if isinstance(value, dict) and "class" in value else value
+                 for key, value in spec.items()}
+    if "budget" in inspect.signature(cls).parameters:
+        arguments.setdefault("budget", budget)
+    return cls(**arguments)
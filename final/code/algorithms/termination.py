@@ -0,0 +1,100 @@
+import math
+import time
+import ioh
+
+
+# Minimal energies E = sum_k C_k^2 of the low autocorrelation binary sequences (LABS, fid 18) of length n,
+# from exhaustive search (Packebusch & Mertens, 2016). The IOH fitness of such a sequence is n^2 / (2E).
+LABS_MIN_ENERGY = {
+    3: 1, 4: 2, 5: 2, 6: 7, 7: 3, 8: 8, 9: 12, 10: 13, 11: 5, 12: 10, 13: 6, 14: 19, 15: 15, 16: 24,
+    17: 32, 18: 25, 19: 29, 20: 26, 21: 26, 22: 39, 23: 47, 24: 36, 25: 36, 26: 45, 27: 37, 28: 50,
+    29: 62, 30: 59, 31: 67, 32: 64, 33: 64, 34: 65, 35: 73, 36: 82, 37: 86, 38: 87, 39: 99, 40: 108,
+    41: 108, 42: 101, 43: 109, 44: 122, 45: 118, 46: 131, 47: 135, 48: 140, 49: 136, 50: 153,
+    51: 153, 52: 166, 53: 170, 54: 175, 55: 171, 56: 192, 57: 188, 58: 197, 59: 205, 60: 218,
+    61: 226, 62: 235, 63: 207, 64: 208, 65: 240, 66: 257,
+}
+
+# Known optimal fitness per (fid, n) of instance 1, for the problems whose optimum IOH does not report
+# (fid 18 has optimum inf in IOH). Add entries here, e.g. best known values, to use them as targets.
+KNOWN_OPTIMA = {(18, n): n * n / (2 * energy) for n, energy in LABS_MIN_ENERGY.items()}
+
+
+def known_optimum(fid: int, n: int) -> float | None:
+    """
+    The optimal fitness of instance 1 of a PBO problem of dimension n, or None if it is not known.
+    """
+    if (fid, n) in KNOWN_OPTIMA:
+        return KNOWN_OPTIMA[(fid, n)]
+    if fid in (1, 2):   # OneMax, LeadingOnes
+        return float(n)
+    if fid == 3:        # Linear with weights 1..n
+        return n * (n + 1) / 2
+    if fid == 23 and math.isqrt(n) ** 2 == n: # N-Queens on a sqrt(n) x sqrt(n) board
+        return float(math.isqrt(n))
+    if fid == 24 and n % 5 == 0: # Concatenated Trap, blocks of 5 bits
+        return n / 5
+    return None
+
+
+def target_fitness(problem: ioh.problem.PBO) -> float | None:
+    """
+    The optimal fitness of the given problem, or None if it is not known. For instances other than 1,
+    IOH transforms the fitness, so only the optimum that IOH reports itself is used (when it is reliable).
+    """
+    fid, n = problem.meta_data.problem_id, problem.meta_data.n_variables
+    if problem.meta_data.instance == 1:
+        return known_optimum(fid, n)
+    if known_optimum(fid, n) is not None and (fid, n) not in KNOWN_OPTIMA:
+        return problem.optimum.y
+    return None
+
+
+class Termination:
+    """
+    Stopping criteria queried by the main loop of an algorithm (through `Algorithm.should_stop`)
+    on top of its evaluation budget. A run stops as soon as one of them holds:
+
+    Args:
+        target: Stop when the best fitness so far reaches this value. "optimum" (default) uses the
+            known optimum of the problem (see `target_fitness`) and never stops if it is not known;
+            None disables the target.
+        stagnation: Stop after this many evaluations without an improvement of the best fitness (None disables).
+        time_limit: Stop after this many seconds of wall-clock time (None disables).
+    """
+    def __init__(self, target: float | str | None = "optimum", stagnation: int | None = None,
+                 time_limit: float | None = None):
+        self.target = target
+        self.stagnation = stagnation
+        self.time_limit = time_limit
+        self.reason = None # why the last run stopped early ("target", "stagnation" or "time_limit")
+        self._target = None
+        self._use_optimum_found = False
+        self._start_time = 0.0
+        self._best = -math.inf
+        self._last_improvement = 0
+
+    def start(self, problem: ioh.problem.PBO) -> None:
+        """ Resets the criteria at the beginning of a run on the given problem. """
+        self._target = target_fitness(problem) if self.target == "optimum" else self.target
+        # IOH's own optimum_found flag is only trusted for the problems whose optimum it reports correctly
+        self._use_optimum_found = self.target == "optimum" and self._target is not None
+        self._start_time = time.perf_counter()
+        self._best = -math.inf
+        self._last_improvement = 0
+        self.reason = None
+
+    def should_stop(self, state) -> bool:
+        """ Whether the run should stop now, given the current `problem.state`. """
+        best = state.y_unconstrained_best # equals current_best.y for the PBO problems, without copying x
+        if self._use_optimum_found and state.optimum_found:
+            self.reason = "target"
+        elif self._target is not None and best >= self._target - 1e-9:
+            self.reason = "target"
+        elif self.stagnation is not None:
+            if best > self._best:
+                self._best, self._last_improvement = best, state.evaluations
+            elif state.evaluations - self._last_improvement >= self.stagnation:
+                self.reason = "stagnation"
+        if self.reason is None and self.time_limit is not None and time.perf_counter() - self._start_time >= self.time_limit:
+            self.reason = "time_limit"
+        return self.reason is not None
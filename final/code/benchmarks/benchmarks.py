@@ -0,0 +1,216 @@
+import sys
+from pathlib import Path
+
+# Add the parent directory (code/) to the Python path to enable imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import argparse
+import json
+import platform
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+import ioh
+import numpy as np
+
+import algorithms
+from algorithms import Algorithm, DesignedGA, MaxMinASStar, batch_problems, bitset
+from algorithms.colony import construct_solutions, init_pheromone
+from algorithms.random_source import RandomSource
+from utilities import config
+from utilities.utilities import ensure_dir, git_commit
+
+
+DIMENSIONS = [16, 64, 256, 1024, 4096]   # perfect squares, so N-Queens (fid 23) is defined for all of them
+BASELINE_DIR = Path(__file__).parent / "baselines"
+
+
+def benchmarked_algorithms() -> dict[str, type]:
+    """
+    All algorithm classes of the registry (`algorithms/registry.py`) that can be built from a budget alone
+    (wrappers such as CachedAlgorithm need another algorithm and are skipped).
+    """
+    classes = {}
+    for name in algorithms.REGISTRY:
+        cls = algorithms.get_algorithm(name)
+        try:
+            cls(budget=1)
+        except TypeError:
+            continue
+        classes[name] = cls
+    return classes
+
+
+class _CountingBatches:
+    """ Counts the evaluate_batch calls of an algorithm instance (one call ~ one generation/step). """
+    def __init__(self, algorithm: Algorithm):
+        self.calls = 0
+        self._evaluate_batch = algorithm.evaluate_batch
+        algorithm.evaluate_batch = self
+
+    def __call__(self, problem, X):
+        self.calls += 1
+        return self._evaluate_batch(problem, X)
+
+
+def run_macro(cls: type, fid: int, dim: int, budget: int, seed: int) -> dict:
+    """
+    Runs one algorithm once on one problem and measures its throughput and peak memory.
+    """
+    algorithm = cls(budget=budget)
+    algorithm.set_seed(seed)
+    batches = _CountingBatches(algorithm)
+    problem = ioh.get_problem(fid, 1, dim, config.PROBLEMS_TYPE)
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    algorithm(problem)
+    seconds = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    evaluations = problem.state.evaluations
+    return {
+        "algorithm": cls.__name__,
+        "fid": fid,
+        "dim": dim,
+        "budget": budget,
+        "evaluations": evaluations,
+        "seconds": seconds,
+        "evals_per_sec": evaluations / seconds if seconds > 0 else float("inf"),
+        "generations": batches.calls,
+        "time_per_generation": seconds / max(batches.calls, 1),
+        "peak_memory_bytes": peak,
+    }
+
+
+def _time_it(fn, min_time: float = 0.2) -> tuple[float, int]:
+    """ Calls fn repeatedly for at least `min_time` seconds and returns (seconds per call, calls). """
+    calls, start = 0, time.perf_counter()
+    while True:
+        fn()
+        calls += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            return elapsed / calls, calls
+
+
+def run_micro(dim: int, seed: int, population_size: int = 44, number_of_ants: int = 10) -> list[dict]:
+    """
+    Times the hot helpers at one dimension: the ACO local search, DesignedGA's crossover and
+    mutation on a packed population, the construction of one iteration of ants, and the
+    evaluation of a population on LABS through IOH and through the NumPy batch evaluator.
+    """
+    rng = RandomSource(seed)
+    results = []
+
+    ga = DesignedGA(budget=1, population_size=population_size)
+    ga.set_seed(seed)
+    pop = bitset.random_bits(population_size, dim, rng)
+    seconds, calls = _time_it(lambda: ga.uniform_crossover(None, pop, dim))
+    results.append({"name": "DesignedGA.uniform_crossover", "dim": dim, "seconds_per_call": seconds, "calls": calls})
+    seconds, calls = _time_it(lambda: ga.mutate(ga.mutation_rate, pop, dim))
+    results.append({"name": "DesignedGA.mutate", "dim": dim, "seconds_per_call": seconds, "calls": calls})
+
+    tau, _, _ = init_pheromone(dim, 0.01)
+    seconds, calls = _time_it(lambda: construct_solutions(tau, number_of_ants, rng))
+    results.append({"name": "construct_solutions", "dim": dim, "seconds_per_call": seconds, "calls": calls})
+
+    # one local search from a random solution on OneMax, capped at 10 neighbourhoods
+    mmas = MaxMinASStar(budget=1)
+    def local_search():
+        problem = ioh.get_problem(1, 1, dim, config.PROBLEMS_TYPE)
+        mmas.budget = 10 * dim
+        mmas.local_search(mmas, problem, rng.integers(0, 2, size=dim).astype(np.uint8))
+    seconds, calls = _time_it(local_search)
+    results.append({"name": "local_search", "dim": dim, "seconds_per_call": seconds, "calls": calls})
+
+    X = bitset.unpack(pop, dim)
+    labs = ioh.get_problem(18, 1, dim, config.PROBLEMS_TYPE)
+    seconds, calls = _time_it(lambda: labs(X.tolist()))
+    results.append({"name": "evaluate_ioh", "dim": dim, "seconds_per_call": seconds, "calls": calls})
+    seconds, calls = _time_it(lambda: batch_problems.batch_fitness(18, 1, X))
+    results.append({"name": "evaluate_batch", "dim": dim, "seconds_per_call": seconds, "calls": calls})
+    return results
+
+
+def run_benchmarks(algorithm_names: list[str], fids: list[int], dims: list[int], budget: int, seed: int,
+                   micro: bool = True) -> dict:
+    """
+    Runs the macro benchmarks (every algorithm x fid x dim) and the micro benchmarks and
+    returns them as one JSON-serialisable baseline.
+    """
+    classes = benchmarked_algorithms()
+    baseline = {
+        "meta": {
+            "commit": git_commit(),
+            "date": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "budget": budget,
+            "seed": seed,
+        },
+        "macro": [],
+        "micro": [],
+    }
+    for name in algorithm_names:
+        for fid in fids:
+            for dim in dims:
+                result = run_macro(classes[name], fid, dim, budget, seed)
+                print(f"{name:>24} f{fid:<3} n={dim:<5} {result['evals_per_sec']:>12.0f} evals/s "
+                      f"{result['time_per_generation'] * 1e3:>9.3f} ms/gen {result['peak_memory_bytes'] / 2**20:>8.2f} MiB")
+                baseline["macro"].append(result)
+    if micro:
+        for dim in dims:
+            for result in run_micro(dim, seed):
+                print(f"{result['name']:>30} n={dim:<5} {result['seconds_per_call'] * 1e6:>12.1f} us/call")
+                baseline["micro"].append(result)
+    return baseline
+
+
+def compare(old: dict, new: dict) -> None:
+    """
+    Prints the speed-up (old time / new time) of every benchmark present in both baselines.
+    """
+    old_macro = {(r["algorithm"], r["fid"], r["dim"]): r for r in old["macro"]}
+    for r in new["macro"]:
+        key = (r["algorithm"], r["fid"], r["dim"])
+        if key in old_macro:
+            speedup = r["evals_per_sec"] / old_macro[key]["evals_per_sec"]
+            print(f"{r['algorithm']:>24} f{r['fid']:<3} n={r['dim']:<5} x{speedup:.2f} evals/s")
+    old_micro = {(r["name"], r["dim"]): r for r in old["micro"]}
+    for r in new["micro"]:
+        key = (r["name"], r["dim"])
+        if key in old_micro:
+            speedup = old_micro[key]["seconds_per_call"] / r["seconds_per_call"]
+            print(f"{r['name']:>30} n={r['dim']:<5} x{speedup:.2f}")
+
+
+def main():
+    """
+    Runs the benchmark suite and stores the results as a JSON baseline in benchmarks/baselines/.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark the algorithms and their hot helpers.")
+    parser.add_argument("--algorithms", nargs="+", default=sorted(benchmarked_algorithms()))
+    parser.add_argument("--fids", nargs="+", type=int, default=config.PROBLEM_IDS)
+    parser.add_argument("--dims", nargs="+", type=int, default=DIMENSIONS)
+    parser.add_argument("--budget", type=int, default=1000, help="evaluations per macro benchmark run")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--no-micro", action="store_true", help="skip the micro benchmarks")
+    parser.add_argument("--output", type=Path, default=None, help="baseline file (default: baselines/<commit>.json)")
+    parser.add_argument("--compare", type=Path, default=None, help="earlier baseline to compare against")
+    args = parser.parse_args()
+
+    baseline = run_benchmarks(args.algorithms, args.fids, args.dims, args.budget, args.seed, micro=not args.no_micro)
+    output = args.output or ensure_dir(BASELINE_DIR) / f"{baseline['meta']['commit']}.json"
+    output.write_text(json.dumps(baseline, indent=4))
+    print(f"Baseline saved to '{output}'.")
+
+    if args.compare:
+        compare(json.loads(args.compare.read_text()), baseline)
+
+
+if __name__ == "__main__":
+    main()
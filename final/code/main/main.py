@@ -4,43 +4,136 @@ from pathlib import Path
 # Add the parent directory (code/) to the Python path to enable imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+import argparse
+import ast
+import json
+
+from algorithms import REGISTRY, Termination, make_algorithm
 from utilities import config
 from utilities.utilities import ensure_dir
-import ioh
+from utilities.runner import run_experiment
+
+
+def parse_algorithm(text: str) -> dict:
+    """
+    An algorithm specification from the command line: a registered class name with optional
+    constructor arguments, e.g. "MaxMinAS:evaporate_rate=0.1,number_of_ants=20", or a JSON object.
+    """
+    if text.lstrip().startswith("{"):
+        return json.loads(text)
+    name, _, arguments = text.partition(":")
+    spec = {"class": name}
+    for argument in filter(None, arguments.split(",")):
+        key, value = argument.split("=", 1)
+        try:
+            spec[key] = ast.literal_eval(value)
+        except (ValueError, SyntaxError): # a plain string
+            spec[key] = value
+    return spec
+
 
+def parse_args(argv: list[str] | None = None) -> dict:
+    """
+    The experiment settings: the defaults of utilities/config.py, overridden by a JSON config
+    file (same keys as below) and then by the command-line arguments.
+    """
+    parser = argparse.ArgumentParser(description="Run the algorithms on the PBO problems and log the runs for IOHanalyzer.")
+    parser.add_argument("--config", type=Path, help="JSON file with any of the settings below")
+    parser.add_argument("--algorithm", dest="algorithms", type=parse_algorithm, action="append",
+                        help="Name[:arg=value,...] or a JSON object with a \"class\" key; repeat for several")
+    parser.add_argument("--budget", type=int)
+    parser.add_argument("--fids", type=int, nargs="+")
+    parser.add_argument("--iids", type=int, nargs="+")
+    parser.add_argument("--dims", type=int, nargs="+")
+    parser.add_argument("--reps", type=int)
+    parser.add_argument("--jobs", type=int, help="worker processes (-1: all cpus)")
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--output", type=Path, help="output directory (default: final/doc/data)")
+    parser.add_argument("--shard", help="I/N: run only the I-th of N shares of the runs (implies --resume)")
+    parser.add_argument("--resume", dest="resume", action="store_true", default=None,
+                        help="keep finished runs in <output>/.cells and skip the runs done before")
+    parser.add_argument("--no-resume", dest="resume", action="store_false", default=None,
+                        help="run every run again instead of skipping the runs done before")
+    parser.add_argument("--profile", action="store_true", default=None)
+    parser.add_argument("--list", action="store_true", help="list the registered algorithms and exit")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        print("\n".join(sorted(REGISTRY)))
+        sys.exit(0)
 
-def main():
+    settings = {
+        "algorithms": config.ALGORITHMS,
+        "budget": config.BUDGET,
+        "fids": config.PROBLEM_IDS,
+        "iids": [1],
+        "dims": [config.DIMENSION],
+        "reps": config.REPETITIONS,
+        "jobs": config.N_JOBS,
+        "seed": config.SEED,
+        "termination": config.TERMINATION,
+        "logger": config.LOGGER,
+        "profile": config.PROFILE,
+        "resume": config.RESUME,
+        # Path is relative to the main.py location: main/ -> code/ -> final/ -> doc/data/
+        "output": Path(__file__).parent.parent.parent / "doc" / "data",
+        "shard": None,
+    }
+    if args.config:
+        file_settings = json.loads(args.config.read_text())
+        unknown = set(file_settings) - set(settings)
+        if unknown:
+            parser.error(f"unknown settings in {args.config}: {', '.join(sorted(unknown))}")
+        settings.update(file_settings)
+    settings.update({key: value for key, value in vars(args).items()
+                     if key in settings and value is not None})
+    if settings["shard"] is not None:
+        index, count = map(int, str(settings["shard"]).split("/"))
+        settings["shard"] = (index, count)
+        settings["resume"] = True # the shares are collected in the resume cache
+    return settings
+
+
+def main(argv: list[str] | None = None):
     """
     Main execution function to **run** all configured algorithms on specified problems.
     """
+    settings = parse_args(argv)
 
     print("Starting experiments...")
 
-    # ensures the doc/data directory exists and output there
-    # Path is relative to the main.py location: main/ -> code/ -> final/ -> doc/data/
-    out_base = ensure_dir(Path(__file__).parent.parent.parent / "doc" / "data")
-
+    # ensures the output directory (by default doc/data) exists and output there
+    out_base = ensure_dir(settings["output"])
 
-    for algorithm in config.ALGORITHMS:
+    specs = settings["algorithms"]
+    for spec in specs:
+        algorithm = make_algorithm(spec, settings["budget"])
         print(f"=========== Running experiments for algorithm: {algorithm.name} ========== ")
-        # create a new experiment for the current algorithm 
-        experiment = ioh.Experiment(
+        algorithm.termination = Termination(**settings["termination"])
+        # configurations of the same algorithm get their own folders, e.g. ioh-data-MaxMinAS-0.1
+        arguments = {k: v for k, v in spec.items() if k != "class"}
+        same_name = [s for s in specs if s["class"] == spec["class"]]
+        suffix = "".join(f"-{v}" for v in arguments.values()) if len(same_name) > 1 else ""
+        # run the (fid, iid, dim, rep) cells of the current algorithm in parallel and merge the output
+        run_experiment(
             algorithm=algorithm,
-            algorithm_name=algorithm.name,
-            algorithm_info=algorithm.algorithm_info,
-            fids = config.PROBLEM_IDS,
-            iids = [1], 
-            dims=[config.DIMENSION],
-            reps=config.REPETITIONS,
-            problem_class=config.PROBLEMS_TYPE,  # Use the configured problem class # type: ignore
-            old_logger=False,  # type: ignore
-            output_directory=str(out_base),
-            # folder_name=f"ioh-data-{algorithm.name}-{algorithm.evaporation_rate}", ======= This is temp for MMAS family only
-            folder_name=f"ioh-data-{algorithm.name}",
-            zip_output=True, 
+            fids=settings["fids"],
+            iids=settings["iids"],
+            dims=settings["dims"],
+            reps=settings["reps"],
+            problem_class=config.PROBLEMS_TYPE,
+            output_directory=out_base,
+            folder_name=f"ioh-data-{algorithm.name}{suffix}",
+            n_jobs=settings["jobs"],
+            seed=settings["seed"],
+            zip_output=True,
+            profile=settings["profile"],
+            logger=settings["logger"],
+            # finished runs are recorded here and skipped when main.py is run again
+            cache_dir=out_base / ".cells" if settings["resume"] else None,
+            shard=settings["shard"],
         )
 
-        experiment.run()
         print(f"=========== Completed experiments for algorithm: {algorithm.name} ========== ")
     print("All experiments completed.")
     print(f"Results are saved in the '{out_base}' directory.")
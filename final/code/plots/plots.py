@@ -0,0 +1,200 @@
+import sys
+from pathlib import Path
+
+# Add the parent directory (code/) to the Python path to enable imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import argparse
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from algorithms.termination import known_optimum
+from utilities.ioh_data import aggregate, log_budgets, problems_of
+from utilities.utilities import ensure_dir
+
+
+DATA_DIR = Path(__file__).parent.parent.parent / "data"
+FIGURE_DIR = Path(__file__).parent.parent.parent / "doc" / "analysis" / "figures"
+# the aggregated curves are cached outside the repository by default (--cache to change it)
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "pbo-plots"
+
+BUDGETS = log_budgets(10**7, 100) # the same budgets for every archive, so cached curves can be combined
+TARGET_POINTS = 50
+QUANTILES = (0.1, 0.5, 0.9)
+CACHE_VERSION = 2 # bump when the aggregation changes, to invalidate all cached curves
+
+
+def default_targets(fid: int, dim: int) -> np.ndarray:
+    """
+    Fitness targets of the fixed-target and ECDF plots of a (fid, dim). They depend on the problem
+    only (instance 1), never on the data, so the curves of every archive use the same targets.
+    """
+    optimum = known_optimum(fid, dim)
+    if optimum is not None and optimum > 0:
+        upper = optimum
+    elif fid == 18:
+        upper = 10.0 # no merit factor of 10 or more is known beyond n = 13
+    elif fid == 25:
+        return np.linspace(-1, 0, TARGET_POINTS + 1)[1:] # NK landscape fitness lies in [-1, 0]
+    else:
+        upper = float(dim)
+    return np.linspace(0, upper, TARGET_POINTS + 1)[1:]
+
+
+def archives(data_dir: Path) -> list[Path]:
+    """ The IOH output archives (zips and ioh-data-* folders) in the data directory. """
+    return sorted([p for p in data_dir.glob("*.zip")] + [p for p in data_dir.glob("ioh-data-*") if p.is_dir()])
+
+
+def content_hash(path: Path) -> str:
+    """ Hash of an archive's content (and of the aggregation settings), the key of its cached curves. """
+    digest = hashlib.sha256(f"{CACHE_VERSION} {BUDGETS.tolist()} {TARGET_POINTS} {QUANTILES}".encode())
+    files = sorted(p for p in path.rglob("*") if p.is_file()) if path.is_dir() else [path]
+    for file in files:
+        digest.update(file.relative_to(path).as_posix().encode() if path.is_dir() else b"")
+        with open(file, "rb") as stream:
+            for chunk in iter(lambda: stream.read(1 << 20), b""):
+                digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _to_json(value):
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, dict):
+        return {str(k): _to_json(v) for k, v in value.items()}
+    return value
+
+
+def aggregate_problem(path: Path, fid: int, dim: int) -> list[dict]:
+    """ Aggregates the runs of one (fid, dim) of an archive per algorithm, as JSON-ready curves. """
+    curves = aggregate(path, BUDGETS, default_targets, QUANTILES, problems={(fid, dim)})
+    label = path.stem if path.suffix == ".zip" else path.name
+    label = label.removeprefix("ioh-data-")
+    return [{"archive": str(path.name), "label": label if algorithm in label else f"{label}: {algorithm}",
+             "algorithm": algorithm, "fid": fid, "dim": dim, **_to_json(result)}
+            for (algorithm, fid, dim), result in curves.items()]
+
+
+def load_curves(data_dir: Path, n_jobs: int, force: bool = False, cache_dir: Path = CACHE_DIR,
+                clear: bool = False) -> list[dict]:
+    """
+    Curves of every archive, read from the cache; only archives whose content changed (or that
+    are new) are aggregated again. The work is split per (archive, fid, dim), so that a single
+    large archive is aggregated in parallel as well. With clear=True, the cached curves of all other
+    archive contents (earlier versions of the archives, archives that were removed, or the archives
+    of other data directories sharing the cache) are deleted.
+    """
+    ensure_dir(cache_dir)
+    cache_files = {path: cache_dir / f"{content_hash(path)}.json" for path in archives(data_dir)}
+    stale = [path for path, cache_file in cache_files.items() if force or not cache_file.exists()]
+    print(f"{len(cache_files) - len(stale)} archives cached, {len(stale)} to aggregate.")
+    tasks = [(path, fid, dim) for path in stale for fid, dim in problems_of(path)]
+    groups = {path: [] for path in stale}
+    if tasks:
+        with ProcessPoolExecutor(max_workers=max(1, min(n_jobs, len(tasks)))) as pool:
+            for (path, _, _), result in zip(tasks, pool.map(aggregate_problem, *zip(*tasks))):
+                groups[path].extend(result)
+    for path in stale:
+        cache_files[path].write_text(json.dumps(groups[path]))
+    if clear:
+        outdated = set(cache_dir.glob("*.json")) - set(cache_files.values())
+        for cache_file in outdated:
+            cache_file.unlink()
+        print(f"{len(outdated)} outdated cache entries deleted.")
+    return [group for cache_file in cache_files.values() for group in json.loads(cache_file.read_text())]
+
+
+def render(kind: str, fid: int, dim: int, groups: list[dict], output_dir: Path) -> Path:
+    """
+    Renders one figure: "fixed_budget" (mean best-so-far with the 10%-90% quantile band),
+    "fixed_target" (ERT per target) or "ecdf" (fraction of (run, target) pairs hit per budget).
+    """
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    fig, ax = plt.subplots(figsize=(7, 4.5))
+    ax.set_prop_cycle(color=plt.cm.tab20.colors) # more archives than the 10 default colours
+    for group in sorted(groups, key=lambda g: g["label"]):
+        fixed_budget, fixed_target = group["fixed_budget"], group["fixed_target"]
+        if kind == "fixed_budget":
+            budgets = np.array(fixed_budget["budgets"])
+            shown = budgets <= fixed_budget["max_evals"]
+            mean = np.array(fixed_budget["mean"], dtype=float)
+            line, = ax.plot(budgets[shown], mean[shown], label=group["label"])
+            low = np.array(fixed_budget["quantiles"][str(QUANTILES[0])], dtype=float)
+            high = np.array(fixed_budget["quantiles"][str(QUANTILES[-1])], dtype=float)
+            ax.fill_between(budgets[shown], low[shown], high[shown], color=line.get_color(), alpha=0.15)
+            ax.set(xscale="log", xlabel="evaluations", ylabel="best-so-far f(x)")
+        elif kind == "fixed_target":
+            ert = np.array(fixed_target["ert"], dtype=float)
+            reached = np.isfinite(ert)
+            ax.plot(np.array(fixed_target["targets"])[reached], ert[reached], marker=".", label=group["label"])
+            ax.set(yscale="log", xlabel="target f(x)", ylabel="ERT (evaluations)")
+        else:
+            budgets = np.array(fixed_target["budgets"])
+            shown = budgets <= fixed_budget["max_evals"]
+            ax.plot(budgets[shown], np.array(fixed_target["ecdf"])[shown], label=group["label"])
+            ax.set(xscale="log", ylim=(0, 1), xlabel="evaluations", ylabel="fraction of (run, target) pairs")
+
+    titles = {"fixed_budget": "Fixed-budget", "fixed_target": "Fixed-target", "ecdf": "ECDF"}
+    ax.set_title(f"{titles[kind]}: F{fid}, n = {dim}")
+    ax.grid(True, which="both", alpha=0.3)
+    ax.legend(fontsize="small")
+    fig.tight_layout()
+    figure = output_dir / f"f{fid}_DIM{dim}_{kind}.png"
+    fig.savefig(figure, dpi=150)
+    plt.close(fig)
+    return figure
+
+
+def main():
+    """
+    Renders fixed-budget, fixed-target and ECDF plots for every (fid, dim) across all archives in
+    final/data/ into final/doc/analysis/figures/.
+    """
+    parser = argparse.ArgumentParser(description="Plot all IOH output archives without IOHanalyzer.")
+    parser.add_argument("--data", type=Path, default=DATA_DIR, help="directory with the archives")
+    parser.add_argument("--output", type=Path, default=FIGURE_DIR, help="directory of the figures")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1, help="worker processes")
+    parser.add_argument("--cache", type=Path, default=CACHE_DIR, help="directory of the cached curves")
+    parser.add_argument("--force", action="store_true", help="aggregate every archive again, ignoring the cache")
+    parser.add_argument("--clear-cache", action="store_true",
+                        help="delete the cached curves of every archive content not in --data (e.g. of changed archives)")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    by_problem = {}
+    for group in load_curves(args.data, args.jobs, args.force, args.cache, args.clear_cache):
+        by_problem.setdefault((group["fid"], group["dim"]), []).append(group)
+
+    if not by_problem:
+        print(f"No IOH output archives found in '{args.data}'.")
+        return
+
+    output_dir = ensure_dir(args.output)
+    # a figure is only rendered again when its curves changed (or when it is missing)
+    manifest_file = output_dir / "figures.json"
+    manifest = json.loads(manifest_file.read_text()) if manifest_file.exists() else {}
+    tasks, hashes = [], {}
+    for (fid, dim), groups in sorted(by_problem.items()):
+        for kind in ("fixed_budget", "fixed_target", "ecdf"):
+            name = f"f{fid}_DIM{dim}_{kind}.png"
+            hashes[name] = hashlib.sha256(json.dumps([kind, sorted(groups, key=lambda g: g["label"])]).encode()).hexdigest()
+            if args.force or manifest.get(name) != hashes[name] or not (output_dir / name).exists():
+                tasks.append((kind, fid, dim, groups))
+
+    if tasks:
+        with ProcessPoolExecutor(max_workers=max(1, min(args.jobs, len(tasks)))) as pool:
+            list(pool.map(render, *zip(*tasks), [output_dir] * len(tasks)))
+    manifest_file.write_text(json.dumps({**manifest, **hashes}, indent=4))
+    print(f"{len(tasks)} of {len(hashes)} figures rendered to '{output_dir}' in {time.perf_counter() - start:.1f} s.")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,219 @@
+import sys
+from pathlib import Path
+
+# Add the parent directory (code/) to the Python path to enable imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import argparse
+import itertools
+import json
+import os
+import platform
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+
+import ioh
+import numpy as np
+
+from algorithms import Termination, get_algorithm
+from algorithms.termination import target_fitness
+from benchmarks.benchmarks import benchmarked_algorithms
+from utilities.runner import cell_seed
+from utilities.utilities import ensure_dir, git_commit
+
+
+RESULTS_DIR = Path(__file__).parent / "results"
+FIGURE_DIR = Path(__file__).parent.parent.parent / "doc" / "analysis" / "figures"
+
+
+def geometric_dims(low: int, high: int, factor: int = 2) -> list[int]:
+    """ The dimensions low, low * factor, ... up to high. """
+    dims = [low]
+    while dims[-1] * factor <= high:
+        dims.append(dims[-1] * factor)
+    return dims
+
+
+def run_once(name: str, fid: int, dim: int, rep: int, budget: int, seed: int, time_limit: float | None) -> dict:
+    """
+    One run of an algorithm that stops at the known optimum of the problem (its time-to-target),
+    at the budget or at the time limit.
+    """
+    algorithm = get_algorithm(name)(budget=budget)
+    algorithm.termination = Termination(target="optimum", time_limit=time_limit)
+    algorithm.set_seed(cell_seed(seed, fid, 1, dim, rep))
+    problem = ioh.get_problem(fid, 1, dim, ioh.ProblemClass.PBO)
+    start = time.perf_counter()
+    algorithm(problem)
+    wall_seconds = time.perf_counter() - start
+    hit = algorithm.termination.reason == "target"
+    return {
+        "algorithm": name, "fid": fid, "dim": dim, "rep": rep, "budget": budget,
+        "target": target_fitness(problem),
+        "evaluations": problem.state.evaluations,
+        "time_to_target": problem.state.evaluations if hit else None,
+        "best_y": problem.state.current_best.y,
+        "wall_seconds": wall_seconds,
+        "stopped_by": algorithm.termination.reason or "budget",
+    }
+
+
+def summarize(runs: list[dict]) -> list[dict]:
+    """
+    Per (algorithm, fid, dim): the expected running time to the target (ERT: all evaluations
+    spent over the number of runs that hit the target, None without a hit), the success rate
+    and the mean wall time.
+    """
+    groups = {}
+    for run in runs:
+        groups.setdefault((run["algorithm"], run["fid"], run["dim"]), []).append(run)
+    points = []
+    for (name, fid, dim), group in sorted(groups.items()):
+        hits = sum(run["time_to_target"] is not None for run in group)
+        points.append({
+            "algorithm": name, "fid": fid, "dim": dim, "runs": len(group),
+            "success_rate": hits / len(group),
+            "ert": sum(run["evaluations"] for run in group) / hits if hits else None,
+            "wall_seconds": float(np.mean([run["wall_seconds"] for run in group])),
+        })
+    return points
+
+
+def fit_exponents(points: list[dict]) -> list[dict]:
+    """
+    Least-squares fits of log(ERT) and log(wall time) against log(n) per (algorithm, fid): the
+    slope is the empirical runtime exponent b of ~ a * n^b. Only the dimensions where every run hit
+    the target are used for the ERT (the others are censored by the budget or the time limit).
+    """
+    fits = []
+    for (name, fid), group in itertools.groupby(points, key=lambda p: (p["algorithm"], p["fid"])):
+        group = list(group)
+        fit = {"algorithm": name, "fid": fid}
+        for measure in ("ert", "wall_seconds"):
+            used = [p for p in group if p[measure] and (measure != "ert" or p["success_rate"] == 1)]
+            if len(used) >= 2:
+                slope, intercept = np.polyfit(np.log([p["dim"] for p in used]), np.log([p[measure] for p in used]), 1)
+                fit[measure] = {"exponent": float(slope), "constant": float(np.exp(intercept)),
+                                "dims": [p["dim"] for p in used]}
+            else:
+                fit[measure] = None
+        fits.append(fit)
+    return fits
+
+
+def plot(points: list[dict], fits: list[dict], output_dir: Path) -> list[Path]:
+    """ One figure per fid: ERT and wall time against n (log-log) per algorithm, with the fitted power laws. """
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    figures = []
+    for fid in sorted({p["fid"] for p in points}):
+        fig, axes = plt.subplots(1, 2, figsize=(11, 4.5))
+        for name in sorted({p["algorithm"] for p in points if p["fid"] == fid}):
+            group = [p for p in points if p["fid"] == fid and p["algorithm"] == name]
+            fit = next(f for f in fits if f["fid"] == fid and f["algorithm"] == name)
+            for ax, measure in zip(axes, ("ert", "wall_seconds")):
+                shown = [p for p in group if p[measure]]
+                if not shown:
+                    continue
+                label = name
+                if fit[measure]:
+                    label += f" ~ n^{fit[measure]['exponent']:.2f}"
+                line, = ax.plot([p["dim"] for p in shown], [p[measure] for p in shown], "o", label=label)
+                if fit[measure]:
+                    dims = np.array(fit[measure]["dims"], dtype=float)
+                    ax.plot(dims, fit[measure]["constant"] * dims ** fit[measure]["exponent"], "--", color=line.get_color())
+        for ax, ylabel in zip(axes, ("ERT to the optimum (evaluations)", "wall time per run (s)")):
+            ax.set(xscale="log", yscale="log", xlabel="n", ylabel=ylabel)
+            ax.grid(True, which="both", alpha=0.3)
+            ax.legend(fontsize="small")
+        fig.suptitle(f"Scaling: F{fid}")
+        fig.tight_layout()
+        figure = output_dir / f"scaling_f{fid}.png"
+        fig.savefig(figure, dpi=150)
+        plt.close(fig)
+        figures.append(figure)
+    return figures
+
+
+def compare(old: dict, new: dict, tolerance: float = 0.1) -> None:
+    """ Prints the change of every fitted exponent, flagging increases above `tolerance` as regressions. """
+    old_fits = {(f["algorithm"], f["fid"]): f for f in old["fits"]}
+    for fit in new["fits"]:
+        before = old_fits.get((fit["algorithm"], fit["fid"]))
+        for measure in ("ert", "wall_seconds"):
+            if before and before[measure] and fit[measure]:
+                change = fit[measure]["exponent"] - before[measure]["exponent"]
+                flag = "  REGRESSION" if change > tolerance else ""
+                print(f"{fit['algorithm']:>24} f{fit['fid']:<3} {measure:>12}: n^{before[measure]['exponent']:.2f} -> "
+                      f"n^{fit[measure]['exponent']:.2f}{flag}")
+
+
+def main():
+    """
+    Sweeps the dimension geometrically, runs every algorithm on every fid with a budget of
+    budget_factor * n^budget_exponent until the known optimum, and fits and plots the empirical
+    runtime exponents. The results are saved in scaling/results/<commit>.json, the figures in
+    final/doc/analysis/figures/scaling_f<fid>.png.
+    """
+    parser = argparse.ArgumentParser(description="Dimension-scaling study of the algorithms.")
+    parser.add_argument("--algorithms", nargs="+", default=["OnePlusOneEA", "RandomizedLocalSearch"],
+                        choices=sorted(benchmarked_algorithms()))
+    parser.add_argument("--fids", nargs="+", type=int, default=[1, 2])
+    parser.add_argument("--min-dim", type=int, default=16)
+    parser.add_argument("--max-dim", type=int, default=4096)
+    parser.add_argument("--factor", type=int, default=2, help="ratio of consecutive dimensions")
+    parser.add_argument("--budget-factor", type=float, default=50, help="budget = factor * n^exponent")
+    parser.add_argument("--budget-exponent", type=float, default=2)
+    parser.add_argument("--reps", type=int, default=10)
+    parser.add_argument("--time-limit", type=float, default=60, help="seconds per run (0: none)")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--output", type=Path, default=None, help="results file (default: results/<commit>.json)")
+    parser.add_argument("--figures", type=Path, default=FIGURE_DIR)
+    parser.add_argument("--compare", type=Path, default=None, help="earlier results file to compare the exponents with")
+    args = parser.parse_args()
+
+    dims = geometric_dims(args.min_dim, args.max_dim, args.factor)
+    jobs = [(name, fid, dim, rep, int(args.budget_factor * dim ** args.budget_exponent), args.seed, args.time_limit or None)
+            for name, fid, dim, rep in itertools.product(args.algorithms, args.fids, dims, range(args.reps))]
+    print(f"{len(jobs)} runs: {args.algorithms} x f{args.fids} x n = {dims} x {args.reps} repetitions")
+    with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+        runs = list(pool.map(run_once, *zip(*jobs)))
+
+    points = summarize(runs)
+    fits = fit_exponents(points)
+    for p in points:
+        ert = f"{p['ert']:.4g}" if p["ert"] else "-"
+        print(f"{p['algorithm']:>24} f{p['fid']:<3} n={p['dim']:<5} ERT {ert:>10} "
+              f"success {p['success_rate']:.0%} {p['wall_seconds']:.3f} s/run")
+    for fit in fits:
+        exponents = {m: f"n^{fit[m]['exponent']:.2f}" if fit[m] else "-" for m in ("ert", "wall_seconds")}
+        print(f"{fit['algorithm']:>24} f{fit['fid']:<3} ERT ~ {exponents['ert']}, wall time ~ {exponents['wall_seconds']}")
+
+    results = {
+        "meta": {
+            "commit": git_commit(),
+            "date": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "budget": f"{args.budget_factor} * n^{args.budget_exponent}",
+            "time_limit": args.time_limit,
+            "seed": args.seed,
+        },
+        "runs": runs,
+        "points": points,
+        "fits": fits,
+    }
+    output = args.output or ensure_dir(RESULTS_DIR) / f"{results['meta']['commit']}.json"
+    output.write_text(json.dumps(results, indent=4))
+    figures = plot(points, fits, ensure_dir(args.figures))
+    print(f"Results saved to '{output}', {len(figures)} figures to '{args.figures}'.")
+    if args.compare:
+        compare(json.loads(args.compare.read_text()), results)
+
+
+if __name__ == "__main__":
+    main()
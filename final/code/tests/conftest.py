@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# Add the parent directory (code/) to the Python path to enable imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -0,0 +1,43 @@
+import ioh
+import pytest
+
+from algorithms import REGISTRY, Termination, make_algorithm
+
+
+SPECS = [{"class": name} for name in REGISTRY if name not in ("CachedAlgorithm", "Portfolio")] + [
+    {"class": "DesignedGA", "population_size": 10, "islands": 2, "migration_interval": 2},
+    {"class": "CachedAlgorithm", "algorithm": {"class": "DesignedGA"}},
+    {"class": "Portfolio", "algorithms": ["RandomizedLocalSearch", "OnePlusOneEA"], "slice_size": 100},
+]
+
+
+def _run(spec: dict, fid: int = 18, n: int = 30, budget: int = 1000, seed: int = 3):
+    algorithm = make_algorithm(spec, budget)
+    algorithm.termination = Termination(target=None)
+    algorithm.set_seed(seed)
+    problem = ioh.get_problem(fid, 1, n, ioh.ProblemClass.PBO)
+    algorithm(problem)
+    return algorithm, problem.state.evaluations, problem.state.current_best.y
+
+
+@pytest.mark.parametrize("spec", SPECS, ids=lambda spec: spec["class"])
+def test_budget_and_seed(spec):
+    _, evaluations, best = _run(spec)
+    assert 0 < evaluations <= 1000
+    assert _run(spec)[1:] == (evaluations, best)
+
+
+@pytest.mark.parametrize("spec", [spec for spec in SPECS if spec["class"] != "RandomSearch"],
+                         ids=lambda spec: spec["class"])
+def test_stops_at_the_optimum(spec):
+    algorithm = make_algorithm(spec, 20_000)
+    algorithm.set_seed(0)
+    problem = ioh.get_problem(1, 1, 20, ioh.ProblemClass.PBO)
+    algorithm(problem)
+    assert problem.state.optimum_found
+    assert problem.state.evaluations < 20_000
+
+
+def test_invalid_population_size():
+    with pytest.raises(ValueError):
+        make_algorithm({"class": "DesignedGA", "population_size": 21}, 1000)
@@ -0,0 +1,22 @@
+import numpy as np
+import pytest
+
+from algorithms import batch_problems
+
+
+IIDS = [1, 2, 3, 50, 51, 52, 100, 101]
+DIMS = [2, 5, 16, 25, 49, 50, 64, 100, 256, 625]
+
+
+@pytest.mark.parametrize("fid", list(batch_problems.RAW_FITNESS))
+def test_batch_fitness_matches_ioh(fid):
+    assert batch_problems.cross_check([fid], IIDS, DIMS, samples=50) == []
+
+
+def test_batch_problem_counts_evaluations_and_best():
+    problem = batch_problems.get_problem(1, 1, 16)
+    X = np.vstack((np.zeros(16, dtype=np.uint8), np.ones(16, dtype=np.uint8)))
+    fitnesses = problem.evaluate(X)
+    assert problem.state.evaluations == 2
+    assert problem.state.y_unconstrained_best == fitnesses.max()
+    assert problem.state.optimum_found
@@ -0,0 +1,28 @@
+import numpy as np
+import pytest
+
+from algorithms import bitset
+
+
+@pytest.mark.parametrize("n", [1, 5, 63, 64, 65, 100, 256])
+def test_pack_unpack_round_trip(n):
+    X = np.random.default_rng(n).integers(0, 2, size=(20, n), dtype=np.uint8)
+    P = bitset.pack(X)
+    assert P.shape == (20, bitset.n_words(n))
+    assert np.array_equal(bitset.unpack(P, n), X)
+    assert np.array_equal(bitset.popcount(P), X.sum(axis=1))
+
+
+def test_complement_and_hamming():
+    n = 70
+    X = np.random.default_rng(0).integers(0, 2, size=(10, n), dtype=np.uint8)
+    P = bitset.pack(X)
+    assert np.array_equal(bitset.unpack(bitset.complement(P, n), n), 1 - X)
+    assert np.array_equal(bitset.hamming(P, P[::-1]), (X != X[::-1]).sum(axis=1))
+
+
+def test_random_bits_stay_within_n():
+    n = 70
+    P = bitset.random_bits(50, n, np.random.default_rng(0))
+    assert np.array_equal(P & ~bitset.tail_mask(n), np.zeros_like(P))
+    assert np.array_equal(bitset.pack(bitset.unpack(P, n)), P)
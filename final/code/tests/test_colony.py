@@ -0,0 +1,27 @@
+import numpy as np
+
+from algorithms.colony import construct_solutions, init_pheromone, update_pheromone
+
+
+def test_pheromone_limits():
+    tau, tau_min, tau_max = init_pheromone(10, 0.1)
+    assert tau.shape == (10, 2)
+    assert np.all(tau == tau_max)
+    assert tau_min == tau_max / 20
+
+
+def test_update_rewards_the_used_bits_within_the_limits():
+    tau, tau_min, tau_max = init_pheromone(4, 0.5)
+    solution = np.array([1, 0, 1, 1], dtype=np.uint8)
+    for _ in range(20):
+        update_pheromone(tau, solution, 1.0, 0.5, tau_min, tau_max)
+    assert np.all(tau[np.arange(4), solution] == tau_max)
+    assert np.all(tau[np.arange(4), 1 - solution] == tau_min)
+
+
+def test_construct_solutions_follows_the_pheromone():
+    tau = np.array([[1.0, 0.0], [0.0, 1.0], [1.0, 1.0]])
+    X = construct_solutions(tau, 1000, np.random.default_rng(0))
+    assert X.shape == (1000, 3) and X.dtype == np.uint8
+    assert np.all(X[:, 0] == 0) and np.all(X[:, 1] == 1)
+    assert 0.4 < X[:, 2].mean() < 0.6
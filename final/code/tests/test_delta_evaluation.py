@@ -0,0 +1,26 @@
+import ioh
+import numpy as np
+import pytest
+
+from algorithms.delta_evaluation import get_delta_evaluator
+
+
+@pytest.mark.parametrize("fid, n", [(1, 50), (2, 50), (3, 50), (18, 32), (23, 49), (24, 50)])
+def test_flip_fitnesses_match_ioh(fid, n):
+    problem = ioh.get_problem(fid, 1, n, ioh.ProblemClass.PBO)
+    evaluator = get_delta_evaluator(problem)
+    rng = np.random.default_rng(fid)
+    x = rng.integers(0, 2, size=n, dtype=np.uint8)
+    assert evaluator.reset(x) == pytest.approx(problem(x.tolist()), abs=1e-9)
+
+    for i in rng.integers(0, n, size=5): # moving the pivot keeps the state consistent
+        neighbours = np.tile(evaluator.x, (n, 1))
+        neighbours[np.arange(n), np.arange(n)] ^= 1
+        np.testing.assert_allclose(evaluator.flip_fitnesses(), problem(neighbours.tolist()), rtol=0, atol=1e-9)
+        evaluator.flip(int(i))
+        assert evaluator.fitness == pytest.approx(problem(evaluator.x.tolist()), abs=1e-9)
+
+
+def test_unsupported_problems_have_no_evaluator():
+    assert get_delta_evaluator(ioh.get_problem(1, 2, 50, ioh.ProblemClass.PBO)) is None
+    assert get_delta_evaluator(ioh.get_problem(19, 1, 50, ioh.ProblemClass.PBO)) is None
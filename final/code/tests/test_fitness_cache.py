@@ -0,0 +1,50 @@
+import ioh
+import numpy as np
+
+from algorithms import Termination, make_algorithm
+from algorithms.fitness_cache import CachedProblem
+
+
+def _solutions():
+    X = np.random.default_rng(0).integers(0, 2, size=(5, 20), dtype=np.uint8)
+    return np.vstack((X, X[:2], X))
+
+
+def test_hits_are_free_by_default():
+    problem = ioh.get_problem(1, 1, 20, ioh.ProblemClass.PBO)
+    cached = CachedProblem(problem)
+    X = _solutions()
+    assert np.array_equal(cached.evaluate(X), X.sum(axis=1))
+    assert (cached.hits, cached.misses) == (7, 5)
+    assert problem.state.evaluations == 5
+
+
+def test_counted_hits_are_passed_to_the_problem():
+    problem = ioh.get_problem(1, 1, 20, ioh.ProblemClass.PBO)
+    cached = CachedProblem(problem, count_hits=True)
+    X = _solutions()
+    assert np.array_equal(cached.evaluate(X), X.sum(axis=1))
+    assert (cached.hits, cached.misses) == (7, 5)
+    assert problem.state.evaluations == len(X)
+
+
+def test_lru_eviction():
+    cached = CachedProblem(ioh.get_problem(1, 1, 20, ioh.ProblemClass.PBO), max_size=3)
+    cached.evaluate(_solutions()[:5])
+    assert len(cached.cache) == 3
+
+
+def test_cached_algorithm_forwards_the_termination_and_seed():
+    algorithm = make_algorithm({"class": "CachedAlgorithm", "algorithm": {"class": "OnePlusOneEA"}}, 1000)
+    termination = Termination(target=None)
+    algorithm.termination = termination
+    assert algorithm.algorithm.termination is termination
+
+    results = []
+    for _ in range(2):
+        problem = ioh.get_problem(1, 1, 30, ioh.ProblemClass.PBO)
+        algorithm.set_seed(7)
+        algorithm(problem)
+        results.append((problem.state.evaluations, problem.state.current_best.y, algorithm.hits))
+    assert results[0] == results[1]
+    assert results[0][0] <= 1000
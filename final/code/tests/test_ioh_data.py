@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+
+from utilities.ioh_data import P2Quantile, aggregate, iter_runs
+
+
+@pytest.mark.parametrize("p", [0.1, 0.5, 0.9])
+def test_p2_quantile_is_exact_for_few_observations(p):
+    values = np.random.default_rng(0).normal(size=200)
+    estimate = P2Quantile(p, exact_size=1000)
+    for value in values:
+        estimate.add(value)
+    assert estimate.value() == pytest.approx(np.quantile(values, p))
+
+
+@pytest.mark.parametrize("p", [0.1, 0.5, 0.9])
+def test_p2_quantile_approximates_numpy(p):
+    values = np.random.default_rng(1).normal(size=20_000)
+    estimate = P2Quantile(p, exact_size=100)
+    for value in values:
+        estimate.add(value)
+    assert estimate.value() == pytest.approx(np.quantile(values, p), abs=0.05)
+
+
+def test_p2_quantile_without_observations():
+    assert np.isnan(P2Quantile(0.5).value())
+
+
+def test_legacy_info_evals_is_not_the_run_length(tmp_path):
+    # legacy format: "instance:evals|best" gives the evaluation that found the best, the .dat block goes on
+    folder = tmp_path / "ioh-data-RLS"
+    (folder / "data_f18_LABS").mkdir(parents=True)
+    (folder / "IOHprofiler_f18_LABS.info").write_text(
+        'suite = "unknown_suite", funcId = 18, funcName = "LABS", DIM = 10, maximization = "T", algId = "RLS"\n'
+        "%\n"
+        "data_f18_LABS/IOHprofiler_f18_DIM10.dat, 1:3|2.0, 1:2|3.0\n")
+    header = '"function evaluation" "current f(x)" "best-so-far f(x)" "current af(x)+b" "best af(x)+b"\n'
+    (folder / "data_f18_LABS" / "IOHprofiler_f18_DIM10.dat").write_text(
+        header + "1 1.0 1.0 1.0 1.0\n3 2.0 2.0 2.0 2.0\n1001 1.5 2.0 1.5 2.0\n"
+        + header + "1 1.0 1.0 1.0 1.0\n2 3.0 3.0 3.0 3.0\n501 2.5 3.0 2.5 3.0\n")
+
+    runs = list(iter_runs(folder))
+    assert [(run.instance, run.evals) for run in runs] == [(1, 1001), (1, 501)]
+    assert [run.evaluations.tolist() for run in runs] == [[1, 3, 1001], [1, 2, 501]]
+
+    curves = aggregate(folder, budgets=[1, 10, 1000], targets=[2.0, 3.0])[("RLS", 18, 10)]
+    # target 3 is hit by the second run only, after the first one used all of its 1001 evaluations
+    assert curves["fixed_target"]["ert"].tolist() == [(3 + 2) / 2, 1001 + 2]
+    assert curves["fixed_budget"]["max_evals"] == 1001
@@ -0,0 +1,38 @@
+import ioh
+import numpy as np
+
+from algorithms import make_algorithm
+from algorithms.islands import merge_epoch, split_budget
+from test_algorithms import _run
+
+
+def test_islands_use_the_whole_budget():
+    assert sum(split_budget(1001, 3)) == 1001
+    algorithm, evaluations, best = _run({"class": "DesignedGA", "population_size": 10, "islands": 3}, budget=1001)
+    assert algorithm.island_evaluations == 1001
+    assert 0 < evaluations < 1001 # only the improvements are evaluated on the logged problem
+    assert algorithm.run_attributes == ("island_evaluations",)
+
+
+def test_islands_log_only_improvements():
+    algorithm = make_algorithm({"class": "DesignedGA", "population_size": 10, "islands": 2}, 2000)
+    logged = []
+    algorithm.add_evaluation_hook(lambda X, fitnesses: logged.extend(fitnesses))
+    algorithm.set_seed(0)
+    algorithm(ioh.get_problem(18, 1, 30, ioh.ProblemClass.PBO))
+    assert len(logged) > 1
+    assert all(b > a for a, b in zip(logged, logged[1:]))
+
+
+def test_merge_epoch_interleaves_round_robin():
+    # island 0: 3 evaluations, improving at 0 and 2; island 1: 2 evaluations, improving at 0 and 1
+    # merged order: (0, 0) (1, 0) (0, 1) (1, 1) (0, 2)
+    positions, islands, indices = merge_epoch([3, 2], [np.array([0, 2]), np.array([0, 1])],
+                                              [np.array([1.0, 5.0]), np.array([2.0, 3.0])], best=-np.inf)
+    assert positions.tolist() == [0, 1, 3, 4]
+    assert islands.tolist() == [0, 1, 1, 0]
+    assert indices.tolist() == [0, 0, 1, 1]
+    # improvements that do not beat the best of the merged run so far are dropped
+    positions, _, _ = merge_epoch([3, 2], [np.array([0, 2]), np.array([0, 1])],
+                                  [np.array([1.0, 5.0]), np.array([2.0, 3.0])], best=4.0)
+    assert positions.tolist() == [4]
@@ -0,0 +1,48 @@
+import ioh
+import numpy as np
+import pytest
+
+from algorithms import Algorithm, Termination
+from algorithms.local_search import TOLERANCE, LocalSearch
+
+
+def _search(local_search: LocalSearch, fid: int, n: int, seed: int = 0, budget: int = 100_000):
+    algorithm = Algorithm(budget)
+    algorithm.termination = Termination(target=None)
+    algorithm.set_seed(seed)
+    problem = ioh.get_problem(fid, 1, n, ioh.ProblemClass.PBO)
+    algorithm.start_run(problem)
+    start = np.random.default_rng(seed).integers(0, 2, size=n, dtype=np.uint8)
+    solution, fitness = local_search(algorithm, problem, start)
+    return problem, solution, fitness
+
+
+def _is_local_optimum(fid: int, solution: np.ndarray, fitness: float) -> bool:
+    n = len(solution)
+    problem = ioh.get_problem(fid, 1, n, ioh.ProblemClass.PBO)
+    neighbours = np.tile(solution, (n, 1))
+    neighbours[np.arange(n), np.arange(n)] ^= 1
+    return max(problem(neighbours.tolist())) <= fitness + TOLERANCE
+
+
+# 1, 2, 3, 18, 23 and 24 have delta evaluators, 19 (Ising ring) does not
+@pytest.mark.parametrize("fid, n", [(1, 40), (2, 40), (3, 40), (18, 30), (19, 40), (23, 25), (24, 40)])
+@pytest.mark.parametrize("local_search", [
+    LocalSearch(), LocalSearch("first"), LocalSearch("first", dont_look=True),
+    LocalSearch("first", randomize=True, dont_look=True), LocalSearch("first", dont_look=True, charge_lookups=False),
+], ids=repr)
+def test_result_is_a_one_flip_local_optimum(local_search, fid, n):
+    _, solution, fitness = _search(local_search, fid, n)
+    assert fitness == ioh.get_problem(fid, 1, n, ioh.ProblemClass.PBO)(solution.tolist())
+    assert _is_local_optimum(fid, solution, fitness)
+
+
+def test_dont_look_bits_save_lookups_on_separable_problems():
+    lookups = [_search(LocalSearch("first", dont_look=dont_look), 24, 200)[0].state.evaluations
+               for dont_look in (False, True)]
+    assert lookups[1] < lookups[0]
+
+
+def test_search_stops_at_the_budget():
+    problem, _, _ = _search(LocalSearch("first", dont_look=True), 18, 30, budget=50)
+    assert problem.state.evaluations == 50
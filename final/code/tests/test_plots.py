@@ -0,0 +1,22 @@
+import ioh
+
+from algorithms import make_algorithm
+from plots.plots import content_hash, load_curves
+from utilities.runner import run_experiment
+
+
+def test_curves_are_cached_and_outdated_entries_cleared(tmp_path):
+    data = tmp_path / "data"
+    run_experiment(make_algorithm({"class": "OnePlusOneEA"}, 200), [1], [1], [10], 2, ioh.ProblemClass.PBO,
+                   data, "ioh-data-test", seed=0, zip_output=False)
+    cache = tmp_path / "cache"
+    cache.mkdir()
+    (cache / "outdated.json").write_text("[]")
+
+    curves = load_curves(data, n_jobs=1, cache_dir=cache)
+    assert [(c["fid"], c["dim"], c["fixed_budget"]["runs"]) for c in curves] == [(1, 10, 2)]
+    assert (cache / f"{content_hash(data / 'ioh-data-test')}.json").exists()
+    assert (cache / "outdated.json").exists()
+
+    assert load_curves(data, n_jobs=1, cache_dir=cache, clear=True) == curves
+    assert [p.name for p in cache.iterdir()] == [f"{content_hash(data / 'ioh-data-test')}.json"]
@@ -0,0 +1,9 @@
+from test_algorithms import _run
+
+
+def test_portfolio_accounts_for_every_evaluation():
+    algorithm, evaluations, _ = _run({"class": "Portfolio", "algorithms": ["RandomizedLocalSearch", "OnePlusOneEA"],
+                                      "slice_size": 100, "restart_stagnation": 200})
+    assert evaluations == 1000
+    assert sum(algorithm.member_evaluations) == evaluations
+    assert sum(algorithm.restarts) > 0
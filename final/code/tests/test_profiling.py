@@ -0,0 +1,18 @@
+import time
+
+from algorithms.profiling import PhaseProfiler
+
+
+def test_nested_phases_are_excluded_from_self_time():
+    profiler = PhaseProfiler()
+    with profiler.phase("generation"):
+        time.sleep(0.01)
+        for _ in range(2):
+            with profiler.phase("evaluate"):
+                time.sleep(0.01)
+    summary = profiler.summary()
+    assert summary["evaluate"]["calls"] == 2
+    assert summary["generation"]["calls"] == 1
+    generation = summary["generation"]
+    assert generation["seconds"] >= summary["evaluate"]["seconds"]
+    assert abs(generation["seconds"] - generation["self_seconds"] - summary["evaluate"]["seconds"]) < 1e-9
@@ -0,0 +1,24 @@
+import numpy as np
+
+from algorithms.random_source import RandomSource
+
+
+def _draws(rng):
+    return ([rng.random() for _ in range(10)], rng.random((3, 4)).tolist(),
+            [rng.integers(5) for _ in range(10)], [rng.integers(2, 7) for _ in range(10)])
+
+
+def test_same_seed_same_values():
+    assert _draws(RandomSource(3)) == _draws(RandomSource(3))
+    assert _draws(RandomSource(3)) != _draws(RandomSource(4))
+
+
+def test_values_are_in_range_across_blocks():
+    rng = RandomSource(0, block_size=16)
+    uniforms = np.array([rng.random() for _ in range(100)] + rng.random(50).tolist())
+    assert ((uniforms >= 0) & (uniforms < 1)).all()
+    integers = np.array([rng.integers(2, 7) for _ in range(100)])
+    assert integers.min() >= 2 and integers.max() < 7
+    assert set(integers) == {2, 3, 4, 5, 6}
+    # the other Generator methods are forwarded
+    assert rng.binomial(10, 0.5, size=3).shape == (3,)
@@ -0,0 +1,27 @@
+import ioh
+import numpy as np
+
+from algorithms import make_algorithm
+from utilities.ioh_data import iter_runs
+from utilities.results_store import ResultsStore
+from utilities.runner import run_experiment
+
+
+def test_store_keeps_the_runs_of_an_archive(tmp_path):
+    algorithm = make_algorithm({"class": "RandomizedLocalSearch"}, 300)
+    archive = run_experiment(algorithm, [1, 2], [1], [10], 2, ioh.ProblemClass.PBO, tmp_path, "ioh-data-RLS",
+                             seed=0, zip_output=False)
+    store = ResultsStore(tmp_path / "store")
+    assert store.add_archive(archive) == 4
+    assert store.add_archive(archive) == 0 # added before
+
+    store = ResultsStore(tmp_path / "store") # read back from disk
+    rows = store.select(algorithm=algorithm.name, parameters="RLS", fid=2)
+    assert len(rows) == 2 and sorted(rows["rep"]) == [0, 1]
+    expected = [run for run in iter_runs(archive) if run.fid == 2]
+    for row, run, original in zip(rows, store.iter_runs(rows), expected):
+        assert np.array_equal(run.evaluations, original.evaluations)
+        assert np.array_equal(run.raw_y, original.raw_y)
+        assert row["best_y"] == original.raw_y.max()
+    assert len(store.select(fid=[1, 2], dim=10)) == 4
+    assert len(store.select(algorithm="MaxMinAS")) == 0
@@ -0,0 +1,70 @@
+import ioh
+import pytest
+
+from algorithms import make_algorithm
+from utilities.runner import config_hash, load_manifest, run_experiment
+
+
+def _hash(spec: dict) -> str:
+    return config_hash(make_algorithm(spec, 1000), ioh.ProblemClass.PBO)
+
+
+def test_config_hash_is_stable():
+    spec = {"class": "DesignedGA", "population_size": 44, "mutation_rate": 0.01}
+    assert _hash(spec) == _hash(spec)
+
+
+def test_config_hash_differs_for_nested_algorithms():
+    # the parameters of a wrapped algorithm are part of the configuration
+    cached = [_hash({"class": "CachedAlgorithm", "algorithm": {"class": "DesignedGA", "population_size": size}})
+              for size in (20, 44)]
+    assert cached[0] != cached[1]
+
+    portfolios = [_hash({"class": "Portfolio", "algorithms": ["OnePlusOneEA", member]})
+                  for member in ("RandomizedLocalSearch", {"class": "OnePlusOneEA", "mutation": "fast"})]
+    assert portfolios[0] != portfolios[1]
+    assert portfolios[0] == _hash({"class": "Portfolio", "algorithms": ["OnePlusOneEA", "RandomizedLocalSearch"]})
+
+
+def test_config_hash_depends_on_termination_and_logger():
+    algorithm = make_algorithm({"class": "OnePlusOneEA"}, 1000)
+    base = config_hash(algorithm, ioh.ProblemClass.PBO)
+    assert config_hash(algorithm, ioh.ProblemClass.PBO, logger={"triggers": ["improvement"]}) != base
+    algorithm.termination.stagnation = 100
+    assert config_hash(algorithm, ioh.ProblemClass.PBO) != base
+
+
+def _experiment(output, **kwargs):
+    algorithm = make_algorithm({"class": "OnePlusOneEA"}, 200)
+    return run_experiment(algorithm, [1, 2], [1], [10], 2, ioh.ProblemClass.PBO, output, "ioh-data-test",
+                          seed=1, zip_output=False, **kwargs)
+
+
+def _dat_files(folder):
+    return {path.relative_to(folder): path.read_text() for path in sorted(folder.rglob("*.dat"))}
+
+
+def test_resume_skips_the_cells_in_the_manifest(tmp_path):
+    cache = tmp_path / "cache"
+    first = _experiment(tmp_path / "a", cache_dir=cache)
+    lines = (cache / "manifest.jsonl").read_text().splitlines()
+    assert len(lines) == len(load_manifest(cache)) == 4
+
+    second = _experiment(tmp_path / "b", cache_dir=cache)
+    assert (cache / "manifest.jsonl").read_text().splitlines() == lines # no cell was run again
+    assert _dat_files(first) == _dat_files(second) == _dat_files(_experiment(tmp_path / "c"))
+
+
+def test_shards_share_the_cache(tmp_path):
+    cache = tmp_path / "cache"
+    assert _experiment(tmp_path / "a", cache_dir=cache, shard=(0, 2)) is None
+    assert len(load_manifest(cache)) == 2
+    assert _experiment(tmp_path / "a", cache_dir=cache, shard=(1, 2)) is None
+    assert len(load_manifest(cache)) == 4
+
+    assembled = _experiment(tmp_path / "a", cache_dir=cache)
+    assert len(load_manifest(cache)) == 4
+    assert _dat_files(assembled) == _dat_files(_experiment(tmp_path / "b"))
+
+    with pytest.raises(ValueError):
+        _experiment(tmp_path / "c", shard=(0, 2))
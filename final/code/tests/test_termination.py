@@ -0,0 +1,65 @@
+import subprocess
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import ioh
+
+from algorithms import Termination
+from algorithms.termination import known_optimum, target_fitness
+
+
+def _state(best, evaluations, optimum_found=False):
+    return SimpleNamespace(y_unconstrained_best=best, evaluations=evaluations, optimum_found=optimum_found)
+
+
+def test_target_optimum_uses_the_known_optimum():
+    problem = ioh.get_problem(1, 1, 20, ioh.ProblemClass.PBO)
+    assert target_fitness(problem) == known_optimum(1, 20) == 20
+    termination = Termination()
+    termination.start(problem)
+    assert not termination.should_stop(_state(19, 10))
+    assert termination.should_stop(_state(19, 10, optimum_found=True))
+    assert termination.reason == "target"
+
+
+def test_target_value_and_no_target():
+    problem = ioh.get_problem(18, 1, 20, ioh.ProblemClass.PBO)
+    termination = Termination(target=3.0)
+    termination.start(problem)
+    assert not termination.should_stop(_state(2.9, 10))
+    assert termination.should_stop(_state(3.0, 11))
+
+    termination = Termination(target=None)
+    termination.start(problem)
+    assert not termination.should_stop(_state(1e9, 10, optimum_found=True))
+    assert termination.reason is None
+
+
+def test_stagnation_counts_evaluations_since_the_last_improvement():
+    termination = Termination(target=None, stagnation=100)
+    termination.start(ioh.get_problem(1, 1, 20, ioh.ProblemClass.PBO))
+    assert not termination.should_stop(_state(5, 10))
+    assert not termination.should_stop(_state(6, 50))
+    assert not termination.should_stop(_state(6, 149))
+    assert termination.should_stop(_state(6, 150))
+    assert termination.reason == "stagnation"
+
+
+def test_time_limit_and_restart():
+    termination = Termination(target=None, time_limit=0.01)
+    problem = ioh.get_problem(1, 1, 20, ioh.ProblemClass.PBO)
+    termination.start(problem)
+    time.sleep(0.02)
+    assert termination.should_stop(_state(5, 10))
+    assert termination.reason == "time_limit"
+    termination.start(problem) # a new run resets the criteria
+    assert termination.reason is None
+    assert not termination.should_stop(_state(5, 10))
+
+
+def test_legacy_script_runs_standalone():
+    # original_GA.py uses target_fitness, and is still run on its own from algorithms/
+    algorithms_dir = Path(__file__).parent.parent / "algorithms"
+    subprocess.run([sys.executable, "original_GA.py"], cwd=algorithms_dir, check=True, timeout=120)
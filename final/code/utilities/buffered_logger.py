@@ -0,0 +1,195 @@
+import importlib.metadata
+import json
+import queue
+import threading
+from pathlib import Path
+
+import ioh
+import numpy as np
+
+from .utilities import ensure_dir
+
+
+def log_grid(budget: int, points_per_decade: int = 20) -> set[int]:
+    """ Log-spaced evaluation numbers from 1 to budget, e.g. for the "log_grid" trigger. """
+    decades = max(np.log10(max(budget, 1)), 1)
+    return set(np.unique(np.geomspace(1, max(budget, 1), int(decades * points_per_decade) + 1).round().astype(int)).tolist())
+
+
+def make_triggers(triggers, budget: int | None = None) -> list:
+    """
+    IOH triggers from names: "improvement" (every strict improvement of the best-so-far),
+    "delta_improvement" (the default of ioh.logger.Analyzer), "log_grid" (log-spaced
+    evaluation numbers up to the budget) and "always". IOH trigger objects are kept as they are.
+    """
+    made = []
+    for trigger in triggers:
+        if trigger == "improvement":
+            made.append(ioh.logger.trigger.ON_IMPROVEMENT)
+        elif trigger == "delta_improvement":
+            made.append(ioh.logger.trigger.ON_DELTA_IMPROVEMENT)
+        elif trigger == "always":
+            made.append(ioh.logger.trigger.ALWAYS)
+        elif trigger == "log_grid":
+            if budget is None:
+                raise ValueError("The log_grid trigger needs the budget of the runs.")
+            made.append(ioh.logger.trigger.At(log_grid(budget)))
+        elif isinstance(trigger, str):
+            raise ValueError(f"Unknown trigger: {trigger}")
+        else:
+            made.append(trigger)
+    return made
+
+
+class BufferedLogger(ioh.logger.AbstractLogger):
+    """
+    Drop-in replacement for `ioh.logger.Analyzer` that keeps the logged records of a run in
+    memory and writes them in large blocks, optionally from a background thread, instead of
+    line by line. Its output (IOHprofiler_f*.json and data_f*/IOHprofiler_f*_DIM*.dat) has the
+    layout and the "evaluations raw_y" format of the Analyzer, so IOHanalyzer,
+    `runner.merge_ioh_folders` and `ioh_data` read it the same way.
+
+    Call `end_run(problem)` before `problem.reset()` to record the exact number of evaluations
+    and the best solution of the run (as the Analyzer does); without it they are taken from the
+    logged records.
+
+    Args:
+        triggers: Trigger names or IOH triggers (see `make_triggers`); a record is logged when any of them fires.
+        budget: Budget of the runs, needed by the "log_grid" trigger.
+        block_size: Number of buffered records at which they are written out during a run.
+        background: If True, the records are formatted and written by a background thread.
+    """
+    def __init__(self, root: str | Path = "./", folder_name: str = "ioh_data", algorithm_name: str = "algorithm_name",
+                 algorithm_info: str = "algorithm_info", triggers=("improvement", "log_grid"),
+                 budget: int | None = None, block_size: int = 1 << 16, background: bool = True):
+        self._triggers = make_triggers(triggers, budget) # referenced here, IOH does not keep them alive
+        super().__init__(self._triggers, [])
+        self.folder = ensure_dir(Path(root) / folder_name)
+        self.algorithm_name = algorithm_name
+        self.algorithm_info = algorithm_info
+        self.block_size = block_size
+        self.infos = {}     # fid -> contents of its IOHprofiler_f*.json
+        self._meta = None   # meta data of the problem of the current run
+        self._run_attributes = [] # (object, attribute names) logged with every run
+        self._new_run()
+
+        self._queue = queue.Queue(maxsize=64) if background else None
+        self._writer = threading.Thread(target=self._write_blocks, daemon=True) if background else None
+        if self._writer is not None:
+            self._writer.start()
+
+    def _new_run(self) -> None:
+        self._evaluations = []
+        self._raw_y = []
+        self._best = {"evals": 0, "y": -np.inf, "x": []}
+        self._last = 0        # last logged evaluation of the run
+        self._started = False # whether the header of the run was written
+        self._ended = False
+
+    def _close_run(self) -> None:
+        # a run that ended without `end_run`: its end is the last logged evaluation
+        if self._meta is not None and not self._ended and self._last > 0:
+            self._end_run(self._last)
+
+    def attach_problem(self, meta_data) -> None:
+        # also called by problem.reset(), i.e. at the end of every run
+        self._close_run()
+        super().attach_problem(meta_data)
+        self._meta = {
+            "fid": meta_data.problem_id,
+            "name": meta_data.name,
+            "dim": meta_data.n_variables,
+            "instance": meta_data.instance,
+            "maximization": meta_data.optimization_type == ioh.OptimizationType.MAX,
+        }
+        self._new_run()
+
+    def __call__(self, log_info) -> None:
+        self._evaluations.append(log_info.evaluations)
+        self._raw_y.append(log_info.raw_y)
+        self._last = log_info.evaluations
+        if log_info.raw_y_best != self._best["y"]:
+            self._best = {"evals": log_info.evaluations, "y": log_info.raw_y_best, "x": []}
+        if len(self._evaluations) >= self.block_size:
+            self._flush()
+
+    def add_run_attributes(self, obj, attributes: list[str]) -> None:
+        """ Log the given attributes of obj with every run (at its end), as `ioh.logger.Analyzer` does. """
+        self._run_attributes.append((obj, list(attributes)))
+
+    def _dat_path(self) -> str:
+        meta = self._meta
+        return f"data_f{meta['fid']}_{meta['name']}/IOHprofiler_f{meta['fid']}_DIM{meta['dim']}.dat"
+
+    def _flush(self) -> None:
+        block = (self.folder / self._dat_path(), not self._started, self._evaluations, self._raw_y)
+        self._started = True
+        self._evaluations, self._raw_y = [], []
+        if self._queue is not None:
+            self._queue.put(block)
+        else:
+            self._write(*block)
+
+    @staticmethod
+    def _write(path: Path, header: bool, evaluations: list[int], raw_y: list[float]) -> None:
+        lines = "".join(f"{e} {y:.10f}\n" for e, y in zip(evaluations, raw_y))
+        ensure_dir(path.parent)
+        with open(path, "a") as file:
+            file.write(("evaluations raw_y\n" if header else "") + lines)
+
+    def _write_blocks(self) -> None:
+        while (block := self._queue.get()) is not None:
+            self._write(*block)
+
+    def end_run(self, problem: ioh.problem.PBO) -> None:
+        """
+        Closes the current run with the exact evaluations, last value and best solution of the problem.
+        """
+        state = problem.state
+        if state.evaluations == 0:
+            return
+        if self._last != state.evaluations:
+            # the last evaluation is always written, as the Analyzer does
+            self._evaluations.append(state.evaluations)
+            self._raw_y.append(state.current_internal.y)
+        best = state.current_best_internal.y
+        evals = self._best["evals"] if best == self._best["y"] else state.evaluations
+        self._best = {"evals": evals, "y": best, "x": [int(v) for v in state.current_best.x]}
+        self._end_run(state.evaluations)
+
+    def _end_run(self, evaluations: int) -> None:
+        meta = self._meta
+        self._flush()
+        self._ended = True
+        info = self.infos.setdefault(meta["fid"], {
+            "version": importlib.metadata.version("ioh"),
+            "suite": "unknown_suite",
+            "function_id": meta["fid"],
+            "function_name": meta["name"],
+            "maximization": meta["maximization"],
+            "algorithm": {"name": self.algorithm_name, "info": self.algorithm_info},
+            "attributes": ["evaluations", "raw_y"],
+            "scenarios": [],
+        })
+        scenarios = [s for s in info["scenarios"] if s["dimension"] == meta["dim"]]
+        if not scenarios:
+            scenarios = [{"dimension": meta["dim"], "path": self._dat_path(), "runs": []}]
+            info["scenarios"].append(scenarios[0])
+        run = {"instance": meta["instance"], "evals": evaluations, "best": self._best}
+        for obj, attributes in self._run_attributes:
+            info.setdefault("run_attributes", [])
+            for name in attributes:
+                if name not in info["run_attributes"]:
+                    info["run_attributes"].append(name)
+                run[name] = getattr(obj, name)
+        scenarios[0]["runs"].append(run)
+
+    def close(self) -> None:
+        """ Writes the remaining records and the .json info files. """
+        self._close_run()
+        if self._writer is not None:
+            self._queue.put(None)
+            self._writer.join()
+            self._writer = None
+        for fid, info in self.infos.items():
+            (self.folder / f"IOHprofiler_f{fid}_{info['function_name']}.json").write_text(json.dumps(info, indent=4))
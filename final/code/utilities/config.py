@@ -1,5 +1,4 @@
-from algorithms import RandomSearch, MaxMinAS, DesignedGA, ACO, MaxMinASStar
-import math
+import math # used by the commented configurations below (1/math.sqrt(DIMENSION))
 import ioh
 
 
@@ -9,18 +8,38 @@ DIMENSION = 100   # problem dimension/size (e.g., number of bits for OneMax and
 REPETITIONS = 10  # number of independent repetitions or runs for each problem
 PROBLEM_IDS = [1, 2, 3, 18, 23, 24, 25]   # problem IDs to be used in the experiments (e.g., 1 -> OneMax, 2 -> LeadingOnes, etc.)
 PROBLEMS_TYPE = ioh.ProblemClass.PBO  # Pseudo-Boolean Optimization problems
+N_JOBS = 1        # number of worker processes for the experiment runner (1 -> serial, -1 -> all cpus)
+SEED = None       # experiment seed; with a seed every (fid, iid, dim, rep) run is reproducible, also in parallel
+# stopping criteria on top of the budget (see algorithms/termination.py): stop at the known optimum of
+# the problem ("target": "optimum"), after `stagnation` evaluations without improvement, or after `time_limit`
+# seconds per run; by default every run uses its whole budget
+TERMINATION = {"target": None, "stagnation": None, "time_limit": None}
+# None logs every improvement with ioh.logger.Analyzer; a dict of BufferedLogger options (see
+# utilities/buffered_logger.py) buffers the records in memory, e.g. only improvements and a log-spaced grid:
+# LOGGER = {"triggers": ["improvement", "log_grid"], "background": True}
+LOGGER = None
+# if True, every finished (algorithm config, fid, iid, dim, rep, seed) run is kept in final/doc/data/.cells/, so a
+# rerun of main.py skips the runs done before and only runs new or changed configurations
+RESUME = False
+PROFILE = False   # if True, time every run per phase and write ioh-data-<name>.profile.json next to its output
 
-# a list of algorithm instances to run 
+# a list of algorithm configurations to run: the class name in the algorithm registry (algorithms/registry.py)
+# and its constructor arguments; every algorithm gets the budget BUDGET
+# (algorithms, parameters, fids, dims, ... can also be given on the command line, see python main/main.py --help)
 ALGORITHMS = [
-    # MaxMinASStar(budget=BUDGET, evaporate_rate=1),
-    # MaxMinASStar(budget=BUDGET, evaporate_rate=1/math.sqrt(DIMENSION)),
-    # MaxMinASStar(budget=BUDGET, evaporate_rate=1/DIMENSION),
-    # MaxMinAS(budget=BUDGET, evaporate_rate=1),
-    # MaxMinAS(budget=BUDGET, evaporate_rate=1/math.sqrt(DIMENSION)),
-    # MaxMinAS(budget=BUDGET, evaporate_rate=1/DIMENSION),
-    RandomSearch(budget=BUDGET),
-    # OnePlusOneEA(budget=BUDGET),
-    # # RandomizedLocalSearch(budget=BUDGET),
-    DesignedGA(budget=BUDGET, population_size=44, mutation_rate=0.01),
-    # ACO(budget=BUDGET)
-]
\ No newline at end of file
+    # {"class": "MaxMinASStar", "evaporate_rate": 1},
+    # {"class": "MaxMinASStar", "evaporate_rate": 1/math.sqrt(DIMENSION)},
+    # {"class": "MaxMinASStar", "evaporate_rate": 1/DIMENSION},
+    # {"class": "MaxMinAS", "evaporate_rate": 1},
+    # {"class": "MaxMinAS", "evaporate_rate": 1/math.sqrt(DIMENSION)},
+    # {"class": "MaxMinAS", "evaporate_rate": 1/DIMENSION},
+    {"class": "RandomSearch"},
+    # {"class": "OnePlusOneEA"},
+    # # {"class": "RandomizedLocalSearch"},
+    {"class": "DesignedGA", "population_size": 44, "mutation_rate": 0.01},
+    # {"class": "OnePlusLambdaLambdaGA"},
+    # {"class": "MuPlusLambdaGA", "population_size": 10, "offspring_size": 20},
+    # {"class": "ACO"},
+    # {"class": "Portfolio", "algorithms": ["RandomizedLocalSearch", "OnePlusOneEA", "MaxMinASStar",
+    #                                       {"class": "DesignedGA", "population_size": 44, "mutation_rate": 0.01}]},
+]
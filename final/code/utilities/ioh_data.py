@@ -0,0 +1,387 @@
+"""
+Streaming reader and aggregators for IOH (Analyzer) output, read straight from the zip
+archives in final/data/ or from output folders such as ideas/my-experiment-notebook/run/.
+
+Runs are read one at a time (one `evaluations raw_y` block of a .dat file), so the memory
+used by the aggregators below does not grow with the number of runs of an archive:
+
+    for run in iter_runs("final/data/ioh-data-CustomACO.zip"):
+        ...
+
+    curves = aggregate("final/data/ioh-data-CustomACO.zip", budgets=[10, 100, 1000], targets=[50, 100])
+    curves[("CustomACO", 1, 100)]["fixed_target"]["ert"]
+
+Both the current format (IOHprofiler_f*.json + .dat with header "evaluations raw_y") and the
+legacy format (IOHprofiler_f*.info + .dat with header "function evaluation" ...) are supported.
+"""
+import io
+import json
+import re
+import zipfile
+from pathlib import Path, PurePosixPath
+from typing import Iterator, NamedTuple
+
+import numpy as np
+
+
+class Run(NamedTuple):
+    algorithm: str
+    fid: int
+    function_name: str
+    dim: int
+    instance: int | None
+    maximization: bool
+    evals: int              # evaluations used by the run (logged or not)
+    evaluations: np.ndarray # evaluation numbers of the logged lines
+    raw_y: np.ndarray       # fitness of the logged lines
+
+
+class _Source:
+    """ Uniform read access to the files of a zip archive or of a directory. """
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self._zip = zipfile.ZipFile(self.path) if self.path.suffix == ".zip" else None
+
+    def names(self) -> list[str]:
+        if self._zip is not None:
+            return [name for name in self._zip.namelist() if not name.endswith("/")]
+        return [p.relative_to(self.path).as_posix() for p in sorted(self.path.rglob("*")) if p.is_file()]
+
+    def open(self, name: str) -> io.TextIOBase:
+        if self._zip is not None:
+            return io.TextIOWrapper(self._zip.open(name), encoding="utf-8")
+        return open(self.path / name, encoding="utf-8")
+
+    def close(self) -> None:
+        if self._zip is not None:
+            self._zip.close()
+
+
+def _iter_blocks(stream: io.TextIOBase) -> Iterator[np.ndarray]:
+    """
+    Yields the blocks (runs) of a .dat file one at a time, as float arrays with one row per
+    logged line. A block starts at every header line (a line that does not start with a digit).
+    """
+    lines = []
+    for line in stream:
+        if line[:1].isdigit():
+            lines.append(line)
+        elif line.strip():
+            if lines:
+                yield _to_array(lines)
+            lines = []
+    if lines:
+        yield _to_array(lines)
+
+
+def _to_array(lines: list[str]) -> np.ndarray:
+    columns = len(lines[0].split())
+    return np.array("".join(lines).split(), dtype=float).reshape(-1, columns)
+
+
+def _json_scenarios(source: _Source, name: str) -> Iterator[tuple[dict, str, list[tuple[int | None, int]]]]:
+    """ (meta data, .dat path, [(instance, evals) per run]) of every dimension of a .json info file. """
+    with source.open(name) as stream:
+        info = json.load(stream)
+    meta = {
+        "algorithm": info["algorithm"]["name"],
+        "fid": info["function_id"],
+        "function_name": info["function_name"],
+        "maximization": info["maximization"],
+    }
+    for scenario in info["scenarios"]:
+        runs = [(run["instance"], run["evals"]) for run in scenario["runs"]]
+        yield {**meta, "dim": scenario["dimension"]}, scenario["path"], runs
+
+
+_INFO_FIELD = re.compile(r'(\w+)\s*=\s*"?([^",]*)"?')
+
+
+def _info_scenarios(source: _Source, name: str) -> Iterator[tuple[dict, str, list[tuple[int | None, int]]]]:
+    """ Same as `_json_scenarios` for a legacy .info file (a header, a comment and a data line per dimension). """
+    with source.open(name) as stream:
+        lines = [line.strip() for line in stream if line.strip()]
+    for header, data in zip(lines[0::3], lines[2::3]):
+        fields = dict(_INFO_FIELD.findall(header))
+        path, *runs = [part.strip() for part in data.split(",")]
+        meta = {
+            "algorithm": fields["algId"],
+            "fid": int(fields["funcId"]),
+            "function_name": fields["funcName"],
+            "maximization": fields.get("maximization", "T") == "T",
+            "dim": int(fields["DIM"]),
+        }
+        # every run is written as "instance:evals|best", where evals is the evaluation that found the best (not
+        # the length of the run, which `_runs_of` takes from the .dat block)
+        yield meta, path, [(int(run.split(":")[0]), int(run.split(":")[1].split("|")[0])) for run in runs]
+
+
+_DAT_NAME = re.compile(r"IOHprofiler_f(\d+)_DIM(\d+)\.dat$")
+
+
+def iter_runs(path: str | Path, problems: set[tuple[int, int]] | None = None) -> Iterator[Run]:
+    """
+    Yields every run of an IOH output archive (.zip) or folder, one run at a time.
+    Nested output folders (e.g. several ioh-data-* folders in one zip) are all read. A .dat file
+    without an info file next to it is still read, with the fid and dimension of its file name.
+
+    Args:
+        path: A zip archive or a directory.
+        problems: If given, only the runs of these (fid, dim) are read (the other .dat files are skipped).
+    """
+    source = _Source(path)
+    try:
+        names = source.names()
+        described = set()
+        for name in names:
+            parent = PurePosixPath(name).parent
+            if name.endswith(".json") and PurePosixPath(name).name.startswith("IOHprofiler_"):
+                scenarios = _json_scenarios(source, name)
+            elif name.endswith(".info"):
+                scenarios = _info_scenarios(source, name)
+            else:
+                continue
+            for meta, dat_path, runs in scenarios:
+                dat_name = (parent / dat_path).as_posix()
+                described.add(dat_name)
+                if problems is not None and (meta["fid"], meta["dim"]) not in problems:
+                    continue
+                if dat_name in names:
+                    yield from _runs_of(source, dat_name, meta, runs)
+
+        for name in names:
+            match = _DAT_NAME.search(name)
+            if match and name not in described and (problems is None or (int(match[1]), int(match[2])) in problems):
+                meta = {"algorithm": PurePosixPath(name).parent.parent.name or str(path), "fid": int(match[1]),
+                        "function_name": "", "maximization": True, "dim": int(match[2])}
+                yield from _runs_of(source, name, meta, None)
+    finally:
+        source.close()
+
+
+def _runs_of(source: _Source, dat_name: str, meta: dict, runs: list[tuple[int | None, int]] | None) -> Iterator[Run]:
+    with source.open(dat_name) as stream:
+        for i, block in enumerate(_iter_blocks(stream)):
+            instance, evals = runs[i] if runs is not None and i < len(runs) else (None, 0)
+            evals = max(evals, int(block[-1, 0])) # the last logged evaluation ends the run at the earliest
+            yield Run(evals=evals, instance=instance, evaluations=block[:, 0].astype(np.int64),
+                      raw_y=block[:, 1], **meta)
+
+
+def best_so_far(run: Run) -> np.ndarray:
+    """ The best fitness so far at every logged line of a run (in the direction of the problem). """
+    return np.maximum.accumulate(run.raw_y) if run.maximization else np.minimum.accumulate(run.raw_y)
+
+
+class P2Quantile:
+    """
+    Streaming estimate of one quantile with the P-square algorithm (Jain & Chlamtac, 1985).
+    The first `exact_size` observations are kept and give the exact quantile; after that only
+    five markers are kept, whatever the number of observations.
+    """
+    def __init__(self, p: float, exact_size: int = 1000):
+        self.p = p
+        self.exact_size = max(exact_size, 5)
+        self.values = [] # the observations, until there are more than exact_size of them
+        self.heights = None
+        self.increments = np.array([0, p / 2, p, (1 + p) / 2, 1])
+
+    def _start_markers(self) -> None:
+        values = np.sort(self.values)
+        self.desired = 1 + (len(values) - 1) * self.increments
+        self.positions = np.round(self.desired)
+        self.heights = values[self.positions.astype(np.int64) - 1].tolist()
+        self.values = None
+
+    def add(self, x: float) -> None:
+        if self.heights is None:
+            self.values.append(x)
+            if len(self.values) > self.exact_size:
+                self._start_markers()
+            return
+        q = self.heights
+        if x < q[0]:
+            q[0] = x
+        elif x > q[4]:
+            q[4] = x
+        k = 0 if x < q[1] else 1 if x < q[2] else 2 if x < q[3] else 3
+        self.positions[k + 1:] += 1
+        self.desired += self.increments
+
+        n = self.positions
+        for i in (1, 2, 3):
+            d = self.desired[i] - n[i]
+            if (d >= 1 and n[i + 1] - n[i] > 1) or (d <= -1 and n[i - 1] - n[i] < -1):
+                d = 1.0 if d > 0 else -1.0
+                # piecewise parabolic prediction, linear if it would break the ordering of the markers
+                h = q[i] + d / (n[i + 1] - n[i - 1]) * ((n[i] - n[i - 1] + d) * (q[i + 1] - q[i]) / (n[i + 1] - n[i])
+                                                        + (n[i + 1] - n[i] - d) * (q[i] - q[i - 1]) / (n[i] - n[i - 1]))
+                if not q[i - 1] < h < q[i + 1]:
+                    j = i + int(d)
+                    h = q[i] + d * (q[j] - q[i]) / (n[j] - n[i])
+                q[i] = h
+                n[i] += d
+
+    def value(self) -> float:
+        if self.heights is not None:
+            return self.heights[2]
+        return float(np.quantile(self.values, self.p)) if self.values else float("nan")
+
+
+class FixedBudget:
+    """
+    Mean, standard deviation and quantiles over runs of the best fitness so far at fixed budgets.
+    A run that stopped before a budget (e.g. at the optimum) keeps its final best fitness.
+    """
+    def __init__(self, budgets, quantiles=(0.1, 0.5, 0.9)):
+        self.budgets = np.asarray(budgets, dtype=np.int64)
+        self.quantiles = tuple(quantiles)
+        self.runs = 0
+        self.max_evals = 0 # evaluations of the longest run
+        self._count = np.zeros(len(self.budgets))
+        self._sum = np.zeros(len(self.budgets))
+        self._sum_squares = np.zeros(len(self.budgets))
+        self._estimators = [[P2Quantile(p) for p in self.quantiles] for _ in self.budgets]
+
+    def add(self, run: Run) -> None:
+        best = best_so_far(run)
+        # index of the last logged line at or before every budget (-1: nothing logged yet)
+        idx = np.searchsorted(run.evaluations, self.budgets, side="right") - 1
+        values = np.where(idx >= 0, best[np.maximum(idx, 0)], np.nan)
+        known = ~np.isnan(values)
+        self.runs += 1
+        self.max_evals = max(self.max_evals, run.evals)
+        self._count += known
+        self._sum += np.where(known, values, 0)
+        self._sum_squares += np.where(known, values ** 2, 0)
+        for i in np.flatnonzero(known):
+            for estimator in self._estimators[i]:
+                estimator.add(values[i])
+
+    def result(self) -> dict:
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = self._sum / self._count
+            std = np.sqrt(np.maximum(self._sum_squares / self._count - mean ** 2, 0))
+        return {
+            "budgets": self.budgets,
+            "mean": mean,
+            "std": std,
+            "quantiles": {p: np.array([row[j].value() for row in self._estimators]) for j, p in enumerate(self.quantiles)},
+            "runs": self.runs,
+            "max_evals": self.max_evals,
+        }
+
+
+class FixedTarget:
+    """
+    Expected running time (ERT), success rate, and ECDF over budgets of the first hitting times
+    of fixed targets. ERT(target) = evaluations of all runs until they hit the target (or of the
+    whole run if they never do) divided by the number of runs that hit it.
+    The ECDF at budget b is the fraction of (run, target) pairs with a hitting time <= b.
+    """
+    def __init__(self, targets, budgets):
+        self.targets = np.asarray(targets, dtype=float)
+        self.budgets = np.asarray(budgets, dtype=np.int64)
+        self.runs = 0
+        self._spent = np.zeros(len(self.targets))
+        self._successes = np.zeros(len(self.targets), dtype=np.int64)
+        self._hits = np.zeros((len(self.targets), len(self.budgets)), dtype=np.int64)
+
+    def add(self, run: Run) -> None:
+        best = best_so_far(run)
+        if run.maximization:
+            first = np.searchsorted(best, self.targets, side="left") # best is non-decreasing
+        else:
+            first = np.searchsorted(-best, -self.targets, side="left")
+        hit = first < len(best)
+        hitting_times = np.where(hit, run.evaluations[np.minimum(first, len(best) - 1)], np.iinfo(np.int64).max)
+        self.runs += 1
+        self._spent += np.where(hit, hitting_times, run.evals)
+        self._successes += hit
+        self._hits += hitting_times[:, None] <= self.budgets[None, :]
+
+    def result(self) -> dict:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ert = np.where(self._successes > 0, self._spent / self._successes, np.inf)
+        return {
+            "targets": self.targets,
+            "budgets": self.budgets,
+            "ert": ert,
+            "success_rate": self._successes / max(self.runs, 1),
+            "ecdf": self._hits.sum(axis=0) / max(self.runs * len(self.targets), 1),
+            "ecdf_per_target": self._hits / max(self.runs, 1),
+            "runs": self.runs,
+        }
+
+
+def problems_of(path: str | Path) -> list[tuple[int, int]]:
+    """ The (fid, dim) of the .dat files of an archive or folder, from their names (nothing else is read). """
+    source = _Source(path)
+    try:
+        return sorted({(int(match[1]), int(match[2])) for match in map(_DAT_NAME.search, source.names()) if match})
+    finally:
+        source.close()
+
+
+def aggregate(path: str | Path, budgets, targets, quantiles=(0.1, 0.5, 0.9),
+              problems: set[tuple[int, int]] | None = None) -> dict[tuple[str, int, int], dict]:
+    """
+    Streams all runs of an archive or folder once and aggregates them per (algorithm, fid, dim).
+
+    Args:
+        budgets: Evaluation budgets of the fixed-budget curves and of the ECDF.
+        targets: Fitness targets of the ERTs and of the ECDF, or a function (fid, dim) -> targets.
+        problems: If given, only the runs of these (fid, dim) are aggregated (see `iter_runs`).
+
+    Returns:
+        dict: For every (algorithm, fid, dim), the merged results of `FixedBudget` and `FixedTarget`
+            ("fixed_budget" and "fixed_target").
+    """
+    groups = {}
+    for run in iter_runs(path, problems):
+        key = (run.algorithm, run.fid, run.dim)
+        if key not in groups:
+            group_targets = targets(run.fid, run.dim) if callable(targets) else targets
+            groups[key] = (FixedBudget(budgets, quantiles), FixedTarget(group_targets, budgets))
+        for aggregator in groups[key]:
+            aggregator.add(run)
+    return {key: {"fixed_budget": fixed_budget.result(), "fixed_target": fixed_target.result()}
+            for key, (fixed_budget, fixed_target) in groups.items()}
+
+
+def log_budgets(max_budget: int, points: int = 50) -> np.ndarray:
+    """ Log-spaced budgets from 1 to max_budget (without duplicates), for fixed-budget curves and ECDFs. """
+    return np.unique(np.geomspace(1, max_budget, points).round().astype(np.int64))
+
+
+def main():
+    """
+    Prints, for every (algorithm, fid, dim) of the given archives or folders, the number of runs,
+    the mean final best fitness, and the success rate and ERT of reaching the known optimum.
+    """
+    import argparse
+    import sys
+    sys.path.insert(0, str(Path(__file__).parent.parent))
+    from algorithms.termination import known_optimum
+
+    parser = argparse.ArgumentParser(description="Summarise IOH output archives (.zip) or folders.")
+    parser.add_argument("paths", nargs="+", type=Path)
+    parser.add_argument("--max-budget", type=int, default=100_000)
+    args = parser.parse_args()
+
+    def optimum(fid: int, dim: int) -> list[float]:
+        target = known_optimum(fid, dim)
+        return [np.inf if target is None else target]
+
+    for path in args.paths:
+        print(f"=========== {path} ==========")
+        budgets = log_budgets(args.max_budget)
+        for (algorithm, fid, dim), result in sorted(aggregate(path, budgets, optimum).items()):
+            fixed_budget, fixed_target = result["fixed_budget"], result["fixed_target"]
+            print(f"{algorithm:>28} f{fid:<3} n={dim:<5} runs={fixed_budget['runs']:<5} "
+                  f"final mean={fixed_budget['mean'][-1]:>10.3f} "
+                  f"success={fixed_target['success_rate'][0]:>5.2f} ERT={fixed_target['ert'][0]:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+"""
+Compact binary store for the runs of IOH output archives (the ioh-data-<algorithm> folders
+and zips written by main.py).
+
+The logged evaluation counts and fitness values of all runs are concatenated in two binary
+column files, which are memory-mapped when read, and an index holds one row per run keyed by
+(algorithm, parameters, fid, iid, dim, rep) with the offsets of the run in the columns:
+
+    store = ResultsStore("final/data/store")
+    store.add_archive("final/data/ioh-data-MaxMinAS-0.01.zip")     # parameters "MaxMinAS-0.01"
+    rows = store.select(algorithm="MaxMinAS", fid=18)               # only reads the index
+    for row, run in zip(rows, store.iter_runs(rows, columns=("raw_y",))):
+        ...                                                         # only the raw_y pages are read
+
+`iter_runs` yields `ioh_data.Run` tuples, so the aggregators of ioh_data work on a store as well.
+"""
+import json
+import os
+from pathlib import Path
+from typing import Iterator
+
+import numpy as np
+
+from .ioh_data import Run, iter_runs
+from .utilities import ensure_dir
+
+
+INDEX_DTYPE = np.dtype([
+    ("algorithm", np.int32),  # code into strings["algorithm"]
+    ("parameters", np.int32), # code into strings["parameters"]
+    ("fid", np.int32),
+    ("iid", np.int32),
+    ("dim", np.int32),
+    ("rep", np.int32),
+    ("start", np.int64),      # first row of the run in the column files
+    ("length", np.int64),     # number of logged rows of the run
+    ("evals", np.int64),      # evaluations used by the run
+    ("best_y", np.float64),   # best fitness of the run
+    ("maximization", np.bool_),
+])
+
+COLUMNS = {"evaluations": np.uint32, "raw_y": np.float64} # budgets stay far below 2^32 evaluations
+
+
+class ResultsStore:
+    """
+    A directory with the column files (evaluations.bin, raw_y.bin), the run index (index.npy)
+    and the string tables of the index (strings.json).
+    """
+    def __init__(self, root: str | Path):
+        self.root = ensure_dir(root)
+        index_file = self.root / "index.npy"
+        self.index = np.load(index_file) if index_file.exists() else np.empty(0, dtype=INDEX_DTYPE)
+        strings_file = self.root / "strings.json"
+        self.strings = json.loads(strings_file.read_text()) if strings_file.exists() else \
+            {"algorithm": [], "parameters": [], "sources": []}
+        self._columns = {}
+
+    def _code(self, table: str, value: str) -> int:
+        values = self.strings[table]
+        if value not in values:
+            values.append(value)
+        return values.index(value)
+
+    def add_archive(self, path: str | Path, parameters: str | dict | None = None) -> int:
+        """
+        Converts an IOH output archive (.zip) or folder and appends its runs to the store.
+        An archive that was added before (same file name) is skipped.
+
+        Args:
+            parameters: Label of the parameter setting of the runs, e.g. {"evaporate_rate": 0.01}.
+                By default the archive name without "ioh-data-", e.g. "MaxMinAS-0.01".
+
+        Returns:
+            int: The number of runs added.
+        """
+        path = Path(path)
+        source = path.stem if path.suffix == ".zip" else path.name
+        if source in self.strings["sources"]:
+            return 0
+        if parameters is None:
+            parameters = source.removeprefix("ioh-data-")
+        elif isinstance(parameters, dict):
+            parameters = json.dumps(parameters, sort_keys=True)
+
+        rows = []
+        start = self._rows_in_columns()
+        reps = {} # runs so far per (algorithm, parameters, fid, iid, dim), including earlier archives
+        files = {name: open(self.root / f"{name}.bin", "ab") for name in COLUMNS}
+        try:
+            for run in iter_runs(path):
+                algorithm, params = self._code("algorithm", run.algorithm), self._code("parameters", parameters)
+                iid = -1 if run.instance is None else run.instance
+                key = (algorithm, params, run.fid, iid, run.dim)
+                if key not in reps:
+                    reps[key] = int(np.count_nonzero(
+                        (self.index["algorithm"] == algorithm) & (self.index["parameters"] == params) &
+                        (self.index["fid"] == run.fid) & (self.index["iid"] == iid) & (self.index["dim"] == run.dim)))
+                if len(run.evaluations) and run.evaluations[-1] > np.iinfo(COLUMNS["evaluations"]).max:
+                    raise ValueError(f"{path}: evaluation counts do not fit in {np.dtype(COLUMNS['evaluations'])}")
+                best = run.raw_y.max() if run.maximization else run.raw_y.min()
+                rows.append((*key, reps[key], start, len(run.raw_y), run.evals, best, run.maximization))
+                reps[key] += 1
+                start += len(run.raw_y)
+                run.evaluations.astype(COLUMNS["evaluations"]).tofile(files["evaluations"])
+                run.raw_y.astype(COLUMNS["raw_y"]).tofile(files["raw_y"])
+        finally:
+            for file in files.values():
+                file.close()
+
+        self.index = np.concatenate((self.index, np.array(rows, dtype=INDEX_DTYPE)))
+        self.strings["sources"].append(source)
+        self._save_index()
+        self._columns = {} # the column files grew, map them again
+        return len(rows)
+
+    def _rows_in_columns(self) -> int:
+        file = self.root / "raw_y.bin"
+        return file.stat().st_size // np.dtype(COLUMNS["raw_y"]).itemsize if file.exists() else 0
+
+    def _save_index(self) -> None:
+        # written to temporary files first, so an interrupted conversion leaves the old index intact
+        with open(self.root / "index.tmp.npy", "wb") as file:
+            np.save(file, self.index)
+        (self.root / "strings.tmp.json").write_text(json.dumps(self.strings, indent=4))
+        os.replace(self.root / "index.tmp.npy", self.root / "index.npy")
+        os.replace(self.root / "strings.tmp.json", self.root / "strings.json")
+
+    def column(self, name: str) -> np.ndarray:
+        """ A column file, memory-mapped (read-only) the first time it is used. """
+        if name not in self._columns:
+            file = self.root / f"{name}.bin"
+            if not file.exists() or file.stat().st_size == 0:
+                self._columns[name] = np.empty(0, dtype=COLUMNS[name])
+            else:
+                self._columns[name] = np.memmap(file, dtype=COLUMNS[name], mode="r")
+        return self._columns[name]
+
+    def select(self, algorithm: str | list[str] | None = None, parameters: str | dict | list | None = None,
+               fid: int | list[int] | None = None, iid: int | list[int] | None = None,
+               dim: int | list[int] | None = None, rep: int | list[int] | None = None) -> np.ndarray:
+        """
+        The index rows of the runs matching all given keys (a value or a list of values per key;
+        None matches everything). Only the index is read.
+        """
+        mask = np.ones(len(self.index), dtype=bool)
+        for field, values in (("algorithm", algorithm), ("parameters", parameters)):
+            if values is None:
+                continue
+            values = values if isinstance(values, list) else [values]
+            values = [json.dumps(v, sort_keys=True) if isinstance(v, dict) else v for v in values]
+            codes = [self.strings[field].index(v) for v in values if v in self.strings[field]]
+            mask &= np.isin(self.index[field], codes)
+        for field, values in (("fid", fid), ("iid", iid), ("dim", dim), ("rep", rep)):
+            if values is not None:
+                mask &= np.isin(self.index[field], values)
+        return self.index[mask]
+
+    def algorithm(self, row: np.void) -> str:
+        return self.strings["algorithm"][row["algorithm"]]
+
+    def parameters(self, row: np.void) -> str:
+        return self.strings["parameters"][row["parameters"]]
+
+    def iter_runs(self, rows: np.ndarray, columns: tuple[str, ...] = ("evaluations", "raw_y")) -> Iterator[Run]:
+        """
+        Yields the given index rows as `ioh_data.Run` tuples whose arrays are views into the
+        memory-mapped columns. Columns that are not asked for are not read (and are None).
+        """
+        mapped = {name: self.column(name) for name in columns}
+        for row in rows:
+            start, stop = row["start"], row["start"] + row["length"]
+            yield Run(
+                algorithm=self.algorithm(row), fid=int(row["fid"]), function_name="", dim=int(row["dim"]),
+                instance=int(row["iid"]), maximization=bool(row["maximization"]), evals=int(row["evals"]),
+                evaluations=mapped["evaluations"][start:stop] if "evaluations" in mapped else None,
+                raw_y=mapped["raw_y"][start:stop] if "raw_y" in mapped else None,
+            )
+
+
+def main():
+    """
+    Converts IOH output archives or folders into a results store, e.g. from final/code/:
+        python -m utilities.results_store ../data/store ../data/ioh-data-*.zip
+    """
+    import argparse
+    parser = argparse.ArgumentParser(description="Convert IOH output archives into a compact results store.")
+    parser.add_argument("store", type=Path)
+    parser.add_argument("paths", nargs="+", type=Path)
+    args = parser.parse_args()
+
+    store = ResultsStore(args.store)
+    for path in args.paths:
+        print(f"{path}: {store.add_archive(path)} runs added")
+    print(f"The store '{args.store}' holds {len(store.index)} runs.")
+
+
+if __name__ == "__main__":
+    main()
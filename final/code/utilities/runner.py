@@ -0,0 +1,312 @@
+import copy
+import hashlib
+import itertools
+import json
+import os
+import shutil
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+import ioh
+import numpy as np
+
+from .buffered_logger import BufferedLogger
+from .utilities import ensure_dir
+
+
+def make_cells(fids: list[int], iids: list[int], dims: list[int], reps: int) -> list[tuple[int, int, int, int]]:
+    """
+    Lists the (fid, iid, dim, rep) cells of an experiment in the order a serial
+    `ioh.Experiment` runs them.
+    """
+    return [(fid, iid, dim, rep) for (fid, iid, dim), rep in itertools.product(itertools.product(fids, iids, dims), range(reps))]
+
+
+def cell_seed(seed: int, fid: int, iid: int, dim: int, rep: int) -> int:
+    """
+    Derives the random seed of a single cell from the experiment seed, so that every
+    cell gets the same random stream regardless of which process runs it.
+    """
+    return int(np.random.SeedSequence([seed, fid, iid, dim, rep]).generate_state(1)[0])
+
+
+_SKIP = object() # marks the parameter values that are left out of the hash
+
+
+def _describe(value):
+    """
+    JSON-ready description of a parameter value: plain values as they are, lists, tuples and dicts
+    element by element, objects with their own repr (e.g. a LocalSearch) by it, and algorithms (e.g.
+    the one wrapped by a CachedAlgorithm) by their class and parameters. Other objects (the stopping
+    criteria, a profiler, ...) are left out, as their default repr holds a memory address.
+    """
+    if isinstance(value, (int, float, str, bool, type(None))):
+        return value
+    if isinstance(value, (list, tuple)):
+        return [repr(v) if d is _SKIP else d for v, d in ((v, _describe(v)) for v in value)]
+    if isinstance(value, dict):
+        return {str(k): repr(v) if d is _SKIP else d for k, v, d in ((k, v, _describe(v)) for k, v in value.items())}
+    if type(value).__repr__ is not object.__repr__:
+        return repr(value)
+    if hasattr(value, "budget") and hasattr(value, "algorithm_info"): # a nested algorithm
+        return {"class": type(value).__qualname__, "parameters": _parameters(value)}
+    return _SKIP
+
+
+def _parameters(obj) -> dict:
+    described = {k: _describe(v) for k, v in vars(obj).items() if not k.startswith("_")}
+    return {k: v for k, v in described.items() if v is not _SKIP}
+
+
+def config_hash(algorithm, problem_class: ioh.ProblemClass, logger: dict | None = None) -> str:
+    """
+    Hash of everything that determines the output of an algorithm's runs: its class, name and
+    info, its public parameters (nested algorithms with their class and parameters), its stopping
+    criteria, the problem class and the logger options.
+    """
+    termination = algorithm.termination
+    config = {
+        "class": type(algorithm).__qualname__,
+        "parameters": _parameters(algorithm),
+        "termination": [termination.target, termination.stagnation, termination.time_limit],
+        "problem_class": str(problem_class),
+        "logger": logger,
+    }
+    return hashlib.sha256(json.dumps(config, sort_keys=True, default=repr).encode()).hexdigest()[:16]
+
+
+def load_manifest(cache_dir: Path) -> dict[tuple, dict]:
+    """
+    The completed cells recorded in `<cache_dir>/manifest.jsonl`, keyed by (config hash, fid, iid, dim, rep, seed).
+    """
+    manifest_file = Path(cache_dir) / "manifest.jsonl"
+    manifest = {}
+    if manifest_file.exists():
+        for line in manifest_file.read_text().splitlines():
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError: # the last line of an interrupted write
+                continue
+            manifest[tuple(entry["key"])] = entry
+    return manifest
+
+
+def run_cell(algorithm, cell: tuple[int, int, int, int], problem_class: ioh.ProblemClass,
+             logger_root: str | Path, folder_name: str, seed: int | None = None,
+             profile: bool = False, logger: dict | None = None) -> tuple[Path, dict | None]:
+    """
+    Runs one repetition of an algorithm on one problem, logging to its own folder.
+
+    Args:
+        algorithm: The algorithm instance (copied, so the caller's instance is not modified).
+        cell: The (fid, iid, dim, rep) to run.
+        problem_class: The IOH problem class of the fid.
+        logger_root: Directory in which the cell's logger folder is created.
+        folder_name: Name of the cell's logger folder.
+        seed: Experiment seed; if given, the algorithm gets a random stream seeded from (seed, fid, iid, dim, rep).
+        profile: If True, the run is profiled per phase (see `Algorithm.enable_profiling`).
+        logger: Options of a `BufferedLogger` (e.g. {"triggers": ["improvement", "log_grid"]}) to log
+            with instead of `ioh.logger.Analyzer`; None uses the Analyzer.
+
+    Returns:
+        tuple: Path of the folder with the cell's IOH output, and the run's profile summary (None without profiling).
+    """
+    fid, iid, dim, rep = cell
+    algorithm = copy.deepcopy(algorithm)
+    if seed is not None:
+        algorithm.set_seed(cell_seed(seed, fid, iid, dim, rep))
+    if profile:
+        algorithm.enable_profiling()
+
+    problem = ioh.get_problem(fid, iid, dim, problem_class)
+    logger_options = dict(
+        root=str(logger_root),
+        folder_name=folder_name,
+        algorithm_name=algorithm.name,
+        algorithm_info=algorithm.algorithm_info,
+    )
+    if logger is None:
+        logger = ioh.logger.Analyzer(**logger_options)
+    else:
+        logger = BufferedLogger(**logger_options, **{"budget": algorithm.budget, **logger})
+    if algorithm.run_attributes:
+        logger.add_run_attributes(algorithm, list(algorithm.run_attributes))
+    problem.attach_logger(logger)
+    start = time.perf_counter()
+    algorithm(problem)
+    wall_seconds = time.perf_counter() - start
+
+    summary = None
+    if profile:
+        phases = algorithm.profiler.summary()
+        summary = {
+            "fid": fid, "iid": iid, "dim": dim, "rep": rep,
+            "evaluations": problem.state.evaluations,
+            "best_y": problem.state.current_best.y,
+            "wall_seconds": wall_seconds,
+            "stopped_by": algorithm.termination.reason or "budget",
+            # time spent outside every profiled phase (loop overhead, bookkeeping, ...)
+            "unaccounted_seconds": wall_seconds - sum(p["self_seconds"] for p in phases.values()),
+            "phases": phases,
+        }
+    if isinstance(logger, BufferedLogger):
+        logger.end_run(problem)
+    problem.reset()
+    logger.close()
+    return Path(logger_root) / folder_name, summary
+
+
+def merge_ioh_folders(sources: list[Path], target: Path) -> Path:
+    """
+    Merges IOH (Analyzer) output folders into a single IOHanalyzer-compatible folder.
+
+    Runs are appended in the order of `sources`: the runs of every scenario (dimension) of
+    the .json info files are concatenated, and so are the .dat files they point to.
+
+    Returns:
+        The target folder.
+    """
+    ensure_dir(target)
+    for source in sources:
+        for info_file in sorted(Path(source).glob("*.json")):
+            data_in = json.loads(info_file.read_text())
+            target_info = target / info_file.name
+            if target_info.exists():
+                data_out = json.loads(target_info.read_text())
+                for scenario in data_in["scenarios"]:
+                    matches = [s for s in data_out["scenarios"] if s["dimension"] == scenario["dimension"]]
+                    if matches:
+                        matches[0]["runs"].extend(scenario["runs"])
+                    else:
+                        data_out["scenarios"].append(scenario)
+            else:
+                data_out = data_in
+            target_info.write_text(json.dumps(data_out, indent=4))
+
+            for scenario in data_in["scenarios"]:
+                source_dat = Path(source) / scenario["path"]
+                target_dat = target / scenario["path"]
+                ensure_dir(target_dat.parent)
+                with open(source_dat) as dat_in, open(target_dat, "a") as dat_out:
+                    shutil.copyfileobj(dat_in, dat_out)
+    return target
+
+
+def run_experiment(algorithm,
+                   fids: list[int],
+                   iids: list[int],
+                   dims: list[int],
+                   reps: int,
+                   problem_class: ioh.ProblemClass,
+                   output_directory: str | Path,
+                   folder_name: str,
+                   n_jobs: int = 1,
+                   seed: int | None = None,
+                   zip_output: bool = True,
+                   profile: bool = False,
+                   logger: dict | None = None,
+                   cache_dir: str | Path | None = None,
+                   shard: tuple[int, int] | None = None) -> Path | None:
+    """
+    Runs an algorithm on every (fid, iid, dim, rep) cell, spreading the cells over a
+    process pool, and merges the output into a single `folder_name` folder (and zip)
+    in `output_directory`, like `ioh.Experiment` does.
+
+    Every cell is logged to its own temporary folder, and the folders are merged in cell
+    order. With a seed, every cell is seeded from (seed, fid, iid, dim, rep), so the merged
+    output is identical for any number of jobs.
+
+    Args:
+        n_jobs: Number of worker processes; 1 runs the cells in this process, -1 uses all cpus.
+        seed: Experiment seed; None leaves the random state unseeded.
+        profile: If True, every run is profiled per phase and the per-run summaries are written
+            to `<folder>.profile.json` next to the output folder.
+        logger: Options of a `BufferedLogger` for every run (see `run_cell`); None logs with the ioh Analyzer.
+        cache_dir: If given, the output of every cell is kept in `<cache_dir>/<config hash>/` and recorded
+            in `<cache_dir>/manifest.jsonl` under (config hash, fid, iid, dim, rep, seed) (see `config_hash`).
+            Cells recorded there are not run again, so an interrupted sweep resumes where it stopped and
+            only new or changed configurations are run; the output folder is then assembled again from
+            all cells (replacing an earlier one). None runs every cell in a temporary folder.
+        shard: (index, count) to run only the cells whose position in the cell order is index modulo
+            count, e.g. in one of count independent processes or machines sharing the `cache_dir`
+            (which is required). The output is not assembled; once all shards are done, a call
+            without a shard assembles it from the cached cells (without running any).
+
+    Returns:
+        Path of the merged output folder (None for a shard).
+    """
+    if shard is not None and cache_dir is None:
+        raise ValueError("Sharded experiments need a cache_dir shared by the shards.")
+    out_base = ensure_dir(output_directory)
+    target = out_base / folder_name
+    cells = make_cells(fids, iids, dims, reps)
+    if n_jobs == -1:
+        n_jobs = os.cpu_count() or 1
+
+    if cache_dir is None:
+        idx = 1
+        while target.exists():  # never merge into the output of an earlier experiment
+            target = out_base / f"{folder_name}-{idx}"
+            idx += 1
+        cell_root = ensure_dir(out_base / f".tmp-{target.name}")
+        keys = [None] * len(cells)
+        folders = [f"cell-{i}" for i in range(len(cells))]
+        manifest = {}
+    else:
+        config = config_hash(algorithm, problem_class, logger)
+        cell_root = ensure_dir(Path(cache_dir) / config)
+        keys = [(config, *cell, seed) for cell in cells]
+        folders = [f"cell-{fid}-{iid}-{dim}-{rep}-seed{seed}" for fid, iid, dim, rep in cells]
+        manifest = load_manifest(cache_dir)
+
+    # cells recorded in the manifest are not run again (unless their profile is missing)
+    todo = [i for i, key in enumerate(keys)
+            if key not in manifest or (profile and manifest[key]["summary"] is None)]
+    results = {i: (cell_root / folders[i], manifest[key]["summary"]) for i, key in enumerate(keys) if i not in todo}
+    if shard is not None:
+        todo = [i for i in todo if i % shard[1] == shard[0]]
+    if cache_dir is not None:
+        print(f"{len(cells) - len(todo)} of {len(cells)} cells of {folder_name} done before, {len(todo)} to run.")
+
+    def record(i: int, result: tuple[Path, dict | None]) -> None:
+        results[i] = result
+        if cache_dir is not None: # appended as soon as the cell is done, so an interrupted sweep can resume
+            with open(Path(cache_dir) / "manifest.jsonl", "a") as manifest_file:
+                manifest_file.write(json.dumps({"key": keys[i], "folder": folders[i], "summary": result[1]}) + "\n")
+
+    try:
+        for i in todo:
+            shutil.rmtree(cell_root / folders[i], ignore_errors=True) # output of an interrupted run
+        jobs = {i: (algorithm, cells[i], problem_class, cell_root, folders[i], seed, profile, logger) for i in todo}
+        if n_jobs == 1:
+            for i, job in jobs.items():
+                record(i, run_cell(*job))
+        elif jobs:
+            with ProcessPoolExecutor(max_workers=n_jobs) as pool:
+                futures = {pool.submit(run_cell, *job): i for i, job in jobs.items()}
+                for future in as_completed(futures):
+                    record(futures[future], future.result())
+
+        if shard is not None:
+            return None
+
+        cell_folders, summaries = zip(*(results[i] for i in range(len(cells))))
+        if cache_dir is not None:
+            shutil.rmtree(target, ignore_errors=True) # assembled from the cached cells again
+        merge_ioh_folders(cell_folders, target)
+    finally:
+        if cache_dir is None:
+            shutil.rmtree(cell_root, ignore_errors=True)
+
+    if profile:
+        profile_file = out_base / f"{target.name}.profile.json"
+        profile_file.write_text(json.dumps({
+            "algorithm_name": algorithm.name,
+            "algorithm_info": algorithm.algorithm_info,
+            "runs": list(summaries),
+        }, indent=4))
+
+    if zip_output:
+        shutil.make_archive(str(target), "zip", str(target))
+    return target
@@ -0,0 +1,296 @@
+"""
+Racing-based parameter tuning of the algorithms (F-race or successive halving).
+
+Candidate configurations of an `Algorithm` subclass are run on a stream of (fid, iid, dim, seed)
+tuning instances. After every block of instances, the candidates are ranked per instance and
+the candidates that are statistically dominated by the best one (Friedman test followed by
+paired permutation tests on the ranks, as in F-race) are dropped, so that most of the budget is
+spent on the good candidates:
+
+    result = race(MaxMinAS, {"evaporate_rate": [1, 0.1, 0.01], "number_of_ants": [10, 20]},
+                  budget=10000, fids=[1, 2, 18], dims=[50], seeds=10, n_jobs=-1)
+    print(result["best"], result["runs"], result["grid_runs"])
+
+The parameter space maps constructor arguments to a list of values, or to a range (low, high) or
+(low, high, "log") from which `candidates` configurations are sampled.
+"""
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import ioh
+import numpy as np
+
+from algorithms import batch_problems
+
+
+def sample_candidates(space: dict[str, list | tuple], candidates: int | None = None,
+                      seed: int | None = None) -> list[dict]:
+    """
+    The candidate configurations of a parameter space: the full grid if every parameter has a
+    list of values and `candidates` is None, otherwise `candidates` random configurations
+    (ranges are sampled uniformly, or log-uniformly with "log"; integer bounds give integers).
+    """
+    if candidates is None:
+        if any(isinstance(values, tuple) for values in space.values()):
+            raise ValueError("A parameter space with ranges needs a number of candidates.")
+        return [dict(zip(space, values)) for values in itertools.product(*space.values())]
+
+    rng = np.random.default_rng(seed)
+    sampled = []
+    for _ in range(candidates):
+        config = {}
+        for name, values in space.items():
+            if isinstance(values, list):
+                config[name] = values[rng.integers(len(values))]
+                continue
+            low, high, *scale = values
+            if scale == ["log"]:
+                value = float(np.exp(rng.uniform(np.log(low), np.log(high))))
+            else:
+                value = float(rng.uniform(low, high))
+            config[name] = int(round(value)) if isinstance(low, int) and isinstance(high, int) else value
+        if config not in sampled:
+            sampled.append(config)
+    return sampled
+
+
+def run_candidate(algorithm_class, parameters: dict, budget: int, instance: tuple[int, int, int, int],
+                  problem_class: ioh.ProblemClass = ioh.ProblemClass.PBO) -> tuple[float, int]:
+    """
+    One run of a candidate on a (fid, iid, dim, seed) tuning instance, without logging (PBO problems
+    are evaluated with the NumPy batch evaluators where they exist, see `batch_problems`).
+
+    Returns:
+        tuple: The best fitness found and the number of evaluations used.
+    """
+    fid, iid, dim, seed = instance
+    algorithm = algorithm_class(budget=budget, **parameters)
+    algorithm.set_seed(seed)
+    if problem_class == ioh.ProblemClass.PBO:
+        problem = batch_problems.get_problem(fid, iid, dim)
+    else:
+        problem = ioh.get_problem(fid, iid, dim, problem_class)
+    algorithm(problem)
+    return problem.state.current_best.y, problem.state.evaluations
+
+
+def rank_runs(best_y: np.ndarray, evaluations: np.ndarray) -> np.ndarray:
+    """
+    Ranks of the candidates (1 = best) per instance (row): by best fitness, then by the evaluations
+    used to stop (fewer is better, e.g. when several candidates find the optimum). Ties share their mean rank.
+    """
+    ranks = np.empty(best_y.shape)
+    for row, (y, evals) in enumerate(zip(best_y, evaluations)):
+        order = np.lexsort((evals, -y))
+        sorted_keys = list(zip(-y[order], evals[order]))
+        position = 0
+        while position < len(order):
+            end = position
+            while end + 1 < len(order) and sorted_keys[end + 1] == sorted_keys[position]:
+                end += 1
+            ranks[row, order[position:end + 1]] = (position + end) / 2 + 1
+            position = end + 1
+    return ranks
+
+
+def friedman_statistic(ranks: np.ndarray) -> float:
+    """ The Friedman statistic of a (instances x candidates) rank matrix. """
+    blocks, k = ranks.shape
+    rank_sums = ranks.sum(axis=0)
+    return 12 / (blocks * k * (k + 1)) * np.sum(rank_sums ** 2) - 3 * blocks * (k + 1)
+
+
+def dominated(ranks: np.ndarray, alpha: float = 0.05, permutations: int = 1000,
+              rng: np.random.Generator | None = None) -> np.ndarray:
+    """
+    Which candidates (columns of a rank matrix) are statistically worse than the best one, using
+    permutation tests (no distributional assumptions): a Friedman test that the candidates differ
+    at all, then a one-sided paired sign-flip test of every candidate against the best.
+
+    Returns:
+        np.ndarray: A boolean mask of the dominated candidates.
+    """
+    rng = rng or np.random.default_rng(0)
+    blocks, k = ranks.shape
+    if k < 2:
+        return np.zeros(k, dtype=bool)
+
+    # Friedman test: ranks permuted within every instance
+    observed = friedman_statistic(ranks)
+    shuffled = rng.permuted(np.broadcast_to(ranks, (permutations, blocks, k)), axis=2)
+    null = 12 / (blocks * k * (k + 1)) * np.sum(shuffled.sum(axis=1) ** 2, axis=1) - 3 * blocks * (k + 1)
+    if (np.count_nonzero(null >= observed - 1e-9) + 1) / (permutations + 1) >= alpha:
+        return np.zeros(k, dtype=bool)
+
+    # paired tests against the best candidate (lowest mean rank) on the rank differences
+    best = int(np.argmin(ranks.mean(axis=0)))
+    differences = ranks - ranks[:, [best]] # > 0 where a candidate is worse than the best
+    signs = rng.choice((-1, 1), size=(permutations, blocks))
+    null = signs @ differences # (permutations, k)
+    p_values = (np.count_nonzero(null >= differences.sum(axis=0) - 1e-9, axis=0) + 1) / (permutations + 1)
+    mask = p_values < alpha
+    mask[best] = False
+    return mask
+
+
+def check_parameters(algorithm_class, space: dict) -> None:
+    """
+    Raises a ValueError if a tuned parameter is not an argument of the algorithm's constructor,
+    before any run is started (instead of a TypeError in every worker process).
+    """
+    import inspect # only needed here, and slow to import
+    parameters = inspect.signature(algorithm_class).parameters
+    if any(p.kind is inspect.Parameter.VAR_KEYWORD for p in parameters.values()):
+        return
+    unknown = sorted(set(space) - set(parameters) | ({"budget"} & set(space)))
+    if unknown:
+        known = ", ".join(name for name in parameters if name != "budget")
+        raise ValueError(f"{algorithm_class.__name__} has no tunable parameter {', '.join(unknown)} (known: {known})")
+
+
+def race(algorithm_class,
+         space: dict[str, list | tuple],
+         budget: int,
+         fids: list[int],
+         dims: list[int],
+         iids: list[int] | tuple[int, ...] = (1,),
+         seeds: int = 10,
+         candidates: int | None = None,
+         method: str = "frace",
+         first_test: int = 5,
+         block: int | None = None,
+         eta: int = 2,
+         alpha: float = 0.05,
+         max_runs: int | None = None,
+         n_jobs: int = 1,
+         seed: int = 0,
+         verbose: bool = True) -> dict:
+    """
+    Tunes the constructor parameters of an `Algorithm` subclass by racing the candidate
+    configurations on the (fid, iid, dim, seed) tuning instances, visited in a random order.
+
+    Args:
+        space: Constructor argument -> list of values or (low, high[, "log"]) range (see `sample_candidates`).
+        budget: Evaluation budget of every run.
+        seeds: Number of random seeds (runs) per (fid, iid, dim).
+        candidates: Number of sampled configurations; None uses the full grid of the listed values.
+        method: "frace" drops the candidates that are statistically dominated (see `dominated`) after
+            every block of instances, starting after `first_test` instances; "halving" keeps the best
+            1/eta of the candidates (by mean rank) after every round and doubles the instances per round.
+        block: Instances per racing step of "frace" (default: enough to keep `n_jobs` processes busy).
+        max_runs: Stop racing after this many runs (default: no limit besides the instances).
+        n_jobs: Number of worker processes for the runs of a step; -1 uses all cpus.
+        seed: Seed of the candidate sampling, the instance order and the run seeds.
+
+    Returns:
+        dict: The best configuration ("best"), the surviving ("alive") and all candidates with their
+        mean rank and number of instances ("ranking", best first), the number of runs spent ("runs")
+        and the number of runs of the full grid over all instances ("grid_runs").
+    """
+    check_parameters(algorithm_class, space)
+    if n_jobs == -1:
+        n_jobs = os.cpu_count() or 1
+    rng = np.random.default_rng(seed)
+    configs = sample_candidates(space, candidates, seed)
+    instances = [(fid, iid, dim, int(s)) for (fid, iid, dim), s in itertools.product(
+        itertools.product(fids, iids, dims), rng.integers(2**31, size=seeds))]
+    instances = [instances[i] for i in rng.permutation(len(instances))]
+
+    k = len(configs)
+    best_y = np.full((len(instances), k), np.nan)
+    evaluations = np.full((len(instances), k), np.nan)
+    alive = np.ones(k, dtype=bool)
+    done, runs = 0, 0
+    step = block or max(1, -(-n_jobs // k)) # enough runs per step to keep the workers busy
+    step = max(step, first_test)
+    if method not in ("frace", "halving"):
+        raise ValueError(f"Unknown racing method: {method}")
+
+    with ProcessPoolExecutor(max_workers=n_jobs) as pool:
+        while done < len(instances) and alive.sum() > 1 and (max_runs is None or runs < max_runs):
+            stop = min(len(instances), done + step)
+            jobs = [(i, c) for i in range(done, stop) for c in np.flatnonzero(alive)]
+            results = pool.map(run_candidate, *zip(*[(algorithm_class, configs[c], budget, instances[i]) for i, c in jobs]))
+            for (i, c), (y, evals) in zip(jobs, results):
+                best_y[i, c], evaluations[i, c] = y, evals
+            runs += len(jobs)
+            done = stop
+
+            # ranks among the candidates still alive, over all instances run so far
+            columns = np.flatnonzero(alive)
+            ranks = rank_runs(best_y[:done, columns], evaluations[:done, columns])
+            if method == "frace":
+                alive[columns[dominated(ranks, alpha, rng=rng)]] = False
+                step = block or max(1, -(-n_jobs // int(alive.sum())))
+            else:
+                keep = max(1, len(columns) // eta)
+                alive[columns[np.argsort(ranks.mean(axis=0), kind="stable")[keep:]]] = False
+                step *= 2
+            if verbose:
+                print(f"{done}/{len(instances)} instances, {runs} runs: {int(alive.sum())} of {k} candidates left")
+
+    # final ranking: the candidates left first (ranked on all their instances), then by elimination order
+    columns = np.flatnonzero(alive)
+    ranks = rank_runs(best_y[:done, columns], evaluations[:done, columns]).mean(axis=0)
+    ranking = [{"parameters": configs[c], "mean_rank": float(r), "instances": done, "alive": True}
+               for r, c in sorted(zip(ranks, columns))]
+    instances_run = np.count_nonzero(~np.isnan(best_y), axis=0)
+    ranking += [{"parameters": configs[c], "mean_rank": None, "instances": int(instances_run[c]), "alive": False}
+                for c in sorted(np.flatnonzero(~alive), key=lambda c: -instances_run[c])]
+    return {
+        "best": ranking[0]["parameters"],
+        "alive": [configs[c] for c in columns],
+        "ranking": ranking,
+        "runs": runs,
+        "grid_runs": k * len(instances),
+    }
+
+
+def main():
+    """
+    Tunes an algorithm from the command line, e.g. from final/code/:
+        python -m utilities.tuner MaxMinAS --budget 10000 --fids 1 2 18 --dims 50 \\
+            --param evaporate_rate=1,0.1,0.01 --param number_of_ants=10,20
+    A range is given as low:high or low:high:log and needs --candidates.
+    """
+    import argparse
+    import ast
+    import json
+    from algorithms import get_algorithm
+
+    def parse_param(text: str) -> tuple[str, list | tuple]:
+        name, values = text.split("=", 1)
+        if ":" in values:
+            return name, tuple(ast.literal_eval(v) if v != "log" else v for v in values.split(":"))
+        return name, [ast.literal_eval(v) for v in values.split(",")]
+
+    parser = argparse.ArgumentParser(description="Tune the parameters of an algorithm by racing.")
+    parser.add_argument("algorithm", help="name of a registered algorithm (see python main/main.py --list), e.g. MaxMinAS")
+    parser.add_argument("--param", type=parse_param, action="append", required=True, help="name=v1,v2,... or name=low:high[:log]")
+    parser.add_argument("--budget", type=int, required=True)
+    parser.add_argument("--fids", type=int, nargs="+", required=True)
+    parser.add_argument("--dims", type=int, nargs="+", required=True)
+    parser.add_argument("--iids", type=int, nargs="+", default=[1])
+    parser.add_argument("--seeds", type=int, default=10, help="runs per (fid, iid, dim)")
+    parser.add_argument("--candidates", type=int, default=None, help="number of sampled configurations")
+    parser.add_argument("--method", choices=("frace", "halving"), default="frace")
+    parser.add_argument("--max-runs", type=int, default=None)
+    parser.add_argument("--jobs", type=int, default=-1)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    try:
+        algorithm_class = get_algorithm(args.algorithm)
+        check_parameters(algorithm_class, dict(args.param))
+    except (KeyError, ValueError) as error:
+        parser.error(str(error).strip("'\""))
+    result = race(algorithm_class, dict(args.param), args.budget, args.fids, args.dims,
+                  args.iids, args.seeds, args.candidates, args.method, max_runs=args.max_runs,
+                  n_jobs=args.jobs, seed=args.seed)
+    print(json.dumps(result["ranking"][:10], indent=4))
+    print(f"Best: {result['best']} ({result['runs']} runs, {result['runs'] / result['grid_runs']:.0%} of the full grid)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,4 @@
+import subprocess
 from pathlib import Path
 
 
@@ -14,3 +15,15 @@ def ensure_dir(path: str | Path) -> Path:
     p = Path(path)
     p.mkdir(parents=True, exist_ok=True)
     return p
+
+
+def git_commit() -> str:
+    """
+    Returns the short hash of the checked out commit of this repository, e.g. to name and tag
+    benchmark results ("unknown" outside of a git checkout).
+    """
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              cwd=Path(__file__).parent, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"